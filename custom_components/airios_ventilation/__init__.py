@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import typing
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
@@ -11,37 +12,28 @@ from homeassistant.const import (
     CONF_DEVICE,
     CONF_HOST,
     CONF_PORT,
-    CONF_SCAN_INTERVAL,
     CONF_TYPE,
     Platform,
 )
+from homeassistant.core import callback
 from homeassistant.exceptions import ConfigEntryError, ConfigEntryNotReady
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import device_registry as dr
-from pyairios import Airios
-from pyairios.client import (
-    AiriosBaseTransport,
-    AiriosRtuTransport,
-    AiriosTcpTransport,
-)
-from pyairios.properties import AiriosDeviceProperty
-
-from .const import (
-    CONF_FETCH_RESULT_STATUS,
-    DEFAULT_FETCH_RESULT_STATUS,
-    DEFAULT_NAME,
-    DEFAULT_SCAN_INTERVAL,
-    DOMAIN,
-    BridgeType,
-)
-from .coordinator import AiriosDataUpdateCoordinator
+from homeassistant.util.hass_dict import HassKey
+
+from .connection import AiriosConnectionSupervisor
+from .const import DOMAIN, BridgeType
+from .coordinator import AiriosCoordinatorOptions, AiriosDataUpdateCoordinator
+from .pool import async_get_transport_pool
+from .scheduler import AiriosPollBudget
 from .services import async_setup_services
+from .store import AiriosSnapshotStore
 
 if typing.TYPE_CHECKING:
-    from homeassistant.core import HomeAssistant
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
     from homeassistant.helpers.typing import ConfigType
-    from pyairios.constants import ProductId
-    from pyairios.data_model import AiriosDeviceData
+
+    from .pool import AiriosPooledTransport
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -60,6 +52,9 @@ CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 type AiriosConfigEntry = ConfigEntry[AiriosDataUpdateCoordinator]
 
+# The poll budget shared by the coordinators of all the RF bridges
+DATA_POLL_BUDGET: HassKey[AiriosPollBudget] = HassKey(f"{DOMAIN}_poll_budget")
+
 
 async def async_setup(
     hass: HomeAssistant,
@@ -70,100 +65,177 @@ async def async_setup(
     return True
 
 
-def _get_transport(entry: AiriosConfigEntry) -> AiriosBaseTransport:
-    transport: AiriosBaseTransport | None = None
+def _acquire_transport(
+    hass: HomeAssistant, entry: AiriosConfigEntry
+) -> AiriosPooledTransport:
+    pool = async_get_transport_pool(hass)
     bridge_type = entry.data[CONF_TYPE]
     if bridge_type == BridgeType.SERIAL:
-        device = entry.data[CONF_DEVICE]
-        transport = AiriosRtuTransport(device)
-    elif bridge_type == BridgeType.NETWORK:
-        host = entry.data[CONF_HOST]
-        port = entry.data[CONF_PORT]
-        transport = AiriosTcpTransport(host, port)
-    else:
-        msg = f"Unexpected bridge type {bridge_type}"
-        raise ConfigEntryError(msg)
-    return transport
+        return pool.async_acquire_serial(entry.data[CONF_DEVICE])
+    if bridge_type == BridgeType.NETWORK:
+        return pool.async_acquire_network(entry.data[CONF_HOST], entry.data[CONF_PORT])
+    msg = f"Unexpected bridge type {bridge_type}"
+    raise ConfigEntryError(msg)
 
 
-def _get_bridge_data(data: AiriosDeviceData) -> tuple[int, ProductId, str, int]:
-    if AiriosDeviceProperty.RF_ADDRESS not in data:
-        msg = "Failed to get bridge RF address"
-        raise ConfigEntryNotReady(msg)
-    bridge_rf_address = data[AiriosDeviceProperty.RF_ADDRESS].value
+@callback
+def _async_register_poll_budget(
+    hass: HomeAssistant, coordinator: AiriosDataUpdateCoordinator
+) -> CALLBACK_TYPE:
+    """Share the poll budget with the other bridges, return a callback to leave."""
+    if DATA_POLL_BUDGET not in hass.data:
+        hass.data[DATA_POLL_BUDGET] = AiriosPollBudget()
+    budget = coordinator.poll_budget = hass.data[DATA_POLL_BUDGET]
+    unregister = budget.async_register(coordinator)
 
-    if AiriosDeviceProperty.PRODUCT_ID not in data:
-        msg = "Failed to get bridge product ID"
-        raise ConfigEntryNotReady(msg)
-    product_id = data[AiriosDeviceProperty.PRODUCT_ID].value
-
-    if AiriosDeviceProperty.PRODUCT_NAME not in data:
-        msg = "Failed to get bridge product name"
-        raise ConfigEntryNotReady(msg)
-    product_name = data[AiriosDeviceProperty.PRODUCT_NAME].value
+    @callback
+    def _unregister() -> None:
+        unregister()
+        # The next bridge set up starts with a new budget
+        if not budget.bridges and hass.data.get(DATA_POLL_BUDGET) is budget:
+            del hass.data[DATA_POLL_BUDGET]
 
-    if AiriosDeviceProperty.SOFTWARE_VERSION not in data:
-        msg = "Failed to get bridge software version"
-        raise ConfigEntryNotReady(msg)
-    sw_version = data[AiriosDeviceProperty.SOFTWARE_VERSION].value
-
-    return (bridge_rf_address, product_id, product_name, sw_version)
+    return _unregister
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: AiriosConfigEntry) -> bool:
     """Set up Airios from a config entry."""
-    transport = _get_transport(entry)
-    modbus_address = entry.data[CONF_ADDRESS]
-    api = Airios(transport, modbus_address)
-
+    # The transport is shared with the flows talking to the same bridge
+    pooled = _acquire_transport(hass, entry)
     coordinator = AiriosDataUpdateCoordinator(
         hass,
-        api,
-        update_interval=entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
-        fetch_result_status=entry.options.get(
-            CONF_FETCH_RESULT_STATUS, DEFAULT_FETCH_RESULT_STATUS
-        ),
+        pooled.api(entry.data[CONF_ADDRESS]),
+        AiriosCoordinatorOptions.from_entry_options(entry.options),
     )
-    await coordinator.async_config_entry_first_refresh()
-
-    (rf_address, product_id, product_name, sw_version) = _get_bridge_data(
-        coordinator.data.nodes[coordinator.data.bridge_key]
+    coordinator.async_use_transport(pooled)
+    # The connection supervisor may have replaced the transport by then
+    entry.async_on_unload(
+        lambda: async_get_transport_pool(hass).async_release(coordinator.transport)
     )
+    entry.async_on_unload(_async_register_poll_budget(hass, coordinator))
+
+    # Set up from the last snapshot if there is one, and read the bus in the
+    # background. Otherwise wait for the first read.
+    coordinator.snapshot_store = AiriosSnapshotStore(hass, entry.entry_id)
+    if (snapshot := await coordinator.snapshot_store.async_load()) is not None:
+        _LOGGER.debug("Setting up from the stored snapshot")
+        coordinator.async_set_restored_data(snapshot)
+    else:
+        await coordinator.async_config_entry_first_refresh()
+
+    if (bridge := coordinator.identities.bridge) is None:
+        msg = "Failed to get bridge identity"
+        raise ConfigEntryNotReady(msg)
 
-    if entry.unique_id != str(rf_address):
-        message = f"Unexpected device {rf_address} found, expected {entry.unique_id}"
+    if entry.unique_id != str(bridge.rf_address):
+        message = (
+            f"Unexpected device {bridge.rf_address} found, expected {entry.unique_id}"
+        )
         _LOGGER.error(message)
         raise ConfigEntryNotReady(message)
 
     entry.async_on_unload(entry.add_update_listener(update_listener))
     entry.runtime_data = coordinator
+    coordinator.setup_key = _setup_key(entry)
+
+    if entry.data[CONF_TYPE] == BridgeType.NETWORK:
+        coordinator.connection = AiriosConnectionSupervisor(hass, coordinator)
+        entry.async_on_unload(coordinator.connection.async_start())
 
     # Always register a device for the bridge. It is necessary to set the
     # via_device attribute for the bound nodes.
     device_registry = dr.async_get(hass)
     device_registry.async_get_or_create(
-        config_entry_id=entry.entry_id,
-        identifiers={(DOMAIN, str(rf_address))},
-        manufacturer=DEFAULT_NAME,
-        name=product_name,
-        model=product_name,
-        model_id=f"0x{product_id:08X}",
-        sw_version=f"0x{sw_version:04X}",
+        config_entry_id=entry.entry_id, **bridge.device_info
     )
 
+    coordinator.setup_nodes = set(coordinator.data.nodes)
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     # sets up Airios fans, sensors etc.
+
+    if coordinator.stale:
+        entry.async_on_unload(_async_check_reconciled_bridge(hass, entry))
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), "Airios snapshot reconcile"
+        )
     return True
 
 
+@callback
+def _async_check_reconciled_bridge(
+    hass: HomeAssistant, entry: AiriosConfigEntry
+) -> CALLBACK_TYPE:
+    """
+    Check the bridge again once the restored snapshot is replaced.
+
+    The entry was set up with the bridge of the snapshot. If a full read finds
+    another bridge, the snapshot is removed and the entry reloaded, so the
+    setup checks the bridge read from the bus.
+    """
+    coordinator = entry.runtime_data
+    remove_listener: CALLBACK_TYPE | None = None
+
+    @callback
+    def _async_remove_listener() -> None:
+        nonlocal remove_listener
+        if remove_listener is not None:
+            remove_listener()
+            remove_listener = None
+
+    async def _async_reload_without_snapshot() -> None:
+        if coordinator.snapshot_store is not None:
+            await coordinator.snapshot_store.async_remove()
+        hass.config_entries.async_schedule_reload(entry.entry_id)
+
+    @callback
+    def _async_check() -> None:
+        if coordinator.stale:
+            return
+        _async_remove_listener()
+        bridge = coordinator.identities.bridge
+        if bridge is not None and entry.unique_id == str(bridge.rf_address):
+            return
+        _LOGGER.error(
+            "Unexpected device %s found, expected %s, reloading",
+            None if bridge is None else bridge.rf_address,
+            entry.unique_id,
+        )
+        entry.async_create_task(hass, _async_reload_without_snapshot())
+
+    remove_listener = coordinator.async_add_listener(_async_check)
+    return _async_remove_listener
+
+
+def _setup_key(entry: AiriosConfigEntry) -> tuple[Any, ...]:
+    """Return the config entry values that require a reload when changed."""
+    return (
+        dict(entry.data),
+        {
+            subentry_id: dict(subentry.data)
+            for subentry_id, subentry in entry.subentries.items()
+        },
+    )
+
+
 async def update_listener(hass: HomeAssistant, entry: AiriosConfigEntry) -> None:
-    """Handle options update."""
-    await hass.config_entries.async_reload(entry.entry_id)
+    """Handle config entry update, options are applied without a reload."""
+    coordinator = entry.runtime_data
+    coordinator.subentries.async_invalidate()
+    if _setup_key(entry) != coordinator.setup_key:
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+    coordinator.async_apply_options(
+        AiriosCoordinatorOptions.from_entry_options(entry.options)
+    )
+    await coordinator.async_request_refresh()
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: AiriosConfigEntry) -> bool:
     """Unload a config entry."""
-    if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        coordinator: AiriosDataUpdateCoordinator = entry.runtime_data
-        coordinator.api.close()
-    return unload_ok
+    # The transport is released by the unload callbacks
+    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: AiriosConfigEntry) -> None:
+    """Remove the stored snapshot of a removed config entry."""
+    await AiriosSnapshotStore(hass, entry.entry_id).async_remove()
@@ -15,6 +15,7 @@ from homeassistant.components.binary_sensor import (
 from homeassistant.core import HomeAssistant, callback
 from pyairios.properties import AiriosDeviceProperty, AiriosVMDProperty
 
+from .const import PollTier
 from .entity import (
     AiriosEntity,
     AiriosEntityDescription,
@@ -96,6 +97,7 @@ BINARY_SENSOR_ENTITIES: tuple[AiriosBinarySensorEntityDescription, ...] = (
         ap=AiriosDeviceProperty.BATTERY_STATUS,
         key=AiriosDeviceProperty.BATTERY_STATUS.name.casefold(),
         translation_key="battery_status",
+        poll_tier=PollTier.SLOW,
         device_class=BinarySensorDeviceClass.PROBLEM,
         value_fn=_battery_status_value_fn,
     ),
@@ -104,6 +106,7 @@ BINARY_SENSOR_ENTITIES: tuple[AiriosBinarySensorEntityDescription, ...] = (
         ap=AiriosVMDProperty.BASIC_VENTILATION_ENABLE,
         key=AiriosVMDProperty.BASIC_VENTILATION_ENABLE.name.casefold(),
         translation_key="basic_vent_enable",
+        poll_tier=PollTier.SLOW,
         device_class=BinarySensorDeviceClass.RUNNING,
     ),
 )
@@ -143,14 +146,14 @@ class AiriosBinarySensorEntity(  # pyright: ignore[reportIncompatibleVariableOve
         except (TypeError, ValueError) as ex:
             _LOGGER.info(
                 "Failed to update binary sensor entity for node=%s, property=%s: %s",
-                f"0x{self.rf_address:06X}",
+                self.node_id,
                 self.entity_description.key,
                 ex,
             )
             self._attr_is_on = None
             self._attr_available = False
         finally:
-            self.async_write_ha_state()
+            self.async_write_ha_state_if_changed(self._attr_is_on)
 
 
 async def async_setup_entry(
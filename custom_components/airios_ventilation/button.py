@@ -15,6 +15,7 @@ from homeassistant.exceptions import HomeAssistantError
 from pyairios.exceptions import AiriosException
 from pyairios.properties import AiriosVMDProperty
 
+from .const import PollTier
 from .entity import (
     AiriosEntity,
     AiriosEntityDescription,
@@ -52,6 +53,8 @@ VMD_BUTTON_ENTITIES: tuple[AiriosButtonEntityDescription, ...] = (
         ap=AiriosVMDProperty.FILTER_RESET,
         key=AiriosVMDProperty.FILTER_RESET.name.casefold(),
         translation_key="filter_reset",
+        # Write only, the value is never polled
+        poll_tier=PollTier.STATIC,
         device_class=ButtonDeviceClass.RESTART,
         press_fn=_filter_reset,
     ),
@@ -100,7 +103,12 @@ class AiriosButtonEntity(  # pyright: ignore[reportIncompatibleVariableOverride]
         """Handle button press."""
         _LOGGER.debug("Button %s pressed", self.entity_description.key)
         try:
-            dev = await self.api().node(self.modbus_address)
-            await self.entity_description.press_fn(dev)
+            async with self.bus_slot():
+                dev = await self.coordinator.async_get_device(self.modbus_address)
+                update_needed = await self.entity_description.press_fn(dev)
         except AiriosException as ex:
             raise HomeAssistantError from ex
+        if update_needed:
+            await self.coordinator.async_refresh_node(
+                self.modbus_address, self.entity_description.ap
+            )
@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import typing
+from functools import partial
 from typing import Any, Self
 
 import serial
@@ -33,30 +34,46 @@ from homeassistant.const import (
 from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import device_registry as dr
-from pyairios import Airios
-from pyairios.client import AiriosRtuTransport, AiriosTcpTransport
 from pyairios.constants import AiriosDeviceType, BindingStatus, ProductId
 from pyairios.exceptions import AiriosBindingException, AiriosException
 from pyairios.models.factory import factory
 
 from .const import (
+    BIND_ACCESSORY_TIMEOUT,
+    BIND_CONTROLLER_TIMEOUT,
+    BIND_POLL_BACKOFF,
+    BIND_POLL_MAX,
+    BIND_POLL_MIN,
+    CONF_ADAPTIVE_SCAN_INTERVAL,
+    CONF_AGE_AWARE_POLLING,
     CONF_BRIDGE_RF_ADDRESS,
     CONF_DEFAULT_HOST,
     CONF_DEFAULT_NETWORK_MODBUS_ADDRESS,
     CONF_DEFAULT_PORT,
     CONF_DEFAULT_SERIAL_MODBUS_ADDRESS,
     CONF_FETCH_RESULT_STATUS,
+    CONF_MAX_VALUE_AGE,
     CONF_RF_ADDRESS,
+    DEFAULT_ADAPTIVE_SCAN_INTERVAL,
+    DEFAULT_AGE_AWARE_POLLING,
     DEFAULT_FETCH_RESULT_STATUS,
+    DEFAULT_MAX_VALUE_AGE,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
+    MAX_MAX_VALUE_AGE,
+    MAX_SCAN_INTERVAL,
+    MIN_SCAN_INTERVAL,
     BridgeType,
 )
+from .pool import async_get_transport_pool
+from .scheduler import BusPriority
 
 if typing.TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Coroutine
     from types import MappingProxyType
 
     from .coordinator import AiriosDataUpdateCoordinator
+    from .pool import AiriosPooledTransport
 
 CONF_MANUAL_PATH = "Enter Manually"
 
@@ -80,6 +97,74 @@ async def _supported_models(
     }
 
 
+async def _async_wait_bind_status(
+    coordinator: AiriosDataUpdateCoordinator, pending: BindingStatus
+) -> BindingStatus:
+    """
+    Wait for the bind status to leave the pending status.
+
+    The status is read soon after the bind command, then less and less often,
+    within the bus slots of the coordinator.
+    """
+    status = pending
+    delay = BIND_POLL_MIN
+    while status == pending:
+        await asyncio.sleep(delay)
+        delay = min(BIND_POLL_MAX, delay * BIND_POLL_BACKOFF)
+        async with coordinator.scheduler.slot(BusPriority.BIND):
+            result = await coordinator.api.bind_status()
+        if not result or not result.value:
+            msg = "Failed to get binding status"
+            raise AiriosBindingException(msg)
+        status = result.value
+        _LOGGER.debug("Binding status: %s", str(status))
+    return status
+
+
+async def _async_bind(
+    coordinator: AiriosDataUpdateCoordinator,
+    modbus_address: int,
+    send: Callable[[], Awaitable[bool]],
+    pending: BindingStatus,
+    completed: BindingStatus,
+) -> BindingStatus:
+    """
+    Send a bind command and wait for the bind to leave the pending status.
+
+    The device pending at the Modbus address is unbound unless the bind
+    completes, also when the bind times out or the flow is aborted.
+    """
+    status = pending
+    try:
+        async with coordinator.scheduler.slot(BusPriority.BIND):
+            sent = await send()
+        if not sent:
+            msg = "Failed to send bind command"
+            raise AiriosBindingException(msg)
+        status = await _async_wait_bind_status(coordinator, pending)
+    finally:
+        if status != completed:
+            # Shielded, so it is sent when the bind is cancelled too
+            await asyncio.shield(_async_unbind(coordinator, modbus_address))
+    return status
+
+
+async def _async_run_bind(
+    coordinator: AiriosDataUpdateCoordinator, bind: Coroutine[Any, Any, None]
+) -> None:
+    """Run a bind with the polling of the coordinator paused."""
+    with coordinator.pause_polling():
+        await bind
+
+
+async def _async_unbind(
+    coordinator: AiriosDataUpdateCoordinator, modbus_address: int
+) -> None:
+    """Unbind to remove the virtual Modbus device from the bridge."""
+    async with coordinator.scheduler.slot(BusPriority.BIND):
+        await coordinator.api.unbind(modbus_address)
+
+
 class AiriosConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Airios."""
 
@@ -258,12 +343,16 @@ class AiriosConfigFlow(ConfigFlow, domain=DOMAIN):
             errors=errors,
         )
 
-    async def _async_validate_bridge(self, api: Airios) -> int:
-        result = await api.bridge.device_product_id()
-        if result.value != ProductId.BRDG_02R13:
-            raise UnexpectedProductIdError
-
-        result_rf_addr = await api.bridge.device_rf_address()
+    async def _async_validate_bridge(
+        self, pooled: AiriosPooledTransport, modbus_address: int
+    ) -> int:
+        api = pooled.api(modbus_address)
+        # The transport may be in use by the config entry of the bridge
+        async with pooled.scheduler.slot(BusPriority.SERVICE):
+            result = await api.bridge.device_product_id()
+            if result.value != ProductId.BRDG_02R13:
+                raise UnexpectedProductIdError
+            result_rf_addr = await api.bridge.device_rf_address()
         if result_rf_addr is None or result_rf_addr.value is None:
             raise UnexpectedProductIdError
         bridge_rf_address = result_rf_addr.value
@@ -281,9 +370,11 @@ class AiriosConfigFlow(ConfigFlow, domain=DOMAIN):
         device: str,
         modbus_address: int,
     ) -> dict[str, Any]:
-        transport = AiriosRtuTransport(device=device)
-        api = Airios(transport, modbus_address)
-        bridge_rf_address = await self._async_validate_bridge(api)
+        pool = async_get_transport_pool(self.hass)
+        with pool.borrow(pool.async_acquire_serial(device)) as pooled:
+            bridge_rf_address = await self._async_validate_bridge(
+                pooled, modbus_address
+            )
         data: dict[str, Any] = {
             CONF_TYPE: BridgeType.SERIAL,
             CONF_DEVICE: device,
@@ -298,9 +389,11 @@ class AiriosConfigFlow(ConfigFlow, domain=DOMAIN):
         port: int,
         modbus_address: int,
     ) -> dict[str, Any]:
-        transport = AiriosTcpTransport(host=host, port=port)
-        api = Airios(transport, modbus_address)
-        bridge_rf_address = await self._async_validate_bridge(api)
+        pool = async_get_transport_pool(self.hass)
+        with pool.borrow(pool.async_acquire_network(host, port)) as pooled:
+            bridge_rf_address = await self._async_validate_bridge(
+                pooled, modbus_address
+            )
         data: dict[str, Any] = {
             CONF_TYPE: BridgeType.NETWORK,
             CONF_HOST: host,
@@ -353,14 +446,30 @@ class OptionsFlowHandler(OptionsFlow):
         fetch_result = self.config_entry.options.get(
             CONF_FETCH_RESULT_STATUS, DEFAULT_FETCH_RESULT_STATUS
         )
+        adaptive_scan_interval = self.config_entry.options.get(
+            CONF_ADAPTIVE_SCAN_INTERVAL, DEFAULT_ADAPTIVE_SCAN_INTERVAL
+        )
+        age_aware_polling = self.config_entry.options.get(
+            CONF_AGE_AWARE_POLLING, DEFAULT_AGE_AWARE_POLLING
+        )
+        max_value_age = self.config_entry.options.get(
+            CONF_MAX_VALUE_AGE, DEFAULT_MAX_VALUE_AGE
+        )
 
-        # Ethernet bridge closes connection when no communication for 3 mins
         opts_schema = vol.Schema(
             {
                 vol.Required(CONF_SCAN_INTERVAL, default=scan_interval): vol.All(
-                    vol.Coerce(int), vol.Range(min=15, max=150)
+                    vol.Coerce(int),
+                    vol.Range(min=MIN_SCAN_INTERVAL, max=MAX_SCAN_INTERVAL),
                 ),
+                vol.Required(
+                    CONF_ADAPTIVE_SCAN_INTERVAL, default=adaptive_scan_interval
+                ): bool,
                 vol.Required(CONF_FETCH_RESULT_STATUS, default=fetch_result): bool,
+                vol.Required(CONF_AGE_AWARE_POLLING, default=age_aware_polling): bool,
+                vol.Required(CONF_MAX_VALUE_AGE, default=max_value_age): vol.All(
+                    vol.Coerce(int), vol.Range(min=0, max=MAX_MAX_VALUE_AGE)
+                ),
             }
         )
         return self.async_show_form(step_id="init", data_schema=opts_schema)
@@ -422,7 +531,8 @@ class ControllerSubentryFlowHandler(ConfigSubentryFlow):
         api = coordinator.api
 
         _LOGGER.debug("Searching first unassigned Modbus address")
-        nodes = await api.nodes()
+        async with coordinator.scheduler.slot(BusPriority.BIND):
+            nodes = await api.nodes()
         addrs = list(range(2, 200))
         for n in nodes:
             addrs.remove(n.modbus_address)
@@ -431,32 +541,36 @@ class ControllerSubentryFlowHandler(ConfigSubentryFlow):
         _LOGGER.info(
             "Initiating controller binding (Modbus address: %s)", modbus_address
         )
-        if not await api.bind_controller(
-            modbus_address, self._bind_product_id, self._bind_product_serial
-        ):
-            msg = "Failed to send bind command"
-            raise AiriosBindingException(msg)
-        status = BindingStatus.NOT_AVAILABLE
-        # Bridge timeout is 20 seconds
-        for _ in range(1, 100):
-            await asyncio.sleep(0.250)
-            result = await api.bind_status()
-            if result and result.value:
-                status = result.value
-            else:
-                msg = "Failed to get binding status"
-                raise AiriosBindingException(msg)
-            _LOGGER.debug("Binding status: %s", str(status))
-            if status != BindingStatus.OUTGOING_BINDING_INITIALIZED:
-                break
+        status = BindingStatus.OUTGOING_BINDING_INITIALIZED
+        try:
+            async with asyncio.timeout(BIND_CONTROLLER_TIMEOUT):
+                status = await _async_bind(
+                    coordinator,
+                    modbus_address,
+                    partial(
+                        api.bind_controller,
+                        modbus_address,
+                        self._bind_product_id,
+                        self._bind_product_serial,
+                    ),
+                    BindingStatus.OUTGOING_BINDING_INITIALIZED,
+                    BindingStatus.OUTGOING_BINDING_COMPLETED,
+                )
+        except TimeoutError:
+            _LOGGER.warning(
+                "Bind still pending after %s seconds", BIND_CONTROLLER_TIMEOUT
+            )
+        self._bind_result = status
         if status != BindingStatus.OUTGOING_BINDING_COMPLETED:
-            # Unbind to remove the virtual Modbus device from the bridge
-            await api.unbind(modbus_address)
-            self._bind_result = status
             msg = f"Bind failed: {status}"
             raise AiriosBindingException(msg)
         self._modbus_address = modbus_address
-        self._bind_result = status
+
+    @callback
+    def async_remove(self) -> None:
+        """Cancel the bind when the flow is aborted."""
+        if self._bind_task is not None and not self._bind_task.done():
+            self._bind_task.cancel()
 
     async def async_step_do_bind_controller(
         self,
@@ -464,8 +578,9 @@ class ControllerSubentryFlowHandler(ConfigSubentryFlow):
     ) -> SubentryFlowResult:
         """Perform the controller binding while showing a progress form."""
         if self._bind_task is None:
+            coordinator: AiriosDataUpdateCoordinator = self._get_entry().runtime_data
             self._bind_task = self.hass.async_create_task(
-                self._do_bind(), eager_start=False
+                _async_run_bind(coordinator, self._do_bind()), eager_start=False
             )
 
         if not self._bind_task.done():
@@ -514,8 +629,9 @@ class ControllerSubentryFlowHandler(ConfigSubentryFlow):
         config_entry = self._get_entry()
         coordinator: AiriosDataUpdateCoordinator = config_entry.runtime_data
         api = coordinator.api
-        node = await api.node(self._modbus_address)
-        result = await node.device_rf_address()
+        async with coordinator.scheduler.slot(BusPriority.BIND):
+            node = await api.node(self._modbus_address)
+            result = await node.device_rf_address()
         if result is None or result.value is None:
             msg = "Unexpected error reading node RF address"
             raise AiriosBindingException(msg)
@@ -574,9 +690,11 @@ class AccessorySubentryFlowHandler(ConfigSubentryFlow):
         # when configuring the integration and devices are already bound to the RF
         # bridge.
         coordinator: AiriosDataUpdateCoordinator = config_entry.runtime_data
+        async with coordinator.scheduler.slot(BusPriority.BIND):
+            nodes = await coordinator.api.nodes()
         api_bound_nodes = {
             dev.modbus_address: ", ".join(dev.description)
-            for dev in await coordinator.api.nodes()
+            for dev in nodes
             if dev.type == AiriosDeviceType.CONTROLLER
             and dev.modbus_address not in bound_controllers
         }
@@ -622,7 +740,8 @@ class AccessorySubentryFlowHandler(ConfigSubentryFlow):
         api = coordinator.api
 
         _LOGGER.debug("Searching first unassigned Modbus address")
-        nodes = await api.nodes()
+        async with coordinator.scheduler.slot(BusPriority.BIND):
+            nodes = await api.nodes()
         addrs = list(range(2, 200))
         for n in nodes:
             addrs.remove(n.modbus_address)
@@ -631,34 +750,36 @@ class AccessorySubentryFlowHandler(ConfigSubentryFlow):
         _LOGGER.info(
             "Initiating accessory binding (Modbus address: %s)", modbus_address
         )
-        if not await api.bind_accessory(
-            self._bind_controller_modbus_address,
-            modbus_address,
-            self._bind_product_id,
-        ):
-            msg = "Failed to send bind command"
-            raise AiriosBindingException(msg)
-        status = BindingStatus.NOT_AVAILABLE
-        # Bridge timeout is 120 seconds
-        for _ in range(1, 500):
-            await asyncio.sleep(0.250)
-            result = await api.bind_status()
-            if result and result.value:
-                status = result.value
-            else:
-                msg = "Failed to get binding status"
-                raise AiriosBindingException(msg)
-            _LOGGER.debug("Binding status: %s", str(status))
-            if status != BindingStatus.INCOMING_BINDING_ACTIVE:
-                break
+        status = BindingStatus.INCOMING_BINDING_ACTIVE
+        try:
+            async with asyncio.timeout(BIND_ACCESSORY_TIMEOUT):
+                status = await _async_bind(
+                    coordinator,
+                    modbus_address,
+                    partial(
+                        api.bind_accessory,
+                        self._bind_controller_modbus_address,
+                        modbus_address,
+                        self._bind_product_id,
+                    ),
+                    BindingStatus.INCOMING_BINDING_ACTIVE,
+                    BindingStatus.INCOMING_BINDING_COMPLETED,
+                )
+        except TimeoutError:
+            _LOGGER.warning(
+                "Bind still pending after %s seconds", BIND_ACCESSORY_TIMEOUT
+            )
+        self._bind_result = status
         if status != BindingStatus.INCOMING_BINDING_COMPLETED:
-            # Unbind to remove the virtual Modbus device from the bridge
-            await api.unbind(modbus_address)
-            self._bind_result = status
             msg = f"Bind failed: {status}"
             raise AiriosBindingException(msg)
         self._modbus_address = modbus_address
-        self._bind_result = status
+
+    @callback
+    def async_remove(self) -> None:
+        """Cancel the bind when the flow is aborted."""
+        if self._bind_task is not None and not self._bind_task.done():
+            self._bind_task.cancel()
 
     async def async_step_do_bind_accessory(
         self,
@@ -666,8 +787,9 @@ class AccessorySubentryFlowHandler(ConfigSubentryFlow):
     ) -> SubentryFlowResult:
         """Perform the accessory binding while showing a progress form."""
         if self._bind_task is None:
+            coordinator: AiriosDataUpdateCoordinator = self._get_entry().runtime_data
             self._bind_task = self.hass.async_create_task(
-                self._do_bind(), eager_start=False
+                _async_run_bind(coordinator, self._do_bind()), eager_start=False
             )
 
         if not self._bind_task.done():
@@ -715,8 +837,9 @@ class AccessorySubentryFlowHandler(ConfigSubentryFlow):
         config_entry = self._get_entry()
         coordinator: AiriosDataUpdateCoordinator = config_entry.runtime_data
         api = coordinator.api
-        node = await api.node(self._modbus_address)
-        result = await node.device_rf_address()
+        async with coordinator.scheduler.slot(BusPriority.BIND):
+            node = await api.node(self._modbus_address)
+            result = await node.device_rf_address()
         if result is None or result.value is None:
             msg = "Unexpected error reading node RF address"
             raise AiriosBindingException(msg)
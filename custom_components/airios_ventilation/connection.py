@@ -0,0 +1,148 @@
+"""Connection supervisor for the Airios integration."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+import typing
+from datetime import datetime, timedelta
+from enum import StrEnum
+
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_track_time_interval
+from pyairios.exceptions import AiriosException
+
+from .const import (
+    KEEPALIVE_BACKOFF_MAX,
+    KEEPALIVE_BACKOFF_MIN,
+    KEEPALIVE_CHECK_INTERVAL,
+    KEEPALIVE_IDLE_TIME,
+)
+from .pool import async_get_transport_pool
+from .scheduler import BusPriority
+
+if typing.TYPE_CHECKING:
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+
+    from .coordinator import AiriosDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ConnectionState(StrEnum):
+    """State of the connection to the RF bridge."""
+
+    CONNECTED = "connected"
+    RECONNECTING = "reconnecting"
+    DISCONNECTED = "disconnected"
+
+
+class AiriosConnectionSupervisor:
+    """
+    Keep the Modbus TCP connection to the Ethernet RF bridge alive.
+
+    The bridge closes the connection after 3 minutes without traffic. When
+    the bus has been idle for KEEPALIVE_IDLE_TIME seconds a cheap register
+    read is sent. If it fails, the transport is closed and the probe retried
+    in the background with a jittered exponential backoff until it succeeds.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, coordinator: AiriosDataUpdateCoordinator
+    ) -> None:
+        """Initialize the connection supervisor."""
+        self.hass = hass
+        self.coordinator = coordinator
+        self.state = ConnectionState.CONNECTED
+        self.reconnects = 0
+        self._reconnect_task: asyncio.Task | None = None
+        self._listeners: list[CALLBACK_TYPE] = []
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Start supervising the connection, return a callback to stop it."""
+        remove_tracker = async_track_time_interval(
+            self.hass,
+            self._async_check,
+            timedelta(seconds=KEEPALIVE_CHECK_INTERVAL),
+            name="Airios connection keepalive",
+        )
+
+        @callback
+        def _stop() -> None:
+            remove_tracker()
+            if self._reconnect_task is not None:
+                self._reconnect_task.cancel()
+                self._reconnect_task = None
+
+        return _stop
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Listen for connection state changes."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def _remove() -> None:
+            self._listeners.remove(update_callback)
+
+        return _remove
+
+    @callback
+    def _async_set_state(self, state: ConnectionState) -> None:
+        if state == self.state:
+            return
+        _LOGGER.info("RF bridge connection %s", state)
+        self.state = state
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    async def _async_probe(self) -> bool:
+        try:
+            async with self.coordinator.scheduler.slot(BusPriority.POLL):
+                await self.coordinator.api.bridge.device_rf_address()
+        except AiriosException as err:
+            _LOGGER.debug("Keepalive probe failed: %s", err)
+            return False
+        self.coordinator.last_bus_activity = time.monotonic()
+        return True
+
+    async def _async_check(self, _now: datetime) -> None:
+        """Send a keepalive probe if the bus has been idle for too long."""
+        if self._reconnect_task is not None:
+            return
+        idle = time.monotonic() - self.coordinator.last_bus_activity
+        if idle < KEEPALIVE_IDLE_TIME:
+            return
+        if await self._async_probe():
+            self._async_set_state(ConnectionState.CONNECTED)
+            return
+        self._async_set_state(ConnectionState.DISCONNECTED)
+        self._reconnect_task = self.hass.async_create_background_task(
+            self._async_reconnect(), "Airios bridge reconnect"
+        )
+
+    async def _async_reconnect(self) -> None:
+        """Reconnect with jittered exponential backoff."""
+        try:
+            attempt = 0
+            while True:
+                self._async_set_state(ConnectionState.RECONNECTING)
+                # A new transport connects on the next request, unless the
+                # flows still hold the shared one
+                async with self.coordinator.scheduler.slot(BusPriority.POLL):
+                    if (pooled := self.coordinator.transport) is not None:
+                        self.coordinator.async_use_transport(
+                            async_get_transport_pool(self.hass).async_reacquire(pooled)
+                        )
+                delay = min(KEEPALIVE_BACKOFF_MAX, KEEPALIVE_BACKOFF_MIN * 2**attempt)
+                await asyncio.sleep(random.uniform(delay / 2, delay))  # noqa: S311
+                if await self._async_probe():
+                    break
+                attempt += 1
+            self.reconnects += 1
+            self._async_set_state(ConnectionState.CONNECTED)
+        finally:
+            self._reconnect_task = None
@@ -10,12 +10,89 @@ class BridgeType(IntEnum):
     NETWORK = auto()
 
 
+class PollTier(IntEnum):
+    """Poll cadence of a device property."""
+
+    # Read on every coordinator update
+    FAST = auto()
+    # Read every DEFAULT_SLOW_POLL_TICKS coordinator updates
+    SLOW = auto()
+    # Read once, when the integration is set up
+    STATIC = auto()
+
+
 DOMAIN = "airios_ventilation"
 DEFAULT_NAME = "Airios"
 DEFAULT_SCAN_INTERVAL = 30
 DEFAULT_FETCH_RESULT_STATUS = False
+DEFAULT_SLOW_POLL_TICKS = 10
+DEFAULT_ADAPTIVE_SCAN_INTERVAL = False
+DEFAULT_AGE_AWARE_POLLING = False
+# Seconds, 0 to never mark values as stale
+DEFAULT_MAX_VALUE_AGE = 0
+MAX_MAX_VALUE_AGE = 86400
+
+# The Ethernet RF bridge closes the connection after 3 minutes without
+# traffic, the scan interval must stay well below it.
+MIN_SCAN_INTERVAL = 15
+MAX_SCAN_INTERVAL = 150
+
+# The adaptive scan interval is lengthened when a poll takes more than this
+# share of the interval, or when the RF load of the current hour is above
+# ADAPTIVE_RF_LOAD_BUSY percent.
+ADAPTIVE_POLL_DURATION_RATIO = 0.5
+ADAPTIVE_RF_LOAD_BUSY = 50
+# Interval factors when the system is changing, steady or busy
+ADAPTIVE_CHANGING_FACTOR = 0.5
+ADAPTIVE_STEADY_FACTOR = 1.25
+ADAPTIVE_BUSY_FACTOR = 2
+
+# Probe the Ethernet RF bridge when idle for KEEPALIVE_IDLE_TIME seconds,
+# before it closes the connection.
+KEEPALIVE_IDLE_TIME = 120
+KEEPALIVE_CHECK_INTERVAL = 30
+KEEPALIVE_BACKOFF_MIN = 2
+KEEPALIVE_BACKOFF_MAX = 60
+
+# Each node is polled with its own timeout. A failing node is retried after
+# an exponential backoff, without holding back the other nodes.
+NODE_POLL_TIMEOUT = 10
+NODE_BACKOFF_MIN = 30
+NODE_BACKOFF_MAX = 600
+
+# Registers read with a single Modbus request, the limit of the protocol
+MAX_READ_REGISTERS = 125
+
+# Node reads in flight at once across all the RF bridges, each in a bus slot
+# of its own bridge. The wait for one is not part of the node poll timeout.
+MAX_CONCURRENT_TRANSACTIONS = 2
+
+# Number of poll cycles kept for the diagnostics
+POLL_HISTORY_SIZE = 60
+
+# Seconds to wait before saving the data snapshot, to limit the writes
+SNAPSHOT_SAVE_DELAY = 300
+
+# The RF update time of a value is derived from its age, which the bridge
+# reports with a resolution of seconds. Updates closer than this are the same.
+RF_EPOCH_TOLERANCE = 2
+
+# The bind status is read BIND_POLL_MIN seconds after the bind command, then
+# less and less often up to every BIND_POLL_MAX seconds. The bridge gives up
+# on a controller after 20 seconds and on an accessory after 120 seconds.
+BIND_POLL_MIN = 0.25
+BIND_POLL_MAX = 2
+BIND_POLL_BACKOFF = 1.5
+BIND_CONTROLLER_TIMEOUT = 25
+BIND_ACCESSORY_TIMEOUT = 125
+
+# Writes to the same property within this window are coalesced
+WRITE_DEBOUNCE_TIME = 0.3
 
 CONF_FETCH_RESULT_STATUS = "fetch_result_status"
+CONF_ADAPTIVE_SCAN_INTERVAL = "adaptive_scan_interval"
+CONF_AGE_AWARE_POLLING = "age_aware_polling"
+CONF_MAX_VALUE_AGE = "max_value_age"
 CONF_BRIDGE_RF_ADDRESS = "bridge_rf_address"
 CONF_RF_ADDRESS = "rf_address"
 CONF_DEFAULT_TYPE = BridgeType.SERIAL
@@ -2,51 +2,1162 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import datetime
 import logging
+import time
 import typing
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from typing import Any, Self
 
+from homeassistant.const import CONF_SCAN_INTERVAL
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 from pyairios.data_model import AiriosData
-from pyairios.exceptions import AiriosException
+from pyairios.exceptions import AiriosException, AiriosUnknownProductException
+from pyairios.models.factory import factory
+from pyairios.properties import (
+    AiriosBridgeProperty,
+    AiriosDeviceProperty,
+    AiriosVMDProperty,
+)
+from pyairios.registers import Result, ResultStatus
 
-from .const import DEFAULT_NAME
+from .const import (
+    ADAPTIVE_BUSY_FACTOR,
+    ADAPTIVE_CHANGING_FACTOR,
+    ADAPTIVE_POLL_DURATION_RATIO,
+    ADAPTIVE_RF_LOAD_BUSY,
+    ADAPTIVE_STEADY_FACTOR,
+    CONF_ADAPTIVE_SCAN_INTERVAL,
+    CONF_AGE_AWARE_POLLING,
+    CONF_FETCH_RESULT_STATUS,
+    CONF_MAX_VALUE_AGE,
+    DEFAULT_ADAPTIVE_SCAN_INTERVAL,
+    DEFAULT_AGE_AWARE_POLLING,
+    DEFAULT_FETCH_RESULT_STATUS,
+    DEFAULT_MAX_VALUE_AGE,
+    DEFAULT_NAME,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SLOW_POLL_TICKS,
+    MAX_SCAN_INTERVAL,
+    MIN_SCAN_INTERVAL,
+    NODE_BACKOFF_MAX,
+    NODE_BACKOFF_MIN,
+    NODE_POLL_TIMEOUT,
+    POLL_HISTORY_SIZE,
+    RF_EPOCH_TOLERANCE,
+    WRITE_DEBOUNCE_TIME,
+    PollTier,
+)
+from .identity import AiriosIdentityIndex, AiriosSubentryIndex
+from .reads import (
+    AiriosNodeRead,
+    async_read_all_properties,
+    async_read_properties,
+    planned_frames,
+)
+from .scheduler import AiriosBusScheduler, AiriosPollBudget, BusPriority
 
 if typing.TYPE_CHECKING:
-    from homeassistant.core import HomeAssistant
+    from collections.abc import (
+        AsyncIterator,
+        Awaitable,
+        Callable,
+        Iterable,
+        Iterator,
+        Mapping,
+    )
+
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
     from pyairios import Airios
+    from pyairios.data_model import AiriosDeviceData
+    from pyairios.device import AiriosDevice
+    from pyairios.properties import AiriosBaseProperty
+
+    from .connection import AiriosConnectionSupervisor
+    from .pool import AiriosPooledTransport
+    from .store import AiriosSnapshotStore
 
 _LOGGER = logging.getLogger(__name__)
 
+_VENTILATION_SPEED_DEPENDENCIES = (
+    AiriosVMDProperty.CURRENT_VENTILATION_SPEED,
+    AiriosVMDProperty.VENTILATION_SPEED_OVERRIDE_REMAINING_TIME,
+    AiriosVMDProperty.FAN_SPEED_SUPPLY,
+    AiriosVMDProperty.FAN_SPEED_EXHAUST,
+)
+_FAN_SPEED_DEPENDENCIES = (
+    AiriosVMDProperty.FAN_SPEED_SUPPLY,
+    AiriosVMDProperty.FAN_SPEED_EXHAUST,
+)
+
+# Properties whose value may change when a property is written. They are read
+# back together with the written property after a write.
+WRITE_DEPENDENCIES: dict[AiriosBaseProperty, tuple[AiriosBaseProperty, ...]] = {
+    AiriosVMDProperty.REQUESTED_VENTILATION_SPEED: _VENTILATION_SPEED_DEPENDENCIES,
+    AiriosVMDProperty.OVERRIDE_TIME_SPEED_LOW: _VENTILATION_SPEED_DEPENDENCIES,
+    AiriosVMDProperty.OVERRIDE_TIME_SPEED_MID: _VENTILATION_SPEED_DEPENDENCIES,
+    AiriosVMDProperty.OVERRIDE_TIME_SPEED_HIGH: _VENTILATION_SPEED_DEPENDENCIES,
+    AiriosVMDProperty.FAN_SPEED_AWAY_SUPPLY: _FAN_SPEED_DEPENDENCIES,
+    AiriosVMDProperty.FAN_SPEED_AWAY_EXHAUST: _FAN_SPEED_DEPENDENCIES,
+    AiriosVMDProperty.FAN_SPEED_LOW_SUPPLY: _FAN_SPEED_DEPENDENCIES,
+    AiriosVMDProperty.FAN_SPEED_LOW_EXHAUST: _FAN_SPEED_DEPENDENCIES,
+    AiriosVMDProperty.FAN_SPEED_MID_SUPPLY: _FAN_SPEED_DEPENDENCIES,
+    AiriosVMDProperty.FAN_SPEED_MID_EXHAUST: _FAN_SPEED_DEPENDENCIES,
+    AiriosVMDProperty.FAN_SPEED_HIGH_SUPPLY: _FAN_SPEED_DEPENDENCIES,
+    AiriosVMDProperty.FAN_SPEED_HIGH_EXHAUST: _FAN_SPEED_DEPENDENCIES,
+    AiriosVMDProperty.BYPASS_MODE: (AiriosVMDProperty.BYPASS_POSITION,),
+    AiriosVMDProperty.FILTER_RESET: (
+        AiriosVMDProperty.FILTER_DIRTY,
+        AiriosVMDProperty.FILTER_REMAINING_PERCENT,
+        AiriosVMDProperty.FILTER_DURATION,
+    ),
+}
+
+# The modbus addresses of the nodes bound to the bridge, 0 for a free slot
+BOUND_NODE_PROPERTIES: tuple[AiriosBaseProperty, ...] = tuple(
+    AiriosBridgeProperty[f"ADDRESS_NODE_{n}"] for n in range(1, 33)
+)
+
+# Properties whose changes shorten the adaptive scan interval
+ADAPTIVE_WATCHED_PROPERTIES: tuple[AiriosBaseProperty, ...] = (
+    AiriosVMDProperty.CURRENT_VENTILATION_SPEED,
+    AiriosVMDProperty.FAN_SPEED_SUPPLY,
+    AiriosVMDProperty.FAN_SPEED_EXHAUST,
+    AiriosVMDProperty.BYPASS_POSITION,
+)
+
+
+class AiriosPollPlan:
+    """
+    The properties to poll for each node, grouped by poll tier.
+
+    Entities add their property when they are added to Home Assistant and
+    remove it when they are removed or disabled, so only the properties
+    consumed by enabled entities are polled.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty poll plan."""
+        self._nodes: dict[int, dict[AiriosBaseProperty, Counter[PollTier]]] = {}
+        # Nodes whose result status is requested, by number of requests
+        self._status: Counter[int] = Counter()
+
+    @callback
+    def async_add(
+        self, modbus_address: int, ap: AiriosBaseProperty, poll_tier: PollTier
+    ) -> CALLBACK_TYPE:
+        """Add a node property to the plan, return a callback to remove it."""
+        tiers = self._nodes.setdefault(modbus_address, {}).setdefault(ap, Counter())
+        tiers[poll_tier] += 1
+
+        @callback
+        def _remove() -> None:
+            tiers[poll_tier] -= 1
+            if tiers[poll_tier] <= 0:
+                del tiers[poll_tier]
+            if not tiers:
+                del self._nodes[modbus_address][ap]
+
+        return _remove
+
+    @callback
+    def async_add_status(self, modbus_address: int) -> CALLBACK_TYPE:
+        """Request the result status of a node, return a callback to remove it."""
+        self._status[modbus_address] += 1
+
+        @callback
+        def _remove() -> None:
+            self._status[modbus_address] -= 1
+            if self._status[modbus_address] <= 0:
+                del self._status[modbus_address]
+
+        return _remove
+
+    def wants_status(self, modbus_address: int) -> bool:
+        """Return whether the result status of a node is requested."""
+        return modbus_address in self._status
+
+    def properties(
+        self, modbus_address: int, poll_tiers: tuple[PollTier, ...]
+    ) -> list[AiriosBaseProperty]:
+        """Return the node properties to poll in the given tiers, fastest wins."""
+        node = self._nodes.get(modbus_address, {})
+        return [ap for ap, tiers in node.items() if min(tiers) in poll_tiers]
+
+
+@dataclass
+class AiriosPollCycle:
+    """Timings and counters of a poll cycle."""
+
+    started: datetime.datetime
+    poll_tiers: tuple[PollTier, ...] = ()
+    # Seconds from the start to the end of the cycle, bus waits included
+    duration: float = 0.0
+    transactions: int = 0
+    # Reads skipped because the bridge did not receive a new value yet
+    skipped_reads: int = 0
+    # Modbus request frames sent to each node
+    node_frames: dict[int, int] = field(default_factory=dict)
+    # Seconds spent polling each node, with the bus held
+    node_durations: dict[int, float] = field(default_factory=dict)
+    # The nodes that failed, their previous data is kept
+    failed_nodes: list[int] = field(default_factory=list)
+    # The error that aborted the cycle
+    error: str | None = None
+
+
+@dataclass
+class AiriosNodeSlot:
+    """Polling state of a node."""
+
+    # Consecutive failed polls
+    failures: int = 0
+    # Monotonic time before which the node is not polled again
+    retry_at: float = 0.0
+    last_error: str | None = None
+
+    @property
+    def available(self) -> bool:
+        """Return whether the last poll of the node succeeded."""
+        return self.failures == 0
+
+
+@dataclass
+class AiriosRfEpoch:
+    """When the bridge last received a property over RF."""
+
+    # Monotonic time of the last RF update
+    epoch: float
+    # Shortest time seen between two RF updates, None until seen twice
+    period: float | None = None
+    # Monotonic time of the last read of the value
+    read_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass(frozen=True)
+class AiriosStatusRead:
+    """The last result status read for a property."""
+
+    status: ResultStatus
+    # Monotonic time of the read
+    read_at: float
+    # The value read with the status
+    value: Any
+
+
+def age_seconds(status: ResultStatus) -> float | None:
+    """Return the age of a result in seconds, None if unknown."""
+    age = status.age
+    if isinstance(age, datetime.timedelta):
+        return age.total_seconds()
+    if isinstance(age, int | float):
+        return float(age)
+    return None
+
+
+def _rf_busy(data: AiriosData) -> bool:
+    """Return whether the RF load of the current hour is high."""
+    bridge = data.nodes.get(data.bridge_key)
+    if (
+        bridge is None
+        or (result := bridge.get(AiriosBridgeProperty.RF_LOAD_CURRENT_HOUR)) is None
+    ):
+        return False
+    return result.value is not None and result.value > ADAPTIVE_RF_LOAD_BUSY
+
+
+def _changing(previous: AiriosData, data: AiriosData) -> bool:
+    """Return whether a watched value changed or an override timer is running."""
+    for modbus_address, node in data.nodes.items():
+        if (previous_node := previous.nodes.get(modbus_address)) is None:
+            continue
+        for ap in ADAPTIVE_WATCHED_PROPERTIES:
+            if (
+                ap in node
+                and ap in previous_node
+                and (node[ap].value != previous_node[ap].value)
+            ):
+                return True
+        override = AiriosVMDProperty.VENTILATION_SPEED_OVERRIDE_REMAINING_TIME
+        if (remaining := node.get(override)) is not None and remaining.value:
+            return True
+    return False
+
+
+def _changed_properties(
+    previous: AiriosDeviceData, node: AiriosDeviceData
+) -> set[AiriosBaseProperty]:
+    """Return the properties whose value or result status changed."""
+    changed: set[AiriosBaseProperty] = set()
+    for ap, result in node.items():
+        previous_result = previous.get(ap)
+        if result is previous_result:
+            continue
+        if (
+            result is None
+            or previous_result is None
+            or result.value != previous_result.value
+            or result.status != previous_result.status
+        ):
+            changed.add(ap)
+    return changed
+
+
+type WriteFunction = Callable[[AiriosDevice, Any], Awaitable[bool]]
+
+
+@dataclass
+class _PendingWrite:
+    """A write waiting for the end of its debounce window."""
+
+    value: Any
+    write_fn: WriteFunction | None
+    future: asyncio.Future[bool]
+
+
+@dataclass(frozen=True, kw_only=True)
+class AiriosCoordinatorOptions:
+    """The config entry options applied by the coordinator."""
+
+    scan_interval: int = DEFAULT_SCAN_INTERVAL
+    fetch_result_status: bool = DEFAULT_FETCH_RESULT_STATUS
+    adaptive_scan_interval: bool = DEFAULT_ADAPTIVE_SCAN_INTERVAL
+    age_aware_polling: bool = DEFAULT_AGE_AWARE_POLLING
+    # Seconds after which a value is stale, 0 to disable
+    max_value_age: int = DEFAULT_MAX_VALUE_AGE
+
+    @classmethod
+    def from_entry_options(cls, options: Mapping[str, Any]) -> Self:
+        """Return the options of a config entry, defaults for the unset ones."""
+        return cls(
+            scan_interval=options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+            fetch_result_status=options.get(
+                CONF_FETCH_RESULT_STATUS, DEFAULT_FETCH_RESULT_STATUS
+            ),
+            adaptive_scan_interval=options.get(
+                CONF_ADAPTIVE_SCAN_INTERVAL, DEFAULT_ADAPTIVE_SCAN_INTERVAL
+            ),
+            age_aware_polling=options.get(
+                CONF_AGE_AWARE_POLLING, DEFAULT_AGE_AWARE_POLLING
+            ),
+            max_value_age=options.get(CONF_MAX_VALUE_AGE, DEFAULT_MAX_VALUE_AGE),
+        )
+
 
 class AiriosDataUpdateCoordinator(DataUpdateCoordinator[AiriosData]):
     """The Airios data update coordinator."""
 
-    fetch_result_status: bool
-
     def __init__(
         self,
         hass: HomeAssistant,
         api: Airios,
-        update_interval: int,
-        *,
-        fetch_result_status: bool,
+        options: AiriosCoordinatorOptions,
     ) -> None:
         """Initialize the Airios data coordinator."""
         super().__init__(
             hass,
             _LOGGER,
             name=f"{DEFAULT_NAME} DataUpdateCoordinator",
-            update_interval=datetime.timedelta(seconds=update_interval),
+            update_interval=datetime.timedelta(seconds=options.scan_interval),
         )
         self.api = api
-        self.fetch_result_status = fetch_result_status
+        self.options = options
+        self.rf_epochs: dict[tuple[int, AiriosBaseProperty], AiriosRfEpoch] = {}
+        self._status_reads: dict[tuple[int, AiriosBaseProperty], AiriosStatusRead] = {}
+        self._remove_rf_load_plan: CALLBACK_TYPE | None = None
+        self.poll_plan = AiriosPollPlan()
+        self._devices: dict[int, AiriosDevice] = {}
+        # Modbus addresses of the supported bound nodes, from the last full read
+        self._bound_nodes: set[int] = set()
+        self._tick = 0
+        self._slow_poll_requested = False
+        # A refresh requested after a user action starts without waiting its turn
+        self._refresh_requested = False
+        # Entity state writes skipped because nothing changed
+        self.skipped_state_writes = 0
+        # Time of the last successful bus transaction, for the keepalive
+        self.last_bus_activity = time.monotonic()
+        self.connection: AiriosConnectionSupervisor | None = None
+        self.scheduler = AiriosBusScheduler()
+        # The pooled transport of the bridge, when set up from a config entry
+        self.transport: AiriosPooledTransport | None = None
+        # Shared with the other bridges when set up
+        self.poll_budget = AiriosPollBudget()
+        self._pending_writes: dict[tuple[int, AiriosBaseProperty], _PendingWrite] = {}
+        # The last poll cycles, for the diagnostics
+        self.poll_cycles: deque[AiriosPollCycle] = deque(maxlen=POLL_HISTORY_SIZE)
+        self.poll_errors = 0
+        self.node_slots: dict[int, AiriosNodeSlot] = {}
+        # The data was restored from the snapshot and not polled yet
+        self.stale = False
+        self.snapshot_store: AiriosSnapshotStore | None = None
+        self.subentries = AiriosSubentryIndex()
+        self.identities = AiriosIdentityIndex(self.subentries)
+        # The config entry data and subentries set up, a change needs a reload
+        self.setup_key: tuple[Any, ...] = ()
+        # The nodes whose entities are set up, a new node needs a reload
+        self.setup_nodes: set[int] = set()
+        # Polling is paused while a bind is running, by number of binds
+        self._polling_pauses = 0
+        # The data and state the listeners were last updated with
+        self._dispatched: AiriosData | None = None
+        self._dispatched_key: tuple[Any, ...] = ()
+        self._dispatched_nodes: dict[int, tuple[bool, bool]] = {}
+
+    def _dispatch_key(self) -> tuple[Any, ...]:
+        """Return the state that all the entities depend on."""
+        return (
+            self.last_update_success,
+            self.stale,
+            self.options.fetch_result_status,
+            self.options.max_value_age,
+        )
+
+    def _node_dispatch_key(self, modbus_address: int) -> tuple[bool, bool]:
+        """Return the state that all the entities of a node depend on."""
+        return (
+            self.node_available(modbus_address),
+            self.poll_plan.wants_status(modbus_address),
+        )
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """
+        Update the listeners whose data changed since the last update.
+
+        Entities of a property listen with a (modbus address, property)
+        context and are only called when the result of their property
+        changed. Other listeners are always called. All the listeners of a
+        node are called when its availability or result status setting
+        changed, and all the listeners when the coordinator state changed.
+        """
+        previous, self._dispatched = self._dispatched, self.data
+        dispatch_key = self._dispatch_key()
+        if (
+            previous is None
+            or self.data is None
+            or dispatch_key != self._dispatched_key
+        ):
+            self._dispatched_key = dispatch_key
+            self._dispatched_nodes = {}
+            if self.data is not None:
+                self._dispatched_nodes = {
+                    modbus_address: self._node_dispatch_key(modbus_address)
+                    for modbus_address in self.data.nodes
+                }
+            super().async_update_listeners()
+            return
+
+        # Changed properties by node, None when all the listeners are called
+        changed: dict[int, set[AiriosBaseProperty] | None] = {}
+        for modbus_address, node in self.data.nodes.items():
+            node_key = self._node_dispatch_key(modbus_address)
+            previous_node = previous.nodes.get(modbus_address)
+            if previous_node is None or node_key != self._dispatched_nodes.get(
+                modbus_address
+            ):
+                self._dispatched_nodes[modbus_address] = node_key
+                changed[modbus_address] = None
+            elif node is not previous_node:
+                changed[modbus_address] = _changed_properties(previous_node, node)
+
+        for update_callback, context in list(self._listeners.values()):
+            if not isinstance(context, tuple):
+                update_callback()
+                continue
+            modbus_address, ap = context
+            if modbus_address not in changed:
+                continue
+            if (properties := changed[modbus_address]) is None or ap in properties:
+                update_callback()
+
+    @callback
+    def async_set_restored_data(self, data: AiriosData) -> None:
+        """Use restored data until it is replaced by a full read of the bus."""
+        self.data = data
+        self.stale = True
+        self._async_update_identities(data)
+
+    @callback
+    def _async_update_identities(self, data: AiriosData) -> None:
+        """Update the device identities from the data of a full read."""
+        if self.config_entry is not None:
+            self.identities.async_update(self.config_entry, data)
+
+    @contextlib.contextmanager
+    def pause_polling(self) -> Iterator[None]:
+        """Skip the poll cycles while in the context, to leave the bus to a bind."""
+        self._polling_pauses += 1
+        try:
+            yield
+        finally:
+            self._polling_pauses -= 1
+
+    def status_enabled(self, modbus_address: int) -> bool:
+        """Return whether the result status of a node is fetched."""
+        return self.options.fetch_result_status or self.poll_plan.wants_status(
+            modbus_address
+        )
+
+    @callback
+    def async_apply_options(self, options: AiriosCoordinatorOptions) -> None:
+        """Apply changed options in place, the next refresh uses them."""
+        previous, self.options = self.options, options
+        if not options.adaptive_scan_interval or not previous.adaptive_scan_interval:
+            # The adaptive interval starts from the configured value
+            self.update_interval = datetime.timedelta(seconds=options.scan_interval)
+        if not options.adaptive_scan_interval and self._remove_rf_load_plan is not None:
+            self._remove_rf_load_plan()
+            self._remove_rf_load_plan = None
+        if options.fetch_result_status != previous.fetch_result_status:
+            # Read the slow tier too, so their status is updated
+            self._slow_poll_requested = True
+        _LOGGER.debug(
+            "Applied options: update interval %s, fetch result status %s",
+            self.update_interval,
+            options.fetch_result_status,
+        )
+
+    async def async_request_refresh(self) -> None:
+        """Request a refresh including the slow tier, as a value may have been set."""
+        self._slow_poll_requested = True
+        self._refresh_requested = True
+        await super().async_request_refresh()
+
+    @callback
+    def async_use_transport(self, pooled: AiriosPooledTransport) -> None:
+        """Talk to the bridge through a pooled transport and its bus scheduler."""
+        self.transport = pooled
+        self.api = pooled.api(self.api.bridge.device_id)
+        self.scheduler = pooled.scheduler
+        # The devices are bound to the client of the previous transport
+        self._devices = {self.api.bridge.device_id: self.api.bridge}
+
+    async def async_get_device(self, modbus_address: int) -> AiriosDevice:
+        """Return the cached API device for a node, call with a bus slot held."""
+        if (dev := self._devices.get(modbus_address)) is None:
+            dev = await self._async_identify_node(modbus_address)
+            self._devices[modbus_address] = dev
+        return dev
+
+    async def async_write(
+        self,
+        modbus_address: int,
+        ap: AiriosBaseProperty,
+        value: Any,
+        write_fn: WriteFunction | None = None,
+    ) -> bool:
+        """
+        Write a node property and read it back.
+
+        Writes to the same node property within WRITE_DEBOUNCE_TIME seconds
+        are coalesced: only the last value is written, the node is read back
+        once, and all the callers get the result of that write. The property
+        is written with write_fn if given, or set directly otherwise.
+        """
+        key = (modbus_address, ap)
+        if (pending := self._pending_writes.get(key)) is not None:
+            _LOGGER.debug("Coalescing write of node %s property %s", *key)
+            pending.value = value
+            pending.write_fn = write_fn
+        else:
+            pending = _PendingWrite(value, write_fn, self.hass.loop.create_future())
+            self._pending_writes[key] = pending
+            self.hass.async_create_task(
+                self._async_flush_write(key), f"Airios write {key}"
+            )
+        # The write goes on even if a caller is cancelled
+        return await asyncio.shield(pending.future)
+
+    async def _async_flush_write(self, key: tuple[int, AiriosBaseProperty]) -> None:
+        """Write the last value of a node property after the debounce window."""
+        await asyncio.sleep(WRITE_DEBOUNCE_TIME)
+        pending = self._pending_writes.pop(key)
+        modbus_address, ap = key
+        try:
+            async with self.scheduler.slot(BusPriority.WRITE):
+                dev = await self.async_get_device(modbus_address)
+                if pending.write_fn is not None:
+                    ret = await pending.write_fn(dev, pending.value)
+                else:
+                    ret = await dev.set(ap, pending.value)
+            if ret:
+                await self.async_refresh_node(modbus_address, ap)
+        except Exception as err:  # noqa: BLE001
+            # Always resolve the callers. Mark the exception as retrieved, as
+            # they may be gone.
+            pending.future.set_exception(err)
+            pending.future.exception()
+        else:
+            pending.future.set_result(ret)
+
+    async def async_write_group(
+        self,
+        modbus_address: int,
+        values: Mapping[AiriosBaseProperty, Any],
+        *,
+        read_back: bool = True,
+    ) -> None:
+        """
+        Write related node properties, all or nothing.
+
+        The current values of the properties are read, then the properties
+        are written one after the other, within a single bus slot. If one
+        fails, the properties already written are restored to the values read
+        and the error is raised. If restoring fails too, that error is raised.
+        The node is read back once, unless the caller reads back several
+        writes together.
+        """
+        written: list[AiriosBaseProperty] = []
+        try:
+            async with self.scheduler.slot(BusPriority.WRITE):
+                dev = await self.async_get_device(modbus_address)
+                current = await async_read_properties(dev, values, with_status=False)
+                try:
+                    for ap, value in values.items():
+                        await self._async_set(dev, ap, value)
+                        written.append(ap)
+                except AiriosException as err:
+                    await self._async_rollback(dev, current.results, written, err)
+                    raise
+        finally:
+            if written and read_back:
+                await self.async_refresh_node(modbus_address, *values)
+
+    @staticmethod
+    async def _async_set(dev: AiriosDevice, ap: AiriosBaseProperty, value: Any) -> None:
+        """Set a node property, raise if the node does not accept it."""
+        if not await dev.set(ap, value):
+            msg = f"Failed to set {ap} to {value}"
+            raise AiriosException(msg)
+
+    async def _async_rollback(
+        self,
+        dev: AiriosDevice,
+        current: AiriosDeviceData,
+        written: list[AiriosBaseProperty],
+        error: AiriosException,
+    ) -> None:
+        """Restore written properties to the values read before, raise if any fails."""
+        failed: list[AiriosBaseProperty] = []
+        for ap in reversed(written):
+            result = current.get(ap)
+            if result is None or result.value is None:
+                failed.append(ap)
+                continue
+            try:
+                await self._async_set(dev, ap, result.value)
+            except AiriosException as err:
+                _LOGGER.debug("Restoring %s failed: %s", ap, err)
+                failed.append(ap)
+        if failed:
+            msg = (
+                f"Failed to restore node {dev.device_id} properties "
+                f"{', '.join(ap.name for ap in failed)} after: {error}"
+            )
+            raise AiriosException(msg) from error
+
+    async def async_refresh_node(
+        self, modbus_address: int, *written: AiriosBaseProperty
+    ) -> None:
+        """Read back the written properties of a node and notify its entities."""
+        await self.async_refresh_nodes({modbus_address: written})
+
+    async def async_refresh_nodes(
+        self, written: Mapping[int, Iterable[AiriosBaseProperty]]
+    ) -> None:
+        """
+        Read back the written properties of nodes and notify their entities.
+
+        Only the written properties and the properties depending on them are
+        read, in a single bus slot, the rest of the cached data is kept. Falls
+        back to a full refresh if the read back fails.
+        """
+        if self.data is None or any(
+            modbus_address not in self.data.nodes for modbus_address in written
+        ):
+            await self.async_request_refresh()
+            return
+
+        node_properties: dict[int, dict[AiriosBaseProperty, None]] = {}
+        for modbus_address, aps in written.items():
+            previous = self.data.nodes[modbus_address]
+            properties: dict[AiriosBaseProperty, None] = {}
+            for ap in aps:
+                properties.update(
+                    dict.fromkeys(
+                        p
+                        for p in (ap, *WRITE_DEPENDENCIES.get(ap, ()))
+                        if p in previous
+                    )
+                )
+            if properties:
+                node_properties[modbus_address] = properties
+        if not node_properties:
+            return
+
+        nodes: dict[int, AiriosDeviceData] = {}
+        try:
+            async with self.scheduler.slot(BusPriority.WRITE):
+                for modbus_address, properties in node_properties.items():
+                    _LOGGER.debug(
+                        "Reading back node %s properties %s",
+                        modbus_address,
+                        properties,
+                    )
+                    dev = await self.async_get_device(modbus_address)
+                    read = await async_read_properties(
+                        dev,
+                        properties,
+                        with_status=self.status_enabled(modbus_address),
+                    )
+                    self._track_status(modbus_address, read.results)
+                    nodes[modbus_address] = {
+                        **self.data.nodes[modbus_address],
+                        **read.results,
+                    }
+        except AiriosException as err:
+            _LOGGER.warning(
+                "Failed to read back nodes %s, requesting full refresh: %s",
+                list(node_properties),
+                err,
+            )
+            await self.async_request_refresh()
+            return
+
+        self.last_bus_activity = time.monotonic()
+        self.data = AiriosData(
+            bridge_key=self.data.bridge_key, nodes={**self.data.nodes, **nodes}
+        )
+        self.async_update_listeners()
+
+    async def _async_fetch_planned(
+        self, previous: AiriosData, cycle: AiriosPollCycle
+    ) -> AiriosData:
+        """Poll the planned properties and merge them into the previous data."""
+        self._tick += 1
+        poll_tiers: tuple[PollTier, ...] = (PollTier.FAST,)
+        if self._slow_poll_requested or self._tick % DEFAULT_SLOW_POLL_TICKS == 0:
+            poll_tiers = (PollTier.FAST, PollTier.SLOW)
+        self._slow_poll_requested = False
+        cycle.poll_tiers = poll_tiers
+
+        # Result status requested per node is read at the slow tier cadence.
+        # The age aware polling learns the RF epochs of all the nodes from
+        # these reads, and skips the values not due on the other polls.
+        slow = PollTier.SLOW in poll_tiers
+        skip_not_due = self.options.age_aware_polling and not slow
+        nodes = dict(previous.nodes)
+        polled = 0
+        now = time.monotonic()
+        for modbus_address, previous_node in previous.nodes.items():
+            properties = self.poll_plan.properties(modbus_address, poll_tiers)
+            slot = self.node_slots.setdefault(modbus_address, AiriosNodeSlot())
+            if not properties or slot.retry_at > now:
+                continue
+            if skip_not_due:
+                due = [
+                    ap
+                    for ap in properties
+                    if self._rf_update_due(modbus_address, ap, now)
+                ]
+                cycle.skipped_reads += len(properties) - len(due)
+                if not due:
+                    continue
+                properties = due
+            polled += 1
+            results = await self._async_try_node(
+                modbus_address,
+                cycle,
+                self._async_poll_node(
+                    modbus_address,
+                    properties,
+                    cycle,
+                    with_status=self.options.fetch_result_status
+                    or (
+                        slow
+                        and (
+                            self.options.age_aware_polling
+                            or self.poll_plan.wants_status(modbus_address)
+                        )
+                    ),
+                ),
+            )
+            if results is not None:
+                # A new dict, entities may still hold the previous snapshot
+                nodes[modbus_address] = {**previous_node, **results}
+
+        # Bound nodes that failed their first read are read in full when due
+        for modbus_address in self._bound_nodes - nodes.keys():
+            slot = self.node_slots.setdefault(modbus_address, AiriosNodeSlot())
+            if slot.retry_at > now:
+                continue
+            polled += 1
+            results = await self._async_try_node(
+                modbus_address, cycle, self._async_read_node(modbus_address, cycle)
+            )
+            if results is not None:
+                nodes[modbus_address] = results
+
+        if polled and len(cycle.failed_nodes) == polled:
+            msg = "All nodes failed"
+            raise AiriosException(msg)
+        return AiriosData(bridge_key=previous.bridge_key, nodes=nodes)
+
+    async def _async_try_node(
+        self,
+        modbus_address: int,
+        cycle: AiriosPollCycle,
+        read: Awaitable[AiriosDeviceData],
+    ) -> AiriosDeviceData | None:
+        """Await the read of a node, back it off and return None if it failed."""
+        slot = self.node_slots.setdefault(modbus_address, AiriosNodeSlot())
+        try:
+            results = await read
+        except AiriosUnknownProductException as err:
+            # Not read again until a full read finds it bound again
+            _LOGGER.warning("Node %s is not supported: %s", modbus_address, err)
+            self._bound_nodes.discard(modbus_address)
+            return None
+        except (AiriosException, TimeoutError) as err:
+            cycle.failed_nodes.append(modbus_address)
+            self.poll_errors += 1
+            self._node_failed(modbus_address, slot, err)
+            return None
+        if not slot.available:
+            _LOGGER.info("Node %s is available again", modbus_address)
+        self.node_slots[modbus_address] = AiriosNodeSlot()
+        return results
+
+    @contextlib.asynccontextmanager
+    async def _node_transaction(
+        self, modbus_address: int, cycle: AiriosPollCycle
+    ) -> AsyncIterator[None]:
+        """
+        Hold a poll transaction and a bus slot for a node read.
+
+        Only the read itself is within the node poll timeout, not the wait for
+        the other bridges or for the bus.
+        """
+        # Take a slot per node so user writes can be served in between
+        async with (
+            self.poll_budget.transaction(),
+            self.scheduler.slot(BusPriority.POLL),
+        ):
+            start = time.monotonic()
+            try:
+                async with asyncio.timeout(NODE_POLL_TIMEOUT):
+                    yield
+            finally:
+                cycle.node_durations[modbus_address] = time.monotonic() - start
+
+    async def _async_poll_node(
+        self,
+        modbus_address: int,
+        properties: Iterable[AiriosBaseProperty],
+        cycle: AiriosPollCycle,
+        *,
+        with_status: bool,
+    ) -> AiriosDeviceData:
+        """Read properties of a node, within the node poll timeout."""
+        async with self._node_transaction(modbus_address, cycle):
+            dev = await self.async_get_device(modbus_address)
+            read = await async_read_properties(dev, properties, with_status=with_status)
+        self._count_read(cycle, modbus_address, read)
+        return read.results
+
+    async def _async_read_node(
+        self, modbus_address: int, cycle: AiriosPollCycle
+    ) -> AiriosDeviceData:
+        """
+        Read all the properties of a bound node, the unread ones have no value.
+
+        A node read for the first time is identified by its product id first,
+        in the same bus slot.
+        """
+        async with self._node_transaction(modbus_address, cycle):
+            identified = modbus_address not in self._devices
+            if identified:
+                self._devices[modbus_address] = await self._async_identify_node(
+                    modbus_address
+                )
+            read = await async_read_all_properties(
+                self._devices[modbus_address],
+                with_status=self.status_enabled(modbus_address),
+            )
+        if identified:
+            read.frames += 1
+        self._count_read(cycle, modbus_address, read)
+        return read.results
+
+    async def _async_identify_node(self, modbus_address: int) -> AiriosDevice:
+        """Return the API device of a bound node from its product id."""
+        bridge = self.api.bridge
+        try:
+            result = await bridge.client.get_register(
+                bridge.regmap[AiriosDeviceProperty.PRODUCT_ID], modbus_address
+            )
+        except ValueError as err:
+            raise AiriosUnknownProductException(str(err)) from err
+        if result.value is None:
+            msg = f"Node {modbus_address} has no product id"
+            raise AiriosException(msg)
+        return await factory.get_device_by_product_id(
+            result.value, modbus_address, bridge.client
+        )
+
+    def _count_read(
+        self, cycle: AiriosPollCycle, modbus_address: int, read: AiriosNodeRead
+    ) -> None:
+        """Add the Modbus requests of a node read to the cycle, track RF epochs."""
+        cycle.transactions += read.frames
+        cycle.node_frames[modbus_address] = (
+            cycle.node_frames.get(modbus_address, 0) + read.frames
+        )
+        self._track_status(modbus_address, read.results)
+
+    def _track_status(self, modbus_address: int, results: AiriosDeviceData) -> None:
+        """
+        Track the result status read, and age it on reads without status.
+
+        A result read without its status gets the last status read, its age
+        advanced by the time since. If the value changed since, it was
+        received after that read, and the age is the time since the read. The
+        age is an upper bound either way, the bridge may have received the
+        same value again.
+        """
+        now = time.monotonic()
+        for ap, result in results.items():
+            key = (modbus_address, ap)
+            if (rf_epoch := self.rf_epochs.get(key)) is not None:
+                rf_epoch.read_at = now
+            if result.status is not None:
+                self._status_reads[key] = AiriosStatusRead(
+                    result.status, now, result.value
+                )
+                self._update_rf_epoch(modbus_address, ap, result.status)
+            elif (
+                status_read := self._status_reads.get(key)
+            ) is not None and self.status_enabled(modbus_address):
+                status = status_read.status
+                age = now - status_read.read_at
+                if result.value == status_read.value and (
+                    (read_age := age_seconds(status)) is not None
+                ):
+                    age += read_age
+                results[ap] = Result(
+                    result.value,
+                    ResultStatus(
+                        datetime.timedelta(seconds=round(age)),
+                        status.source,
+                        status.flags,
+                    ),
+                )
+
+    async def _async_read_all(
+        self, previous: AiriosData | None, cycle: AiriosPollCycle
+    ) -> AiriosData:
+        """
+        Read all the properties of the bridge and its bound nodes.
+
+        Each node is read in a bus slot of its own, within the node poll
+        timeout. Only the bridge must answer. A node that fails keeps its
+        previous data if there is any, and is read again after its backoff.
+        """
+        bridge = self.api.bridge
+        self._devices[bridge.device_id] = bridge
+        try:
+            bridge_results = await self._async_read_node(bridge.device_id, cycle)
+        except TimeoutError as err:
+            msg = "Timeout reading the bridge"
+            raise AiriosException(msg) from err
+        nodes = {bridge.device_id: bridge_results}
+        # Nodes are identified again, another node may be bound in their place
+        self._devices = {bridge.device_id: bridge}
+        self._bound_nodes = {
+            result.value
+            for ap in BOUND_NODE_PROPERTIES
+            if (result := bridge_results.get(ap)) is not None and result.value
+        }
+        for modbus_address in sorted(self._bound_nodes):
+            results = await self._async_try_node(
+                modbus_address, cycle, self._async_read_node(modbus_address, cycle)
+            )
+            if results is not None:
+                nodes[modbus_address] = results
+            elif previous is not None and modbus_address in previous.nodes:
+                nodes[modbus_address] = previous.nodes[modbus_address]
+        return AiriosData(bridge_key=bridge.device_id, nodes=nodes)
+
+    @callback
+    def _async_check_new_nodes(self, data: AiriosData) -> None:
+        """Reload the config entry to add the entities of nodes read late."""
+        if not self.setup_nodes or not (new := data.nodes.keys() - self.setup_nodes):
+            return
+        _LOGGER.info("Nodes %s are available, adding their entities", sorted(new))
+        self.setup_nodes |= new
+        if self.config_entry is not None:
+            self.hass.config_entries.async_schedule_reload(self.config_entry.entry_id)
+
+    def fast_poll_frames(self, modbus_address: int) -> int | None:
+        """Return the Modbus requests of a fast tier poll of a node, if known."""
+        if (dev := self._devices.get(modbus_address)) is None:
+            return None
+        return planned_frames(
+            dev,
+            self.poll_plan.properties(modbus_address, (PollTier.FAST,)),
+            with_status=self.status_enabled(modbus_address),
+        )
+
+    def _rf_update_due(
+        self, modbus_address: int, ap: AiriosBaseProperty, now: float
+    ) -> bool:
+        """Return whether the bridge may have received a new value by now."""
+        rf_epoch = self.rf_epochs.get((modbus_address, ap))
+        if rf_epoch is None or rf_epoch.period is None:
+            return True
+        # The first RF update expected after the last read
+        updates = (rf_epoch.read_at - rf_epoch.epoch) // rf_epoch.period + 1
+        return now >= rf_epoch.epoch + updates * rf_epoch.period - RF_EPOCH_TOLERANCE
+
+    def _update_rf_epoch(
+        self, modbus_address: int, ap: AiriosBaseProperty, status: ResultStatus
+    ) -> None:
+        """Record when the bridge received a property, from its result age."""
+        if (age := age_seconds(status)) is None:
+            return
+        epoch = time.monotonic() - age
+        key = (modbus_address, ap)
+        if (rf_epoch := self.rf_epochs.get(key)) is None:
+            self.rf_epochs[key] = AiriosRfEpoch(epoch=epoch)
+            return
+        if epoch - rf_epoch.epoch <= RF_EPOCH_TOLERANCE:
+            return
+        # Keep the shortest period, never skip a read that may be new
+        period = epoch - rf_epoch.epoch
+        if rf_epoch.period is not None:
+            period = min(period, rf_epoch.period)
+        self.rf_epochs[key] = AiriosRfEpoch(epoch=epoch, period=period)
+
+    def _node_failed(
+        self, modbus_address: int, slot: AiriosNodeSlot, err: Exception
+    ) -> None:
+        """Back off a failed node, its entities become unavailable."""
+        if slot.available:
+            _LOGGER.warning("Node %s is unavailable: %s", modbus_address, err)
+        slot.failures += 1
+        slot.last_error = str(err) or type(err).__name__
+        backoff = min(NODE_BACKOFF_MAX, NODE_BACKOFF_MIN * 2 ** (slot.failures - 1))
+        slot.retry_at = time.monotonic() + backoff
+        _LOGGER.debug("Retrying node %s in %ss", modbus_address, backoff)
+
+    def node_available(self, modbus_address: int) -> bool:
+        """Return whether the last poll of a node succeeded."""
+        slot = self.node_slots.get(modbus_address)
+        return slot is None or slot.available
+
+    def _adapt_update_interval(
+        self, previous: AiriosData, data: AiriosData, cycle: AiriosPollCycle
+    ) -> None:
+        """
+        Adapt the update interval to the activity of the system.
+
+        The interval is lengthened when a poll takes a large share of it or the
+        RF channel is busy, shortened while values are changing, and slowly
+        lengthened again when the system is steady. It is kept within the scan
+        interval bounds, and at least twice the poll duration.
+        """
+        if self.update_interval is None:
+            return
+        interval = self.update_interval.total_seconds()
+        if interval * ADAPTIVE_POLL_DURATION_RATIO < cycle.duration or _rf_busy(data):
+            interval *= ADAPTIVE_BUSY_FACTOR
+        elif _changing(previous, data):
+            interval *= ADAPTIVE_CHANGING_FACTOR
+        else:
+            interval *= ADAPTIVE_STEADY_FACTOR
+        interval = max(MIN_SCAN_INTERVAL, interval, 2 * cycle.duration)
+        interval = min(MAX_SCAN_INTERVAL, interval)
+        update_interval = datetime.timedelta(seconds=round(interval))
+        if update_interval != self.update_interval:
+            _LOGGER.debug("Adapting update interval to %s", update_interval)
+            self.update_interval = update_interval
+
+    async def _async_wait_poll_turn(self) -> bool:
+        """Wait for the turn of a poll cycle, return False while a bind pauses it."""
+        if self._polling_pauses and self.data is not None:
+            _LOGGER.debug("Polling paused while binding")
+            return False
+        if self._refresh_requested:
+            self._refresh_requested = False
+        elif self.data is not None:
+            await self.poll_budget.async_wait_turn()
+        return True
 
     async def _async_update_data(self) -> AiriosData:
         """Fetch state by polling API and forward it to Home Assistant."""
         _LOGGER.debug("Updating HA data state cache")
+        if not await self._async_wait_poll_turn():
+            return self.data
+        cycle = AiriosPollCycle(started=dt_util.utcnow())
+        start = time.monotonic()
         try:
-            return await self.api.fetch(with_status=self.fetch_result_status)
+            if self.data is None or self.stale:
+                # First refresh, read all properties including the static ones
+                cycle.poll_tiers = tuple(PollTier)
+                data = await self._async_read_all(self.data, cycle)
+                # Firmware updates and bindings only show in a full read
+                self._async_update_identities(data)
+            else:
+                data = await self._async_fetch_planned(self.data, cycle)
         except AiriosException as err:
+            if not cycle.failed_nodes:
+                # Failed nodes are already counted
+                self.poll_errors += 1
+            cycle.error = str(err)
             msg = "Error during state cache update"
             raise UpdateFailed(msg) from err
+        finally:
+            cycle.duration = time.monotonic() - start
+            self.poll_cycles.append(cycle)
+            self.poll_budget.record_cycle(cycle.duration)
+        self.last_bus_activity = time.monotonic()
+        self.stale = False
+        self._async_check_new_nodes(data)
+        if self.snapshot_store is not None:
+            self.snapshot_store.async_save(data)
+        if self.options.adaptive_scan_interval:
+            if self._remove_rf_load_plan is None:
+                # The adaptive scan interval needs the RF load
+                self._remove_rf_load_plan = self.poll_plan.async_add(
+                    data.bridge_key,
+                    AiriosBridgeProperty.RF_LOAD_CURRENT_HOUR,
+                    PollTier.SLOW,
+                )
+            if self.data is not None:
+                self._adapt_update_interval(self.data, data, cycle)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Poll cycle took %.3fs, %s transactions",
+                cycle.duration,
+                cycle.transactions,
+            )
+            _LOGGER.debug(
+                "Poll load of %s bridges: %.1f%% of the time polling",
+                self.poll_budget.bridges,
+                self.poll_budget.duty_cycle * 100,
+            )
+            for priority, stats in self.scheduler.stats.items():
+                _LOGGER.debug(
+                    "Bus %s: requests=%s, average wait=%.3fs, max wait=%.3fs",
+                    priority.name,
+                    stats.requests,
+                    stats.average_wait,
+                    stats.max_wait,
+                )
+        return data
@@ -0,0 +1,89 @@
+"""Diagnostics support for the Airios integration."""
+
+from __future__ import annotations
+
+import dataclasses
+import time
+import typing
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_HOST
+
+if typing.TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from . import AiriosConfigEntry
+    from .coordinator import AiriosDataUpdateCoordinator
+
+TO_REDACT = {CONF_HOST}
+
+
+def _frames(coordinator: AiriosDataUpdateCoordinator) -> dict[int, dict[str, Any]]:
+    """Return the Modbus frames sent to each node over the recorded cycles."""
+    frames: dict[int, list[int]] = {}
+    for cycle in coordinator.poll_cycles:
+        for modbus_address, count in cycle.node_frames.items():
+            frames.setdefault(modbus_address, []).append(count)
+    return {
+        modbus_address: {
+            "last": counts[-1],
+            "mean": sum(counts) / len(counts),
+            "max": max(counts),
+            # Block reads planned for the properties polled on every cycle
+            "fast_poll": coordinator.fast_poll_frames(modbus_address),
+        }
+        for modbus_address, counts in frames.items()
+    }
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant,  # noqa: ARG001 # pylint: disable=unused-argument
+    entry: AiriosConfigEntry,
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = entry.runtime_data
+    connection = coordinator.connection
+    now = time.monotonic()
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "nodes": {
+            modbus_address: len(node)
+            for modbus_address, node in coordinator.data.nodes.items()
+        },
+        "poll": {
+            "update_interval": coordinator.update_interval,
+            "errors": coordinator.poll_errors,
+            "cycles": [dataclasses.asdict(cycle) for cycle in coordinator.poll_cycles],
+        },
+        "frames": _frames(coordinator),
+        "node_slots": {
+            modbus_address: {
+                "failures": slot.failures,
+                "last_error": slot.last_error,
+                "retry_in": max(0.0, slot.retry_at - now),
+            }
+            for modbus_address, slot in coordinator.node_slots.items()
+        },
+        "poll_budget": {
+            "bridges": coordinator.poll_budget.bridges,
+            "cycles": coordinator.poll_budget.cycles,
+            "transactions": coordinator.poll_budget.transactions,
+            "duty_cycle": coordinator.poll_budget.duty_cycle,
+        },
+        "bus": {
+            "max_queue_depth": coordinator.scheduler.max_queue_depth,
+            "wait": {
+                priority.name.casefold(): dataclasses.asdict(stats)
+                for priority, stats in coordinator.scheduler.stats.items()
+            },
+        },
+        "skipped_state_writes": coordinator.skipped_state_writes,
+        "connection": None
+        if connection is None
+        else {"state": connection.state, "reconnects": connection.reconnects},
+    }
@@ -5,19 +5,23 @@ from __future__ import annotations
 import logging
 import typing
 from dataclasses import dataclass
+from typing import Any
 
 from homeassistant.const import CONF_ADDRESS
-from homeassistant.exceptions import ConfigEntryNotReady, PlatformNotReady
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.core import callback
+from homeassistant.exceptions import PlatformNotReady
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from pyairios.properties import AiriosBaseProperty, AiriosDeviceProperty
 
-from .const import DEFAULT_NAME, DOMAIN
-from .coordinator import AiriosDataUpdateCoordinator
+from .const import PollTier
+from .coordinator import AiriosDataUpdateCoordinator, age_seconds
+from .scheduler import BusPriority
 
 if typing.TYPE_CHECKING:
+    from collections.abc import Mapping
+    from contextlib import AbstractAsyncContextManager
+
     from homeassistant.config_entries import ConfigEntry, ConfigSubentry
-    from pyairios import Airios
+    from pyairios.properties import AiriosBaseProperty
     from pyairios.registers import Result, ResultStatus
 
 
@@ -29,12 +33,16 @@ class AiriosEntityDescription:
     """Base class for Airios entities descriptions."""
 
     ap: AiriosBaseProperty
+    poll_tier: PollTier = PollTier.FAST
 
 
 def find_matching_subentry(
     entry: ConfigEntry, modbus_address: int
 ) -> ConfigSubentry | None:
     """Find matching subentry for entities."""
+    coordinator = getattr(entry, "runtime_data", None)
+    if isinstance(coordinator, AiriosDataUpdateCoordinator):
+        return coordinator.subentries.async_get(entry, modbus_address)
     for se in entry.subentries.values():
         if se.data[CONF_ADDRESS] == modbus_address:
             return se
@@ -47,112 +55,135 @@ class AiriosEntity(CoordinatorEntity[AiriosDataUpdateCoordinator]):
     _attr_has_entity_name = True
     _unavailable_logged: bool = False
 
+    _last_state_fingerprint: tuple[Any, ...] | None = None
+    _last_result_status: tuple[Any, Any, Any] | None = None
+    # The age of the value is above the configured bound
+    _value_stale: bool = False
+    skipped_state_writes: int = 0
+
     rf_address: int
     modbus_address: int
+    # Formatted RF address, for the logs
+    node_id: str
+    # Property of the entity description, resolved once
+    _ap: AiriosBaseProperty | None = None
 
-    def __init__(
+    def __init__(  # pylint: disable=unused-argument
         self,
         key: str,
         coordinator: AiriosDataUpdateCoordinator,
         modbus_address: int,
-        subentry: ConfigSubentry | None,
+        subentry: ConfigSubentry | None,  # noqa: ARG002
     ) -> None:
-        """Initialize the entity."""
-        super().__init__(coordinator)
+        """Initialize the entity, the subentry name is in the device identity."""
+        # The node is the listener context, narrowed to the property when added
+        super().__init__(coordinator, context=modbus_address)
 
         self.modbus_address = modbus_address
 
-        data = coordinator.data.nodes[modbus_address]
-
-        if AiriosDeviceProperty.RF_ADDRESS not in data:
-            msg = "Node RF address not available"
-            raise PlatformNotReady(msg)
-        self.rf_address = data[AiriosDeviceProperty.RF_ADDRESS].value
-
-        if AiriosDeviceProperty.PRODUCT_NAME not in data:
-            msg = "Node product name not available"
-            raise PlatformNotReady(msg)
-        product_name = data[AiriosDeviceProperty.PRODUCT_NAME].value
-
-        if AiriosDeviceProperty.PRODUCT_ID not in data:
-            msg = "Node product ID not available"
-            raise PlatformNotReady(msg)
-        product_id = data[AiriosDeviceProperty.PRODUCT_ID].value
-
-        if AiriosDeviceProperty.SOFTWARE_VERSION not in data:
-            msg = "Node software version not available"
-            raise PlatformNotReady(msg)
-        sw_version = data[AiriosDeviceProperty.SOFTWARE_VERSION].value
-
-        if self.coordinator.config_entry is None:
-            msg = "Unexpected error, config entry not defined"
+        if (identity := coordinator.identities.get(modbus_address)) is None:
+            msg = "Node identity not available"
             raise PlatformNotReady(msg)
-
-        if not product_name:
-            product_name = f"0x{self.rf_address:06X}"
-
-        if subentry is None:
-            name = product_name
-        else:
-            name = subentry.data.get("name")
-            if name is None:
-                msg = "Failed to get name from subentry"
-                raise ConfigEntryNotReady(msg)
-
-        self._attr_device_info = DeviceInfo(
-            name=name,
-            serial_number=f"0x{self.rf_address:06X}",
-            identifiers={(DOMAIN, str(self.rf_address))},
-            manufacturer=DEFAULT_NAME,
-            model=product_name,
-            model_id=f"0x{product_id:08X}",
-            sw_version=f"0x{sw_version:04X}",
-        )
-
-        if (
-            (r1 := coordinator.data.nodes.get(coordinator.data.bridge_key))
-            and (r2 := r1.get(AiriosDeviceProperty.RF_ADDRESS))
-            and (brdg_rf_address := r2.value)
-            and (brdg_rf_address != self.rf_address)
-        ):
-            self._attr_device_info["via_device"] = (DOMAIN, str(brdg_rf_address))
+        self.rf_address = identity.rf_address
+        self.node_id = f"0x{self.rf_address:08X}"
+        self._attr_device_info = identity.device_info
 
         self._attr_unique_id = f"{self.rf_address}-{key}"
         _LOGGER.debug("Entity %s has unique id %s", key, self._attr_unique_id)
 
-    def api(self) -> Airios:
-        """Return the Airios API."""
-        return self.coordinator.api
+    async def async_added_to_hass(self) -> None:
+        """Add the entity property to the coordinator poll plan."""
+        description = self.entity_description
+        if isinstance(description, AiriosEntityDescription):
+            # Only updated by the coordinator when the property changed
+            self.coordinator_context = (self.modbus_address, description.ap)
+        await super().async_added_to_hass()
+        if isinstance(description, AiriosEntityDescription):
+            self.async_on_remove(
+                self.coordinator.poll_plan.async_add(
+                    self.modbus_address, description.ap, description.poll_tier
+                )
+            )
+            # The coordinator may not update the entity until the value changes
+            if self.coordinator.data is not None:
+                self._handle_coordinator_update()
+
+    @property
+    def available(self) -> bool:
+        """Return if the entity is available, a failing node is unavailable."""
+        return super().available and self.coordinator.node_available(
+            self.modbus_address
+        )
+
+    @property
+    def extra_state_attributes(self) -> Mapping[str, Any] | None:
+        """Return the state attributes, flagging restored or too old values."""
+        # The result status is only kept up to date while it is fetched
+        attributes = None
+        value_stale = False
+        if self.coordinator.status_enabled(self.modbus_address):
+            attributes = super().extra_state_attributes
+            value_stale = self._value_stale
+        if not self.coordinator.stale and not value_stale:
+            return attributes
+        return {**(attributes or {}), "stale": True}
+
+    def bus_slot(
+        self, priority: BusPriority = BusPriority.WRITE
+    ) -> AbstractAsyncContextManager[None]:
+        """Hold the RF bridge bus, user writes take precedence over polling."""
+        return self.coordinator.scheduler.slot(priority)
 
     def set_extra_state_attributes_internal(self, status: ResultStatus) -> None:
         """Set extra state attributes."""
+        max_value_age = self.coordinator.options.max_value_age
+        self._value_stale = bool(max_value_age) and (
+            (age := age_seconds(status)) is not None and age > max_value_age
+        )
+        result_status = (status.age, status.source, status.flags)
+        if result_status == self._last_result_status:
+            return
+        self._last_result_status = result_status
         self._attr_extra_state_attributes = {
             "age": str(status.age),
             "source": str(status.source),
             "flags": str(status.flags),
         }
 
-    def fetch_result(self) -> Result:
-        """Fetch result for entity."""
-        _LOGGER.debug(
-            "Updating node=%s, property=%s",
-            f"{self.rf_address}:08X",
-            self.entity_description.key,
+    @callback
+    def async_write_ha_state_if_changed(self, value: Any) -> None:
+        """Write the state only if value, availability or status changed."""
+        fingerprint = (
+            value,
+            self.available,
+            self._last_result_status,
+            self.coordinator.stale,
+            self.coordinator.status_enabled(self.modbus_address),
+            self._value_stale,
         )
+        if fingerprint == self._last_state_fingerprint:
+            self.skipped_state_writes += 1
+            self.coordinator.skipped_state_writes += 1
+            return
+        self._last_state_fingerprint = fingerprint
+        self.async_write_ha_state()
 
-        if not isinstance(self.entity_description, AiriosEntityDescription):
-            msg = "Expected Airios entity description"
-            raise TypeError(msg)
-
-        ap = typing.cast("AiriosEntityDescription", self.entity_description).ap
-        data = self.coordinator.data.nodes[self.modbus_address]
-        result = data[ap]
-        _LOGGER.debug(
-            "Node=%s, property=%s, result=%s",
-            f"0x{self.rf_address:08X}",
-            self.entity_description.key,
-            result,
-        )
+    def fetch_result(self) -> Result:
+        """Fetch result for entity."""
+        if (ap := self._ap) is None:
+            if not isinstance(self.entity_description, AiriosEntityDescription):
+                msg = "Expected Airios entity description"
+                raise TypeError(msg)
+            ap = self._ap = self.entity_description.ap
+
+        result = self.coordinator.data.nodes[self.modbus_address][ap]
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Node=%s, property=%s, result=%s",
+                self.node_id,
+                self.entity_description.key,
+                result,
+            )
         if result is None or result.value is None:
             msg = f"{self.entity_description.key} result not exists"
             raise ValueError(msg)
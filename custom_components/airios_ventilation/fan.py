@@ -5,7 +5,7 @@ from __future__ import annotations
 import logging
 import typing
 from dataclasses import dataclass
-from typing import Any, final
+from typing import Any
 
 from homeassistant.components.fan import (
     FanEntity,
@@ -14,7 +14,6 @@ from homeassistant.components.fan import (
 )
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import entity_platform
 from pyairios.constants import (
     VMDCapabilities,
     VMDRequestedVentilationSpeed,
@@ -22,7 +21,6 @@ from pyairios.constants import (
 )
 from pyairios.exceptions import AiriosException
 from pyairios.properties import (
-    AiriosDeviceProperty,
     AiriosVMDProperty,
 )
 
@@ -31,16 +29,6 @@ from .entity import (
     AiriosEntityDescription,
     find_matching_subentry,
 )
-from .services import (
-    SERVICE_FILTER_RESET,
-    SERVICE_SCHEMA_SET_PRESET_FAN_SPEED,
-    SERVICE_SCHEMA_SET_PRESET_MODE_DURATION,
-    SERVICE_SET_PRESET_FAN_SPEED_AWAY,
-    SERVICE_SET_PRESET_FAN_SPEED_HIGH,
-    SERVICE_SET_PRESET_FAN_SPEED_LOW,
-    SERVICE_SET_PRESET_FAN_SPEED_MEDIUM,
-    SERVICE_SET_PRESET_MODE_DURATION,
-)
 
 if typing.TYPE_CHECKING:
     from homeassistant.config_entries import ConfigSubentry
@@ -120,38 +108,6 @@ async def async_setup_entry(
         subentry_id = subentry.subentry_id if subentry else None
         async_add_entities(entities, config_subentry_id=subentry_id)
 
-    platform = entity_platform.async_get_current_platform()
-    platform.async_register_entity_service(
-        SERVICE_SET_PRESET_FAN_SPEED_AWAY,
-        SERVICE_SCHEMA_SET_PRESET_FAN_SPEED,
-        "async_set_preset_fan_speed_away",
-    )
-    platform.async_register_entity_service(
-        SERVICE_SET_PRESET_FAN_SPEED_LOW,
-        SERVICE_SCHEMA_SET_PRESET_FAN_SPEED,
-        "async_set_preset_fan_speed_low",
-    )
-    platform.async_register_entity_service(
-        SERVICE_SET_PRESET_FAN_SPEED_MEDIUM,
-        SERVICE_SCHEMA_SET_PRESET_FAN_SPEED,
-        "async_set_preset_fan_speed_low",
-    )
-    platform.async_register_entity_service(
-        SERVICE_SET_PRESET_FAN_SPEED_HIGH,
-        SERVICE_SCHEMA_SET_PRESET_FAN_SPEED,
-        "async_set_preset_fan_speed_low",
-    )
-    platform.async_register_entity_service(
-        SERVICE_SET_PRESET_MODE_DURATION,
-        SERVICE_SCHEMA_SET_PRESET_MODE_DURATION,
-        "async_set_preset_mode_duration",
-    )
-    platform.async_register_entity_service(
-        SERVICE_FILTER_RESET,
-        None,
-        "async_filter_reset",
-    )
-
 
 class AiriosFanEntity(  # pyright: ignore[reportIncompatibleVariableOverride]
     AiriosEntity,
@@ -175,10 +131,10 @@ class AiriosFanEntity(  # pyright: ignore[reportIncompatibleVariableOverride]
         super().__init__(description.key, coordinator, modbus_address, subentry)
         self.entity_description = description  # type: ignore[override]
 
-        data = coordinator.data.nodes[self.modbus_address]
+        identity = coordinator.identities.get(self.modbus_address)
         _LOGGER.info(
             "Fan for node %s@%s capable of %s",
-            data[AiriosDeviceProperty.PRODUCT_NAME],
+            identity.product_name if identity else self.node_id,
             self.modbus_address,
             capabilities,
         )
@@ -234,23 +190,19 @@ class AiriosFanEntity(  # pyright: ignore[reportIncompatibleVariableOverride]
         if preset_mode == self.preset_mode:
             return False
 
-        try:
-            dev = await self.api().node(self.modbus_address)
-            vmd_speed = PRESET_TO_VMD_SPEED[preset_mode]
-
-            # Handle temporary overrides
-            if preset_mode == PRESET_NAMES[VMDVentilationSpeed.OVERRIDE_LOW]:
-                return await dev.set(AiriosVMDProperty.OVERRIDE_TIME_SPEED_LOW, 60)
+        # Handle temporary overrides
+        if preset_mode == PRESET_NAMES[VMDVentilationSpeed.OVERRIDE_LOW]:
+            ap, value = AiriosVMDProperty.OVERRIDE_TIME_SPEED_LOW, 60
+        elif preset_mode == PRESET_NAMES[VMDVentilationSpeed.OVERRIDE_MID]:
+            ap, value = AiriosVMDProperty.OVERRIDE_TIME_SPEED_MID, 60
+        elif preset_mode == PRESET_NAMES[VMDVentilationSpeed.OVERRIDE_HIGH]:
+            ap, value = AiriosVMDProperty.OVERRIDE_TIME_SPEED_HIGH, 60
+        else:
+            ap = AiriosVMDProperty.REQUESTED_VENTILATION_SPEED
+            value = PRESET_TO_VMD_SPEED[preset_mode]
 
-            if preset_mode == PRESET_NAMES[VMDVentilationSpeed.OVERRIDE_MID]:
-                return await dev.set(AiriosVMDProperty.OVERRIDE_TIME_SPEED_MID, 60)
-
-            if preset_mode == PRESET_NAMES[VMDVentilationSpeed.OVERRIDE_HIGH]:
-                return await dev.set(AiriosVMDProperty.OVERRIDE_TIME_SPEED_HIGH, 60)
-
-            return await dev.set(
-                AiriosVMDProperty.REQUESTED_VENTILATION_SPEED, vmd_speed
-            )
+        try:
+            return await self.coordinator.async_write(self.modbus_address, ap, value)
         except AiriosException as ex:
             msg = f"Failed to set preset {preset_mode}"
             raise HomeAssistantError(msg) from ex
@@ -270,21 +222,15 @@ class AiriosFanEntity(  # pyright: ignore[reportIncompatibleVariableOverride]
         **kwargs: Any,  # noqa: ARG002 # pylint: disable=unused-argument
     ) -> None:
         """Turn on the fan."""
-        update_needed = await self._turn_on_internal(percentage, preset_mode)
-        if update_needed:
-            await self.coordinator.async_request_refresh()
+        await self._turn_on_internal(percentage, preset_mode)
 
     async def async_turn_off(self, **kwargs: Any) -> None:  # noqa: ARG002 # pylint: disable=unused-argument
         """Turn off the fan."""
-        update_needed = await self._turn_off_internal()
-        if update_needed:
-            await self.coordinator.async_request_refresh()
+        await self._turn_off_internal()
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set new preset mode."""
-        update_needed = await self._set_preset_mode_internal(preset_mode)
-        if update_needed:
-            await self.coordinator.async_request_refresh()
+        await self._set_preset_mode_internal(preset_mode)
 
     @callback
     def _handle_coordinator_update(self) -> None:
@@ -298,7 +244,7 @@ class AiriosFanEntity(  # pyright: ignore[reportIncompatibleVariableOverride]
         except (TypeError, ValueError) as ex:
             _LOGGER.info(
                 "Failed to update fan entity for node=%s, property=%s: %s",
-                f"0x{self.rf_address:08X}",
+                self.node_id,
                 self.entity_description.key,
                 ex,
             )
@@ -309,219 +255,8 @@ class AiriosFanEntity(  # pyright: ignore[reportIncompatibleVariableOverride]
             elif not self._unavailable_logged:
                 _LOGGER.info(
                     "Node %s fan %s is unavailable",
-                    f"0x{self.rf_address:08X}",
+                    self.node_id,
                     self.entity_description.key,
                 )
                 self._unavailable_logged = True
-            self.async_write_ha_state()
-
-    @final
-    async def async_set_preset_fan_speed_away(
-        self,
-        supply_fan_speed: int,
-        exhaust_fan_speed: int,
-    ) -> bool:
-        """Set the fans speeds for the away preset mode."""
-        dev = await self.api().node(self.modbus_address)
-        data = self.coordinator.data.nodes[self.modbus_address]
-        if (
-            AiriosVMDProperty.FAN_SPEED_AWAY_SUPPLY,
-            AiriosVMDProperty.FAN_SPEED_AWAY_EXHAUST,
-        ) not in data:
-            msg = f"Property not supported by device {dev!s}."
-            raise HomeAssistantError(msg)
-        msg = (
-            "Setting fans speeds for away preset on node "
-            f"{dev} to: supply={supply_fan_speed}%%, exhaust={exhaust_fan_speed}%%"
-        )
-        _LOGGER.info(msg)
-        try:
-            if not await dev.set(
-                AiriosVMDProperty.FAN_SPEED_AWAY_SUPPLY, supply_fan_speed
-            ):
-                msg = f"Failed to set supply fan speed to {supply_fan_speed}"
-                raise HomeAssistantError(msg)
-            if not await dev.set(
-                AiriosVMDProperty.FAN_SPEED_AWAY_EXHAUST, exhaust_fan_speed
-            ):
-                msg = f"Failed to set exhaust fan speed to {exhaust_fan_speed}"
-                raise HomeAssistantError(msg)
-        except AiriosException as ex:
-            msg = f"Failed to set fan speeds: {ex}"
-            raise HomeAssistantError(msg) from ex
-        return True
-
-    @final
-    async def async_set_preset_fan_speed_low(
-        self,
-        supply_fan_speed: int,
-        exhaust_fan_speed: int,
-    ) -> bool:
-        """Set the fans speeds for the low preset mode."""
-        dev = await self.api().node(self.modbus_address)
-        data = self.coordinator.data.nodes[self.modbus_address]
-        if (
-            AiriosVMDProperty.FAN_SPEED_LOW_SUPPLY,
-            AiriosVMDProperty.FAN_SPEED_LOW_EXHAUST,
-        ) not in data:
-            msg = f"Property not supported by device {dev!s}."
-            raise HomeAssistantError(msg)
-        infomsg = (
-            "Setting fans speeds for low preset on node "
-            f"{dev} to: supply={supply_fan_speed}%%, exhaust={exhaust_fan_speed}%%",
-        )
-        _LOGGER.info(infomsg)
-        try:
-            if not await dev.set(
-                AiriosVMDProperty.FAN_SPEED_LOW_SUPPLY, supply_fan_speed
-            ):
-                msg = f"Failed to set supply fan speed to {supply_fan_speed}"
-                raise HomeAssistantError(msg)
-            if not await dev.set(
-                AiriosVMDProperty.FAN_SPEED_LOW_EXHAUST, exhaust_fan_speed
-            ):
-                msg = f"Failed to set exhaust fan speed to {supply_fan_speed}"
-                raise HomeAssistantError(msg)
-        except AiriosException as ex:
-            msg = f"Failed to set fan speeds: {ex}"
-            raise HomeAssistantError(msg) from ex
-        return True
-
-    @final
-    async def async_set_preset_fan_speed_medium(
-        self,
-        supply_fan_speed: int,
-        exhaust_fan_speed: int,
-    ) -> bool:
-        """Set the fans speeds for the medium preset mode."""
-        dev = await self.api().node(self.modbus_address)
-        data = self.coordinator.data.nodes[self.modbus_address]
-        if (
-            AiriosVMDProperty.FAN_SPEED_MID_SUPPLY,
-            AiriosVMDProperty.FAN_SPEED_MID_EXHAUST,
-        ) not in data:
-            msg = f"Property not supported by device {dev!s}."
-            raise HomeAssistantError(msg)
-        infomsg = (
-            "Setting fans speeds for medium preset on node "
-            f"{dev} to: supply={supply_fan_speed}%%, exhaust={exhaust_fan_speed}%%",
-        )
-        _LOGGER.info(infomsg)
-        try:
-            if not await dev.set(
-                AiriosVMDProperty.FAN_SPEED_MID_SUPPLY, supply_fan_speed
-            ):
-                msg = f"Failed to set supply fan speed to {supply_fan_speed}"
-                raise HomeAssistantError(msg)
-            if not await dev.set(
-                AiriosVMDProperty.FAN_SPEED_MID_EXHAUST, exhaust_fan_speed
-            ):
-                msg = f"Failed to set exhaust fan speed to {supply_fan_speed}"
-                raise HomeAssistantError(msg)
-        except AiriosException as ex:
-            msg = f"Failed to set fan speeds: {ex}"
-            raise HomeAssistantError(msg) from ex
-        return True
-
-    @final
-    async def async_set_preset_fan_speed_high(
-        self,
-        supply_fan_speed: int,
-        exhaust_fan_speed: int,
-    ) -> bool:
-        """Set the fans speeds for the high preset mode."""
-        dev = await self.api().node(self.modbus_address)
-        data = self.coordinator.data.nodes[self.modbus_address]
-        if (
-            AiriosVMDProperty.FAN_SPEED_HIGH_SUPPLY,
-            AiriosVMDProperty.FAN_SPEED_HIGH_EXHAUST,
-        ) not in data:
-            msg = f"Property not supported by device {dev!s}."
-            raise HomeAssistantError(msg)
-
-        infomsg = (
-            "Setting fans speeds for high preset on node "
-            f"{dev} to: supply={supply_fan_speed}%%, exhaust={exhaust_fan_speed}%%",
-        )
-        _LOGGER.info(infomsg)
-        try:
-            dev = await self.api().node(self.modbus_address)
-            if not await dev.set(
-                AiriosVMDProperty.FAN_SPEED_HIGH_SUPPLY, supply_fan_speed
-            ):
-                msg = f"Failed to set supply fan speed to {supply_fan_speed}"
-                raise HomeAssistantError(msg)
-            if not await dev.set(
-                AiriosVMDProperty.FAN_SPEED_HIGH_EXHAUST, exhaust_fan_speed
-            ):
-                msg = f"Failed to set exhaust fan speed to {supply_fan_speed}"
-                raise HomeAssistantError(msg)
-        except AiriosException as ex:
-            msg = f"Failed to set fan speeds: {ex}"
-            raise HomeAssistantError(msg) from ex
-        return True
-
-    @final
-    async def async_set_preset_mode_duration(
-        self, preset_mode: str, preset_override_time: int
-    ) -> bool:
-        """Set the preset mode for a limited time."""
-        dev = await self.api().node(self.modbus_address)
-        data = self.coordinator.data.nodes[self.modbus_address]
-        if (
-            AiriosVMDProperty.REQUESTED_VENTILATION_SPEED,
-            AiriosVMDProperty.CAPABILITIES,
-        ) not in data:
-            msg = f"Property not supported by device {dev!s}."
-            raise HomeAssistantError(msg)
-
-        caps = data[AiriosVMDProperty.CAPABILITIES].value
-        if VMDCapabilities.TIMER_CAPABLE not in caps:
-            msg = f"Device {dev!s} does not support preset temporary override"
-            raise HomeAssistantError(msg)
-
-        vmd_speed = PRESET_TO_VMD_SPEED[preset_mode]
-        _LOGGER.info(
-            "Setting preset mode on node %s to: %s for %s minutes",
-            str(dev),
-            vmd_speed,
-            preset_override_time,
-        )
-        try:
-            if preset_mode == PRESET_NAMES[VMDVentilationSpeed.LOW]:
-                return await dev.set(
-                    AiriosVMDProperty.OVERRIDE_TIME_SPEED_LOW, preset_override_time
-                )
-            if preset_mode == PRESET_NAMES[VMDVentilationSpeed.MID]:
-                return await dev.set(
-                    AiriosVMDProperty.OVERRIDE_TIME_SPEED_MID, preset_override_time
-                )
-            if preset_mode == PRESET_NAMES[VMDVentilationSpeed.HIGH]:
-                return await dev.set(
-                    AiriosVMDProperty.OVERRIDE_TIME_SPEED_HIGH, preset_override_time
-                )
-            msg = f"Temporary override not available for preset [{preset_mode}]"
-            raise HomeAssistantError(msg)
-        except AiriosException as ex:
-            msg = f"Failed to set temporary preset override: {ex}"
-            raise HomeAssistantError(msg) from ex
-
-    @final
-    async def async_filter_reset(self) -> bool:
-        """Reset the filter dirty flag."""
-        dev = await self.api().node(self.modbus_address)
-        data = self.coordinator.data.nodes[self.modbus_address]
-        ap = AiriosVMDProperty.FILTER_RESET
-        if ap not in data:
-            msg = f"Property {ap.name} not supported by device {dev!s}."
-            raise HomeAssistantError(msg)
-
-        _LOGGER.info("Reset filter dirty flag for node %s", str(dev))
-        try:
-            if not await dev.set(AiriosVMDProperty.FILTER_RESET, 0):
-                msg = "Failed to reset filter dirty flag"
-                raise HomeAssistantError(msg)
-        except AiriosException as ex:
-            msg = f"Failed to reset filter dirty flag: {ex}"
-            raise HomeAssistantError(msg) from ex
-        return True
+            self.async_write_ha_state_if_changed(self._attr_preset_mode)
@@ -0,0 +1,171 @@
+"""Device identity index for the Airios integration."""
+
+from __future__ import annotations
+
+import logging
+import typing
+from dataclasses import dataclass
+
+from homeassistant.const import CONF_ADDRESS, CONF_NAME
+from homeassistant.core import callback
+from homeassistant.helpers.device_registry import DeviceInfo
+from pyairios.properties import AiriosDeviceProperty
+
+from .const import DEFAULT_NAME, DOMAIN
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from homeassistant.config_entries import ConfigEntry, ConfigSubentry
+    from homeassistant.helpers.device_registry import DeviceEntry
+    from pyairios.data_model import AiriosData, AiriosDeviceData
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, kw_only=True)
+class AiriosDeviceIdentity:
+    """Identity of the bridge or of a bound node."""
+
+    modbus_address: int
+    rf_address: int
+    product_id: int
+    product_name: str
+    sw_version: int
+    device_info: DeviceInfo
+
+
+def _identity(
+    modbus_address: int,
+    node: AiriosDeviceData,
+    subentry_name: str | None,
+    bridge_rf_address: int | None,
+) -> AiriosDeviceIdentity | None:
+    """Build the identity of a node, None if the node data is incomplete."""
+    try:
+        rf_address = node[AiriosDeviceProperty.RF_ADDRESS].value
+        product_id = node[AiriosDeviceProperty.PRODUCT_ID].value
+        product_name = node[AiriosDeviceProperty.PRODUCT_NAME].value
+        sw_version = node[AiriosDeviceProperty.SOFTWARE_VERSION].value
+    except KeyError as err:
+        _LOGGER.debug("Node %s identity not available: %s", modbus_address, err)
+        return None
+
+    if not product_name:
+        product_name = f"0x{rf_address:06X}"
+    device_info = DeviceInfo(
+        name=subentry_name or product_name,
+        serial_number=f"0x{rf_address:06X}",
+        identifiers={(DOMAIN, str(rf_address))},
+        manufacturer=DEFAULT_NAME,
+        model=product_name,
+        model_id=f"0x{product_id:08X}",
+        sw_version=f"0x{sw_version:04X}",
+    )
+    if bridge_rf_address is not None and bridge_rf_address != rf_address:
+        device_info["via_device"] = (DOMAIN, str(bridge_rf_address))
+
+    return AiriosDeviceIdentity(
+        modbus_address=modbus_address,
+        rf_address=rf_address,
+        product_id=product_id,
+        product_name=product_name,
+        sw_version=sw_version,
+        device_info=device_info,
+    )
+
+
+class AiriosSubentryIndex:
+    """
+    The subentries of a config entry by node modbus address.
+
+    Rebuilt when the subentries of the entry are replaced, which Home Assistant
+    does when a subentry is added, updated or removed, or when invalidated.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._source: Mapping[str, ConfigSubentry] | None = None
+        self._by_modbus_address: dict[int, ConfigSubentry] = {}
+
+    @callback
+    def async_invalidate(self) -> None:
+        """Rebuild the index on the next lookup."""
+        self._source = None
+
+    @callback
+    def async_get(
+        self, entry: ConfigEntry, modbus_address: int
+    ) -> ConfigSubentry | None:
+        """Return the subentry of a node."""
+        if self._source is not entry.subentries:
+            self._source = entry.subentries
+            self._by_modbus_address = {
+                se.data[CONF_ADDRESS]: se for se in entry.subentries.values()
+            }
+        return self._by_modbus_address.get(modbus_address)
+
+
+class AiriosIdentityIndex:
+    """
+    Identity of the bridge and its bound nodes.
+
+    Built from the data of a full read of the bus, and kept until the firmware
+    or the bindings change, so the entities and the services find the device
+    info and addresses in memory.
+    """
+
+    def __init__(self, subentries: AiriosSubentryIndex) -> None:
+        """Initialize an empty index."""
+        self._subentries = subentries
+        self.bridge: AiriosDeviceIdentity | None = None
+        self._by_modbus_address: dict[int, AiriosDeviceIdentity] = {}
+        self._by_rf_address: dict[int, AiriosDeviceIdentity] = {}
+        self._by_device_id: dict[str, AiriosDeviceIdentity] = {}
+
+    @callback
+    def async_update(self, entry: ConfigEntry, data: AiriosData) -> None:
+        """Update the index from the data of a full read."""
+        bridge = data.nodes.get(data.bridge_key)
+        bridge_rf_address = None
+        if bridge is not None and AiriosDeviceProperty.RF_ADDRESS in bridge:
+            bridge_rf_address = bridge[AiriosDeviceProperty.RF_ADDRESS].value
+
+        identities: dict[int, AiriosDeviceIdentity] = {}
+        for modbus_address, node in data.nodes.items():
+            subentry = self._subentries.async_get(entry, modbus_address)
+            identity = _identity(
+                modbus_address,
+                node,
+                subentry.data.get(CONF_NAME) if subentry else None,
+                bridge_rf_address,
+            )
+            if identity is None:
+                continue
+            identities[modbus_address] = identity
+
+        if identities == self._by_modbus_address:
+            return
+        _LOGGER.debug("Updating the identity of %s devices", len(identities))
+        self._by_modbus_address = identities
+        self._by_rf_address = {i.rf_address: i for i in identities.values()}
+        # Device ids are resolved again on demand
+        self._by_device_id = {}
+        self.bridge = identities.get(data.bridge_key)
+
+    def get(self, modbus_address: int) -> AiriosDeviceIdentity | None:
+        """Return the identity of a node by modbus address."""
+        return self._by_modbus_address.get(modbus_address)
+
+    @callback
+    def async_by_device(self, device: DeviceEntry) -> AiriosDeviceIdentity | None:
+        """Return the identity of the node of a Home Assistant device."""
+        if (identity := self._by_device_id.get(device.id)) is not None:
+            return identity
+        for domain, identifier in device.identifiers:
+            if domain == DOMAIN and (
+                identity := self._by_rf_address.get(int(identifier))
+            ):
+                self._by_device_id[device.id] = identity
+                return identity
+        return None
@@ -20,6 +20,7 @@ from homeassistant.const import (
 from homeassistant.core import HomeAssistant, callback
 from pyairios.properties import AiriosVMDProperty
 
+from .const import PollTier
 from .entity import (
     AiriosEntity,
     AiriosEntityDescription,
@@ -79,6 +80,7 @@ NUMBER_ENTITIES: tuple[AiriosNumberEntityDescription, ...] = (
         ap=AiriosVMDProperty.PREHEATER_SETPOINT,
         key=AiriosVMDProperty.PREHEATER_SETPOINT.name.casefold(),
         translation_key="preheater_setpoint",
+        poll_tier=PollTier.SLOW,
         native_min_value=-20.0,
         native_max_value=50.0,
         device_class=NumberDeviceClass.TEMPERATURE,
@@ -92,6 +94,7 @@ NUMBER_ENTITIES: tuple[AiriosNumberEntityDescription, ...] = (
         ap=AiriosVMDProperty.FROST_PROTECTION_PREHEATER_SETPOINT,
         key=AiriosVMDProperty.FROST_PROTECTION_PREHEATER_SETPOINT.name.casefold(),
         translation_key="frost_protection_preheater_setpoint",
+        poll_tier=PollTier.SLOW,
         native_min_value=-20.0,
         native_max_value=50.0,
         device_class=NumberDeviceClass.TEMPERATURE,
@@ -105,6 +108,7 @@ NUMBER_ENTITIES: tuple[AiriosNumberEntityDescription, ...] = (
         ap=AiriosVMDProperty.FREE_VENTILATION_HEATING_SETPOINT,
         key=AiriosVMDProperty.FREE_VENTILATION_HEATING_SETPOINT.name.casefold(),
         translation_key="free_ventilation_setpoint",
+        poll_tier=PollTier.SLOW,
         native_min_value=0.0,
         native_max_value=30.0,
         device_class=NumberDeviceClass.TEMPERATURE,
@@ -118,6 +122,7 @@ NUMBER_ENTITIES: tuple[AiriosNumberEntityDescription, ...] = (
         ap=AiriosVMDProperty.FREE_VENTILATION_COOLING_OFFSET,
         key=AiriosVMDProperty.FREE_VENTILATION_COOLING_OFFSET.name.casefold(),
         translation_key="free_ventilation_cooling_offset",
+        poll_tier=PollTier.SLOW,
         native_min_value=1.0,
         native_max_value=10.0,
         native_step=1.0,
@@ -130,6 +135,7 @@ NUMBER_ENTITIES: tuple[AiriosNumberEntityDescription, ...] = (
         ap=AiriosVMDProperty.CO2_CONTROL_SETPOINT,
         key=AiriosVMDProperty.CO2_CONTROL_SETPOINT.name.casefold(),
         translation_key="co2_setpoint",
+        poll_tier=PollTier.SLOW,
         native_min_value=400,
         native_max_value=2300,
         native_unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION,
@@ -183,14 +189,16 @@ class AiriosNumberEntity(  # pyright: ignore[reportIncompatibleVariableOverride]
     async def _set_value_internal(self, value: float) -> bool:
         if self.entity_description.set_value_fn is None:
             raise NotImplementedError
-        dev = await self.api().node(self.modbus_address)
-        return await self.entity_description.set_value_fn(dev, value)
+        return await self.coordinator.async_write(
+            self.modbus_address,
+            self.entity_description.ap,
+            value,
+            self.entity_description.set_value_fn,
+        )
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
-        update_needed = await self._set_value_internal(value)
-        if update_needed:
-            await self.coordinator.async_request_refresh()
+        await self._set_value_internal(value)
 
     @callback
     def _handle_coordinator_update(self) -> None:
@@ -204,11 +212,11 @@ class AiriosNumberEntity(  # pyright: ignore[reportIncompatibleVariableOverride]
         except (TypeError, ValueError) as ex:
             _LOGGER.info(
                 "Failed to update number entity for node=%s, property=%s: %s",
-                f"0x{self.rf_address:06X}",
+                self.node_id,
                 self.entity_description.key,
                 ex,
             )
             self._attr_current_option = None
             self._attr_available = False
         finally:
-            self.async_write_ha_state()
+            self.async_write_ha_state_if_changed(self._attr_native_value)
@@ -0,0 +1,160 @@
+"""Transports shared by the config entries and the flows of the Airios integration."""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import typing
+from dataclasses import dataclass, field
+
+from homeassistant.core import callback
+from homeassistant.util.hass_dict import HassKey
+from pyairios import Airios
+from pyairios.client import (
+    AiriosRtuTransport,
+    AiriosTcpTransport,
+    AsyncAiriosModbusClient,
+    AsyncAiriosModbusRtuClient,
+    AsyncAiriosModbusTcpClient,
+)
+from pyairios.exceptions import AiriosException
+from pyairios.models.brdg_02r13 import BRDG02R13
+
+from .const import DOMAIN
+from .scheduler import AiriosBusScheduler
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from homeassistant.core import HomeAssistant
+    from pyairios.client import AiriosBaseTransport
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_TRANSPORT_POOL: HassKey[AiriosTransportPool] = HassKey(f"{DOMAIN}_transports")
+
+
+def _modbus_client(transport: AiriosBaseTransport) -> AsyncAiriosModbusClient:
+    """Return the Modbus client of a transport, not connected yet."""
+    if isinstance(transport, AiriosTcpTransport):
+        return AsyncAiriosModbusTcpClient(transport)
+    if isinstance(transport, AiriosRtuTransport):
+        return AsyncAiriosModbusRtuClient(transport)
+    msg = f"Unknown transport {transport}"
+    raise AiriosException(msg)
+
+
+class _AiriosPooledApi(Airios):
+    """The API of a RF bridge on the Modbus client of a pooled transport."""
+
+    def __init__(  # pylint: disable=super-init-not-called
+        self, client: AsyncAiriosModbusClient, modbus_address: int
+    ) -> None:
+        """Initialize the API without opening a client of its own."""
+        self._client = client
+        self.bridge = BRDG02R13(modbus_address, client)
+
+
+@dataclass
+class AiriosPooledTransport:
+    """A transport to a serial port or a TCP gateway, with its bus scheduler."""
+
+    key: str
+    transport: AiriosBaseTransport
+    # Opens the transport again once it is closed
+    factory: Callable[[], AiriosBaseTransport]
+    # One connection for all the bridges behind the transport
+    client: AsyncAiriosModbusClient
+    # Serializes the requests of all the holders
+    scheduler: AiriosBusScheduler = field(default_factory=AiriosBusScheduler)
+    holders: int = 0
+    _apis: dict[int, Airios] = field(default_factory=dict)
+
+    def api(self, modbus_address: int) -> Airios:
+        """Return the API of the RF bridge at a Modbus address."""
+        if (api := self._apis.get(modbus_address)) is None:
+            api = self._apis[modbus_address] = _AiriosPooledApi(
+                self.client, modbus_address
+            )
+        return api
+
+    def close(self) -> None:
+        """Close the transport."""
+        self.client.close()
+
+
+class AiriosTransportPool:
+    """
+    Transports by serial port or TCP gateway address.
+
+    A serial port can only be opened once, and the gateway accepts a limited
+    number of connections. The config entries and the flows talking to the
+    same device share its transport, which is closed when the last holder
+    releases it.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty pool."""
+        self._transports: dict[str, AiriosPooledTransport] = {}
+
+    @callback
+    def _async_acquire(
+        self, key: str, factory: Callable[[], AiriosBaseTransport]
+    ) -> AiriosPooledTransport:
+        if (pooled := self._transports.get(key)) is None:
+            _LOGGER.debug("Opening transport %s", key)
+            transport = factory()
+            pooled = self._transports[key] = AiriosPooledTransport(
+                key, transport, factory, _modbus_client(transport)
+            )
+        pooled.holders += 1
+        return pooled
+
+    @callback
+    def async_acquire_serial(self, device: str) -> AiriosPooledTransport:
+        """Return the transport of a serial port, release it when done."""
+        return self._async_acquire(device, lambda: AiriosRtuTransport(device))
+
+    @callback
+    def async_acquire_network(self, host: str, port: int) -> AiriosPooledTransport:
+        """Return the transport of a TCP gateway, release it when done."""
+        return self._async_acquire(
+            f"{host}:{port}", lambda: AiriosTcpTransport(host, port)
+        )
+
+    @callback
+    def async_release(self, pooled: AiriosPooledTransport) -> None:
+        """Release a transport, closing it if it has no holders left."""
+        pooled.holders -= 1
+        if pooled.holders > 0:
+            return
+        _LOGGER.debug("Closing transport %s", pooled.key)
+        self._transports.pop(pooled.key, None)
+        pooled.close()
+
+    @callback
+    def async_reacquire(self, pooled: AiriosPooledTransport) -> AiriosPooledTransport:
+        """
+        Release a transport and acquire it again.
+
+        The transport is closed and a new one opened if there were no other
+        holders. Otherwise they keep using it, and so does the caller.
+        """
+        self.async_release(pooled)
+        return self._async_acquire(pooled.key, pooled.factory)
+
+    @contextlib.contextmanager
+    def borrow(self, pooled: AiriosPooledTransport) -> Iterator[AiriosPooledTransport]:
+        """Release an acquired transport when leaving the context."""
+        try:
+            yield pooled
+        finally:
+            self.async_release(pooled)
+
+
+@callback
+def async_get_transport_pool(hass: HomeAssistant) -> AiriosTransportPool:
+    """Return the transport pool of the integration."""
+    if DATA_TRANSPORT_POOL not in hass.data:
+        hass.data[DATA_TRANSPORT_POOL] = AiriosTransportPool()
+    return hass.data[DATA_TRANSPORT_POOL]
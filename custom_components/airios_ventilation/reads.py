@@ -0,0 +1,140 @@
+"""Read planning for the Airios integration."""
+
+from __future__ import annotations
+
+import logging
+import typing
+from dataclasses import dataclass, field
+
+from pyairios.exceptions import AiriosAcknowledgeException
+from pyairios.registers import RegisterAccess, Result
+
+from .const import MAX_READ_REGISTERS
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from pyairios.data_model import AiriosDeviceData
+    from pyairios.device import AiriosDevice
+    from pyairios.properties import AiriosBaseProperty
+    from pyairios.registers import RegisterBase
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class AiriosNodeRead:
+    """The results of a node read, and the Modbus requests it took."""
+
+    results: AiriosDeviceData = field(default_factory=dict)
+    frames: int = 0
+
+
+def _plan(
+    dev: AiriosDevice,
+    properties: Iterable[AiriosBaseProperty],
+    *,
+    with_status: bool,
+) -> tuple[list[RegisterBase], list[list[RegisterBase]]]:
+    """
+    Plan the reads of node properties.
+
+    Return the registers read one by one with their result status, and the
+    blocks of the other registers.
+    """
+    registers = [
+        reg
+        for ap in properties
+        if (reg := dev.regmap.get(ap)) is not None
+        and RegisterAccess.READ in reg.description.access
+    ]
+    registers.sort(key=lambda reg: reg.description.address)
+    status_registers: list[RegisterBase] = []
+    block_registers: list[RegisterBase] = []
+    for reg in registers:
+        if with_status and RegisterAccess.STATUS in reg.description.access:
+            status_registers.append(reg)
+        else:
+            block_registers.append(reg)
+    return status_registers, plan_block_reads(block_registers)
+
+
+def plan_block_reads(registers: Iterable[RegisterBase]) -> list[list[RegisterBase]]:
+    """
+    Group registers sorted by address into block reads.
+
+    Registers at consecutive addresses are read with a single request, up to
+    MAX_READ_REGISTERS registers. A gap in the addresses starts a new block,
+    as the bridge rejects reads of unmapped registers.
+    """
+    blocks: list[list[RegisterBase]] = []
+    block_end = -1
+    block_length = 0
+    for reg in registers:
+        description = reg.description
+        if (
+            blocks
+            and description.address == block_end
+            and block_length + description.length <= MAX_READ_REGISTERS
+        ):
+            blocks[-1].append(reg)
+            block_length += description.length
+        else:
+            blocks.append([reg])
+            block_length = description.length
+        block_end = description.address + description.length
+    return blocks
+
+
+def planned_frames(
+    dev: AiriosDevice,
+    properties: Iterable[AiriosBaseProperty],
+    *,
+    with_status: bool,
+) -> int:
+    """Return the Modbus requests a read of node properties takes."""
+    status_registers, blocks = _plan(dev, properties, with_status=with_status)
+    # The value and its status are separate requests
+    return 2 * len(status_registers) + len(blocks)
+
+
+async def async_read_properties(
+    dev: AiriosDevice,
+    properties: Iterable[AiriosBaseProperty],
+    *,
+    with_status: bool,
+) -> AiriosNodeRead:
+    """
+    Read node properties with the fewest Modbus requests.
+
+    The values are read in blocks of consecutive registers. The result status
+    has its own register, so the properties that have one are read one by one
+    when it is wanted. Properties the node does not acknowledge are left out.
+    """
+    read = AiriosNodeRead()
+    status_registers, blocks = _plan(dev, properties, with_status=with_status)
+    for reg in status_registers:
+        read.frames += 2
+        try:
+            read.results[reg.aproperty] = await dev.client.get_register(
+                reg, dev.device_id
+            )
+        except (AiriosAcknowledgeException, ValueError) as err:
+            _LOGGER.debug(
+                "Node %s property %s not read: %s", dev.device_id, reg.aproperty, err
+            )
+    for block in blocks:
+        read.frames += 1
+        read.results.update(await dev.client.get_multiple(block, dev.device_id))
+    return read
+
+
+async def async_read_all_properties(
+    dev: AiriosDevice, *, with_status: bool
+) -> AiriosNodeRead:
+    """Read all the properties of a node, the unread ones have no value."""
+    read = await async_read_properties(dev, dev.regmap, with_status=with_status)
+    for ap in dev.regmap:
+        # Write only properties are kept too, their entities check for them
+        read.results.setdefault(ap, Result(None, None))
+    return read
@@ -0,0 +1,201 @@
+"""Bus scheduler for the Airios integration."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import heapq
+import itertools
+import time
+import typing
+from dataclasses import dataclass
+from enum import IntEnum, auto
+from typing import Any
+
+from homeassistant.core import callback
+
+from .const import MAX_CONCURRENT_TRANSACTIONS
+
+if typing.TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from homeassistant.core import CALLBACK_TYPE
+    from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+
+class BusPriority(IntEnum):
+    """Priority of a bus request, lower values are served first."""
+
+    WRITE = auto()
+    SERVICE = auto()
+    BIND = auto()
+    POLL = auto()
+
+
+@dataclass
+class BusWaitStats:
+    """Wait time statistics of a bus priority."""
+
+    requests: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    @property
+    def average_wait(self) -> float:
+        """Return the average wait time in seconds."""
+        if self.requests == 0:
+            return 0.0
+        return self.total_wait / self.requests
+
+
+class AiriosBusScheduler:
+    """
+    Serialize the access to the RF bridge bus.
+
+    The bridge is reached through a half-duplex RS485 bus, or a gateway to
+    it, so only one request can be in flight. Callers wait for a slot and
+    are served by priority, then in arrival order. Long operations like a
+    poll take a slot per node, so a user write waits at most for one node.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the bus scheduler."""
+        self._busy = False
+        self._waiters: list[tuple[BusPriority, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self.max_queue_depth = 0
+        self.stats: dict[BusPriority, BusWaitStats] = {
+            priority: BusWaitStats() for priority in BusPriority
+        }
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of callers waiting for a slot."""
+        return len(self._waiters)
+
+    @contextlib.asynccontextmanager
+    async def slot(self, priority: BusPriority) -> AsyncIterator[None]:
+        """Hold the bus for the duration of the context."""
+        start = time.monotonic()
+        await self._acquire(priority)
+        wait = time.monotonic() - start
+        stats = self.stats[priority]
+        stats.requests += 1
+        stats.total_wait += wait
+        stats.max_wait = max(stats.max_wait, wait)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, priority: BusPriority) -> None:
+        if not self._busy and not self._waiters:
+            self._busy = True
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        waiter = (priority, next(self._sequence), future)
+        heapq.heappush(self._waiters, waiter)
+        self.max_queue_depth = max(self.max_queue_depth, len(self._waiters))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over before the cancellation
+                self._release()
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+                heapq.heapify(self._waiters)
+            raise
+
+    def _release(self) -> None:
+        # Hand the slot over to the next waiter, the bus stays busy
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._busy = False
+
+
+class AiriosPollBudget:
+    """
+    Share the polling load of all the RF bridges.
+
+    Each bridge polls on its own timer, so bridges set up together would poll
+    together. A poll cycle starts at least the shortest update interval divided
+    by the number of bridges after the previous cycle of any bridge, which
+    spreads the cycles over the interval. Refreshes requested after a user
+    action do not wait. The node reads in flight across all the bridges are
+    capped.
+    """
+
+    def __init__(self, max_transactions: int = MAX_CONCURRENT_TRANSACTIONS) -> None:
+        """Initialize the poll budget."""
+        self._semaphore = asyncio.Semaphore(max_transactions)
+        self._bridges: set[DataUpdateCoordinator[Any]] = set()
+        self._next_start = 0.0
+        self._created = time.monotonic()
+        self.cycles = 0
+        self.transactions = 0
+        self.poll_time = 0.0
+
+    @property
+    def bridges(self) -> int:
+        """Return the number of bridges sharing the budget."""
+        return len(self._bridges)
+
+    @property
+    def duty_cycle(self) -> float:
+        """Return the share of time spent polling, summed over the bridges."""
+        elapsed = time.monotonic() - self._created
+        if elapsed <= 0:
+            return 0.0
+        return self.poll_time / elapsed
+
+    @callback
+    def async_register(self, bridge: DataUpdateCoordinator[Any]) -> CALLBACK_TYPE:
+        """Register the coordinator of a bridge, return a callback to unregister."""
+        self._bridges.add(bridge)
+
+        @callback
+        def _unregister() -> None:
+            self._bridges.discard(bridge)
+
+        return _unregister
+
+    def _spacing(self) -> float:
+        """Return the time between the poll cycles of the bridges."""
+        intervals = [
+            bridge.update_interval.total_seconds()
+            for bridge in self._bridges
+            if bridge.update_interval is not None
+        ]
+        if not intervals:
+            return 0.0
+        return min(intervals) / self.bridges
+
+    async def async_wait_turn(self) -> None:
+        """Wait for the turn of a poll cycle of a bridge."""
+        now = time.monotonic()
+        if self.bridges < 2:  # noqa: PLR2004
+            self._next_start = now
+            return
+        # Reserve the start time before waiting, so the next bridge queues
+        # after this one.
+        start = max(now, self._next_start)
+        self._next_start = start + self._spacing()
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    @contextlib.asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        """Hold a transaction slot for the duration of the context."""
+        async with self._semaphore:
+            self.transactions += 1
+            yield
+
+    def record_cycle(self, duration: float) -> None:
+        """Record the duration of a poll cycle."""
+        self.cycles += 1
+        self.poll_time += duration
@@ -14,6 +14,7 @@ from pyairios.constants import VMDBypassMode
 from pyairios.exceptions import AiriosException
 from pyairios.properties import AiriosVMDProperty
 
+from .const import PollTier
 from .entity import (
     AiriosEntity,
     AiriosEntityDescription,
@@ -61,6 +62,7 @@ SELECT_ENTITIES: tuple[AiriosSelectEntityDescription, ...] = (
         ap=AiriosVMDProperty.BYPASS_MODE,
         key=AiriosVMDProperty.BYPASS_MODE.name.casefold(),
         translation_key="bypass_mode",
+        poll_tier=PollTier.SLOW,
         options=["close", "open", "auto"],
         value_fn=BYPASS_MODE_TO_NAME.get,
         set_value_fn=_set_bypass_mode_fn,
@@ -112,8 +114,12 @@ class AiriosSelectEntity(  # pyright: ignore[reportIncompatibleVariableOverride]
             return False
 
         try:
-            dev = await self.api().node(self.modbus_address)
-            ret = await self.entity_description.set_value_fn(dev, option)
+            ret = await self.coordinator.async_write(
+                self.modbus_address,
+                self.entity_description.ap,
+                option,
+                self.entity_description.set_value_fn,
+            )
         except AiriosException as ex:
             msg = f"Failed to set {self.entity_description.key} to {option}"
             raise HomeAssistantError(msg) from ex
@@ -121,9 +127,7 @@ class AiriosSelectEntity(  # pyright: ignore[reportIncompatibleVariableOverride]
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
-        update_needed = await self._select_option_internal(option)
-        if update_needed:
-            await self.coordinator.async_request_refresh()
+        await self._select_option_internal(option)
 
     @callback
     def _handle_coordinator_update(self) -> None:
@@ -137,11 +141,11 @@ class AiriosSelectEntity(  # pyright: ignore[reportIncompatibleVariableOverride]
         except (TypeError, ValueError) as ex:
             _LOGGER.info(
                 "Failed to update select entity for node=%s, property=%s: %s",
-                f"0x{self.rf_address:08X}",
+                self.node_id,
                 self.entity_description.key,
                 ex,
             )
             self._attr_current_option = None
             self._attr_available = False
         finally:
-            self.async_write_ha_state()
+            self.async_write_ha_state_if_changed(self._attr_current_option)
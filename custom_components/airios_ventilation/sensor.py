@@ -37,6 +37,8 @@ from pyairios.properties import (
     AiriosVMDProperty,
 )
 
+from .connection import ConnectionState
+from .const import PollTier
 from .entity import (
     AiriosEntity,
     AiriosEntityDescription,
@@ -137,6 +139,7 @@ SENSOR_ENTITIES: tuple[AiriosSensorEntityDescription, ...] = (
         ap=AiriosBridgeProperty.RF_LOAD_LAST_HOUR,
         key=AiriosBridgeProperty.RF_LOAD_LAST_HOUR.name.casefold(),
         translation_key="rf_load_last_hour",
+        poll_tier=PollTier.SLOW,
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
@@ -156,6 +159,7 @@ SENSOR_ENTITIES: tuple[AiriosSensorEntityDescription, ...] = (
         ap=AiriosBridgeProperty.MESSAGES_SEND_LAST_HOUR,
         key=AiriosBridgeProperty.MESSAGES_SEND_LAST_HOUR.name.casefold(),
         translation_key="rf_sent_messages_last_hour",
+        poll_tier=PollTier.SLOW,
         state_class=SensorStateClass.TOTAL_INCREASING,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
@@ -262,6 +266,7 @@ SENSOR_ENTITIES: tuple[AiriosSensorEntityDescription, ...] = (
         ap=AiriosVMDProperty.FILTER_DURATION,
         key=AiriosVMDProperty.FILTER_DURATION.name.casefold(),
         translation_key="filter_duration_days",
+        poll_tier=PollTier.SLOW,
         native_unit_of_measurement=UnitOfTime.DAYS,
         device_class=SensorDeviceClass.DURATION,
         state_class=SensorStateClass.TOTAL,
@@ -343,6 +348,7 @@ SENSOR_ENTITIES: tuple[AiriosSensorEntityDescription, ...] = (
         ap=AiriosVMDProperty.CO2_CONTROL_SETPOINT,
         key=AiriosVMDProperty.CO2_CONTROL_SETPOINT.name.casefold(),
         translation_key="co2_setpoint",
+        poll_tier=PollTier.SLOW,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION,
         entity_category=EntityCategory.DIAGNOSTIC,
@@ -350,6 +356,93 @@ SENSOR_ENTITIES: tuple[AiriosSensorEntityDescription, ...] = (
 )
 
 
+@dataclass(frozen=True, kw_only=True)
+class AiriosCoordinatorSensorEntityDescription(SensorEntityDescription):
+    """Airios sensor description for values kept by the integration."""
+
+    value_fn: Callable[[AiriosDataUpdateCoordinator], StateType]
+
+
+def connection_state_value_fn(coordinator: AiriosDataUpdateCoordinator) -> StateType:
+    """Return the state of the connection to the bridge."""
+    if coordinator.connection is None:
+        return None
+    return coordinator.connection.state
+
+
+def reconnects_value_fn(coordinator: AiriosDataUpdateCoordinator) -> StateType:
+    """Return the number of reconnections to the bridge."""
+    if coordinator.connection is None:
+        return None
+    return coordinator.connection.reconnects
+
+
+def poll_duration_value_fn(coordinator: AiriosDataUpdateCoordinator) -> StateType:
+    """Return the duration of the last poll cycle."""
+    if not coordinator.poll_cycles:
+        return None
+    return coordinator.poll_cycles[-1].duration
+
+
+def poll_transactions_value_fn(coordinator: AiriosDataUpdateCoordinator) -> StateType:
+    """Return the number of transactions of the last poll cycle."""
+    if not coordinator.poll_cycles:
+        return None
+    return coordinator.poll_cycles[-1].transactions
+
+
+def poll_errors_value_fn(coordinator: AiriosDataUpdateCoordinator) -> StateType:
+    """Return the number of failed node polls."""
+    return coordinator.poll_errors
+
+
+POLL_SENSOR_ENTITIES: tuple[AiriosCoordinatorSensorEntityDescription, ...] = (
+    AiriosCoordinatorSensorEntityDescription(
+        key="poll_duration",
+        translation_key="poll_duration",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_display_precision=2,
+        value_fn=poll_duration_value_fn,
+    ),
+    AiriosCoordinatorSensorEntityDescription(
+        key="poll_transactions",
+        translation_key="poll_transactions",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+        value_fn=poll_transactions_value_fn,
+    ),
+    AiriosCoordinatorSensorEntityDescription(
+        key="poll_errors",
+        translation_key="poll_errors",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=poll_errors_value_fn,
+    ),
+)
+
+CONNECTION_SENSOR_ENTITIES: tuple[AiriosCoordinatorSensorEntityDescription, ...] = (
+    AiriosCoordinatorSensorEntityDescription(
+        key="connection_state",
+        translation_key="connection_state",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        device_class=SensorDeviceClass.ENUM,
+        options=[state.value for state in ConnectionState],
+        value_fn=connection_state_value_fn,
+    ),
+    AiriosCoordinatorSensorEntityDescription(
+        key="reconnects",
+        translation_key="reconnects",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=reconnects_value_fn,
+    ),
+)
+
+
 class AiriosSensorEntity(  # pyright: ignore[reportIncompatibleVariableOverride]
     AiriosEntity,
     SensorEntity,
@@ -384,14 +477,56 @@ class AiriosSensorEntity(  # pyright: ignore[reportIncompatibleVariableOverride]
         except (TypeError, ValueError) as ex:
             _LOGGER.info(
                 "Failed to update sensor entity for node=%s, property=%s: %s",
-                f"0x{self.rf_address:08X}",
+                self.node_id,
                 self.entity_description.key,
                 ex,
             )
             self._attr_native_value = None
             self._attr_available = False
         finally:
-            self.async_write_ha_state()
+            self.async_write_ha_state_if_changed(self._attr_native_value)
+
+
+class AiriosCoordinatorSensorEntity(  # pyright: ignore[reportIncompatibleVariableOverride]
+    AiriosEntity,
+    SensorEntity,
+):
+    """Airios sensor for values kept by the integration."""
+
+    entity_description: AiriosCoordinatorSensorEntityDescription
+
+    def __init__(
+        self,
+        description: AiriosCoordinatorSensorEntityDescription,
+        coordinator: AiriosDataUpdateCoordinator,
+        modbus_address: int,
+        subentry: ConfigSubentry | None,
+    ) -> None:
+        """Initialize the Airios coordinator sensor entity."""
+        super().__init__(description.key, coordinator, modbus_address, subentry)
+        self.entity_description = description  # type: ignore[override]
+        self._attr_native_value = description.value_fn(coordinator)
+
+    @property
+    def available(self) -> bool:
+        """Return True, the values are kept even while the bridge fails."""
+        return True
+
+    async def async_added_to_hass(self) -> None:
+        """Also listen for connection state changes."""
+        await super().async_added_to_hass()
+        if self.coordinator.connection is not None:
+            self.async_on_remove(
+                self.coordinator.connection.async_add_listener(
+                    self._handle_coordinator_update
+                )
+            )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle update data from the coordinator."""
+        self._attr_native_value = self.entity_description.value_fn(self.coordinator)
+        self.async_write_ha_state_if_changed(self._attr_native_value)
 
 
 async def async_setup_entry(
@@ -402,6 +537,21 @@ async def async_setup_entry(
     """Set up the sensors."""
     coordinator: AiriosDataUpdateCoordinator = entry.runtime_data
 
+    bridge_key = coordinator.data.bridge_key
+    subentry = find_matching_subentry(entry, bridge_key)
+    descriptions = POLL_SENSOR_ENTITIES
+    if coordinator.connection is not None:
+        descriptions += CONNECTION_SENSOR_ENTITIES
+    async_add_entities(
+        [
+            AiriosCoordinatorSensorEntity(
+                description, coordinator, bridge_key, subentry
+            )
+            for description in descriptions
+        ],
+        config_subentry_id=subentry.subentry_id if subentry else None,
+    )
+
     for modbus_address, node in coordinator.data.nodes.items():
         subentry = find_matching_subentry(entry, modbus_address)
         entities: list[AiriosSensorEntity] = [
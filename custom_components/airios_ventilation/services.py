@@ -2,25 +2,49 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
+import time
 import typing
+from typing import Any
 
 import voluptuous as vol
 from homeassistant.components.fan import ATTR_PRESET_MODE
+from homeassistant.components.fan import DOMAIN as FAN_DOMAIN
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import ATTR_DEVICE_ID
-from homeassistant.core import HomeAssistant, ServiceCall, callback
-from homeassistant.exceptions import ServiceValidationError
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import device_registry as dr
-from homeassistant.helpers.config_validation import make_entity_service_schema
-from pyairios.constants import ResetMode
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.config_validation import (
+    has_at_least_one_key,
+    make_entity_service_schema,
+)
+from homeassistant.helpers.service import async_extract_referenced_entity_ids
+from pyairios.constants import ResetMode, VMDCapabilities
+from pyairios.exceptions import AiriosException
+from pyairios.properties import AiriosVMDProperty
 
 from .const import DOMAIN
+from .scheduler import BusPriority
 
 if typing.TYPE_CHECKING:
-    from pyairios.models.brdg_02r13 import BRDG02R13
+    from collections.abc import Awaitable, Callable
+
+    from pyairios.data_model import AiriosDeviceData
+    from pyairios.properties import AiriosBaseProperty
 
     from .coordinator import AiriosDataUpdateCoordinator
 
+_LOGGER = logging.getLogger(__name__)
+
 ATTR_SUPPLY_FAN_SPEED = "supply_fan_speed"
 ATTR_EXHAUST_FAN_SPEED = "exhaust_fan_speed"
 ATTR_PRESET_OVERRIDE_TIME = "preset_override_time"
@@ -32,9 +56,51 @@ SERVICE_SCHEMA_SET_PRESET_FAN_SPEED = make_entity_service_schema(
     }
 )
 
+# The supply and exhaust fan speed properties of each preset
+PRESET_FAN_SPEED_PROPERTIES: dict[str, tuple[AiriosVMDProperty, AiriosVMDProperty]] = {
+    "away": (
+        AiriosVMDProperty.FAN_SPEED_AWAY_SUPPLY,
+        AiriosVMDProperty.FAN_SPEED_AWAY_EXHAUST,
+    ),
+    "low": (
+        AiriosVMDProperty.FAN_SPEED_LOW_SUPPLY,
+        AiriosVMDProperty.FAN_SPEED_LOW_EXHAUST,
+    ),
+    "medium": (
+        AiriosVMDProperty.FAN_SPEED_MID_SUPPLY,
+        AiriosVMDProperty.FAN_SPEED_MID_EXHAUST,
+    ),
+    "high": (
+        AiriosVMDProperty.FAN_SPEED_HIGH_SUPPLY,
+        AiriosVMDProperty.FAN_SPEED_HIGH_EXHAUST,
+    ),
+}
+FAN_SPEED_PRESETS = tuple(PRESET_FAN_SPEED_PROPERTIES)
+
+# The override time property of each preset
+PRESET_OVERRIDE_TIME_PROPERTIES: dict[str, AiriosVMDProperty] = {
+    "low": AiriosVMDProperty.OVERRIDE_TIME_SPEED_LOW,
+    "medium": AiriosVMDProperty.OVERRIDE_TIME_SPEED_MID,
+    "high": AiriosVMDProperty.OVERRIDE_TIME_SPEED_HIGH,
+}
+
+# The fans speeds of each preset are optional, but always given together
+SERVICE_SCHEMA_SET_PRESET_FAN_SPEEDS = vol.All(
+    make_entity_service_schema(
+        {
+            vol.Inclusive(f"{preset}_{attr}", preset): vol.All(vol.Coerce(int))
+            for preset in FAN_SPEED_PRESETS
+            for attr in (ATTR_SUPPLY_FAN_SPEED, ATTR_EXHAUST_FAN_SPEED)
+        }
+    ),
+    has_at_least_one_key(
+        *(f"{preset}_{ATTR_SUPPLY_FAN_SPEED}" for preset in FAN_SPEED_PRESETS)
+    ),
+)
+
 SERVICE_SCHEMA_SET_PRESET_MODE_DURATION = make_entity_service_schema(
     {
-        vol.Required(ATTR_PRESET_MODE): vol.In(["low", "medium", "high"]),
+        vol.Required(ATTR_PRESET_MODE): vol.In(list(PRESET_OVERRIDE_TIME_PROPERTIES)),
         vol.Required(ATTR_PRESET_OVERRIDE_TIME): vol.All(vol.Coerce(int)),
     }
 )
@@ -43,13 +109,15 @@ SERVICE_SET_PRESET_FAN_SPEED_AWAY = "set_preset_fan_speed_away"
 SERVICE_SET_PRESET_FAN_SPEED_LOW = "set_preset_fan_speed_low"
 SERVICE_SET_PRESET_FAN_SPEED_MEDIUM = "set_preset_fan_speed_medium"
 SERVICE_SET_PRESET_FAN_SPEED_HIGH = "set_preset_fan_speed_high"
+SERVICE_SET_PRESET_FAN_SPEEDS = "set_preset_fan_speeds"
 SERVICE_SET_PRESET_MODE_DURATION = "set_preset_mode_duration"
 SERVICE_FILTER_RESET = "filter_reset"
 SERVICE_DEVICE_RESET = "device_reset"
 SERVICE_FACTORY_RESET = "factory_reset"
 
 
-async def _get_api_device(service_call: ServiceCall) -> BRDG02R13:
+@callback
+def _get_coordinator(service_call: ServiceCall) -> AiriosDataUpdateCoordinator:
     service_data = service_call.data
     device_registry = dr.async_get(service_call.hass)
     if not (device := device_registry.async_get(service_data[ATTR_DEVICE_ID])):
@@ -76,44 +144,241 @@ async def _get_api_device(service_call: ServiceCall) -> BRDG02R13:
             translation_placeholders={"service_name": "device_reset"},
         )
 
-    rf_address = None
-    for dev_id in (
-        device.identifiers if isinstance(device, dr.DeviceEntry) else {device}
-    ):
-        if dev_id[0] == DOMAIN:
-            rf_address = int(dev_id[1])
-
-    if not rf_address:
+    coordinator: AiriosDataUpdateCoordinator = config_entry.runtime_data
+    if (identity := coordinator.identities.async_by_device(device)) is None:
         raise ServiceValidationError(
             translation_domain=DOMAIN,
             translation_key="invalid_device_entry",
             translation_placeholders={"service_name": "device_reset"},
         )
 
-    coordinator: AiriosDataUpdateCoordinator = config_entry.runtime_data
-    bridge = coordinator.api.bridge
-    if (result := await bridge.device_rf_address()) and result.value != rf_address:
+    bridge = coordinator.identities.bridge
+    if bridge is None or bridge.rf_address != identity.rf_address:
         raise ServiceValidationError(
             translation_domain=DOMAIN,
             translation_key="invalid_bridge_rf_address",
             translation_placeholders={
                 "service_name": "device_reset",
-                "rf_address": f"0x{rf_address:06X}",
+                "rf_address": f"0x{identity.rf_address:06X}",
             },
         )
-    return coordinator.api.bridge
+    return coordinator
 
 
 async def handle_device_reset_call(service_call: ServiceCall) -> None:
     """Handle device reset call."""
-    bridge = await _get_api_device(service_call)
-    await bridge.reset(ResetMode.SOFT_RESET)
+    coordinator = _get_coordinator(service_call)
+    async with coordinator.scheduler.slot(BusPriority.SERVICE):
+        await coordinator.api.bridge.reset(ResetMode.SOFT_RESET)
 
 
 async def handle_factory_reset_call(service_call: ServiceCall) -> None:
     """Handle device reset call."""
-    bridge = await _get_api_device(service_call)
-    await bridge.reset(ResetMode.FACTORY_RESET)
+    coordinator = _get_coordinator(service_call)
+    async with coordinator.scheduler.slot(BusPriority.SERVICE):
+        await coordinator.api.bridge.reset(ResetMode.FACTORY_RESET)
+
+
+type FanServiceValues = Callable[
+    [ServiceCall, AiriosDeviceData], dict[AiriosBaseProperty, Any]
+]
+
+
+def _supported(node: AiriosDeviceData, *aps: AiriosBaseProperty) -> None:
+    """Raise if the node does not have all the properties."""
+    for ap in aps:
+        if ap not in node:
+            msg = f"Property {ap} not supported by the device"
+            raise HomeAssistantError(msg)
+
+
+def _preset_fan_speed_values(preset: str) -> FanServiceValues:
+    """Return the values function of a set_preset_fan_speed_* service."""
+
+    def _values(
+        service_call: ServiceCall, node: AiriosDeviceData
+    ) -> dict[AiriosBaseProperty, Any]:
+        supply, exhaust = PRESET_FAN_SPEED_PROPERTIES[preset]
+        _supported(node, supply, exhaust)
+        return {
+            supply: service_call.data[ATTR_SUPPLY_FAN_SPEED],
+            exhaust: service_call.data[ATTR_EXHAUST_FAN_SPEED],
+        }
+
+    return _values
+
+
+def _preset_fan_speeds_values(
+    service_call: ServiceCall, node: AiriosDeviceData
+) -> dict[AiriosBaseProperty, Any]:
+    """Return the fans speeds of the presets given to set_preset_fan_speeds."""
+    values: dict[AiriosBaseProperty, Any] = {}
+    for preset, (supply, exhaust) in PRESET_FAN_SPEED_PROPERTIES.items():
+        if f"{preset}_{ATTR_SUPPLY_FAN_SPEED}" not in service_call.data:
+            continue
+        _supported(node, supply, exhaust)
+        values[supply] = service_call.data[f"{preset}_{ATTR_SUPPLY_FAN_SPEED}"]
+        values[exhaust] = service_call.data[f"{preset}_{ATTR_EXHAUST_FAN_SPEED}"]
+    return values
+
+
+def _preset_mode_duration_values(
+    service_call: ServiceCall, node: AiriosDeviceData
+) -> dict[AiriosBaseProperty, Any]:
+    """Return the override time of the preset given to set_preset_mode_duration."""
+    ap = PRESET_OVERRIDE_TIME_PROPERTIES[service_call.data[ATTR_PRESET_MODE]]
+    _supported(node, ap, AiriosVMDProperty.CAPABILITIES)
+    caps = node[AiriosVMDProperty.CAPABILITIES].value
+    if caps is None or VMDCapabilities.TIMER_CAPABLE not in caps:
+        msg = "Device does not support preset temporary override"
+        raise HomeAssistantError(msg)
+    return {ap: service_call.data[ATTR_PRESET_OVERRIDE_TIME]}
+
+
+def _filter_reset_values(
+    service_call: ServiceCall,  # noqa: ARG001 # pylint: disable=unused-argument
+    node: AiriosDeviceData,
+) -> dict[AiriosBaseProperty, Any]:
+    """Return the value resetting the filter dirty flag."""
+    _supported(node, AiriosVMDProperty.FILTER_RESET)
+    return {AiriosVMDProperty.FILTER_RESET: 0}
+
+
+@callback
+def _get_fan_targets(
+    service_call: ServiceCall,
+) -> dict[str, tuple[AiriosDataUpdateCoordinator, list[tuple[str, int]]]]:
+    """Return the targeted fans, as entity id and node, by config entry."""
+    hass = service_call.hass
+    selected = async_extract_referenced_entity_ids(hass, service_call)
+    entity_registry = er.async_get(hass)
+    device_registry = dr.async_get(hass)
+    targets: dict[str, tuple[AiriosDataUpdateCoordinator, list[tuple[str, int]]]] = {}
+    for entity_id in sorted(selected.referenced | selected.indirectly_referenced):
+        entity = entity_registry.async_get(entity_id)
+        if (
+            entity is None
+            or entity.platform != DOMAIN
+            or entity.domain != FAN_DOMAIN
+            or entity.config_entry_id is None
+            or entity.device_id is None
+        ):
+            continue
+        entry = hass.config_entries.async_get_entry(entity.config_entry_id)
+        device = device_registry.async_get(entity.device_id)
+        if entry is None or entry.state != ConfigEntryState.LOADED or device is None:
+            continue
+        coordinator: AiriosDataUpdateCoordinator = entry.runtime_data
+        if (identity := coordinator.identities.async_by_device(device)) is None:
+            continue
+        targets.setdefault(entry.entry_id, (coordinator, []))[1].append(
+            (entity_id, identity.modbus_address)
+        )
+    if not targets:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="invalid_device_entry",
+            translation_placeholders={"service_name": service_call.service},
+        )
+    return targets
+
+
+def _target_node(
+    coordinator: AiriosDataUpdateCoordinator, modbus_address: int
+) -> AiriosDeviceData:
+    """Return the data of a targeted node, raise if it was not read."""
+    # The identities are only updated by the full reads, the node may be gone
+    if (node := coordinator.data.nodes.get(modbus_address)) is None:
+        msg = f"Node {modbus_address} has not been read"
+        raise HomeAssistantError(msg)
+    return node
+
+
+async def _async_run_bridge_targets(
+    service_call: ServiceCall,
+    coordinator: AiriosDataUpdateCoordinator,
+    targets: list[tuple[str, int]],
+    values_fn: FanServiceValues,
+    results: dict[str, dict[str, Any]],
+) -> None:
+    """Write the targets of a bridge one after the other, then read them back."""
+    written: dict[int, set[AiriosBaseProperty]] = {}
+    for entity_id, modbus_address in targets:
+        start = time.monotonic()
+        error = None
+        try:
+            values = values_fn(service_call, _target_node(coordinator, modbus_address))
+            await coordinator.async_write_group(modbus_address, values, read_back=False)
+            written.setdefault(modbus_address, set()).update(values)
+        except (AiriosException, HomeAssistantError) as err:
+            _LOGGER.warning(
+                "Service %s failed for %s: %s", service_call.service, entity_id, err
+            )
+            error = str(err)
+        results[entity_id] = {
+            "latency": round(time.monotonic() - start, 3),
+            "error": error,
+        }
+    if written:
+        await coordinator.async_refresh_nodes(written)
+
+
+def _fan_service_handler(
+    values_fn: FanServiceValues,
+) -> Callable[[ServiceCall], Awaitable[ServiceResponse]]:
+    """Return the handler of a fan service writing the values of values_fn."""
+
+    async def _async_handle(service_call: ServiceCall) -> ServiceResponse:
+        targets = _get_fan_targets(service_call)
+        results: dict[str, dict[str, Any]] = {}
+        # The bridges are independent buses, each one is written in turn
+        await asyncio.gather(
+            *(
+                _async_run_bridge_targets(
+                    service_call, coordinator, entities, values_fn, results
+                )
+                for coordinator, entities in targets.values()
+            )
+        )
+        if service_call.return_response:
+            return {"targets": results}
+        if failed := [
+            entity_id for entity_id, result in results.items() if result["error"]
+        ]:
+            msg = f"Service {service_call.service} failed for {', '.join(failed)}"
+            raise HomeAssistantError(msg)
+        return None
+
+    return _async_handle
+
+
+FAN_SERVICES: dict[str, tuple[vol.All | vol.Schema, FanServiceValues]] = {
+    SERVICE_SET_PRESET_FAN_SPEED_AWAY: (
+        SERVICE_SCHEMA_SET_PRESET_FAN_SPEED,
+        _preset_fan_speed_values("away"),
+    ),
+    SERVICE_SET_PRESET_FAN_SPEED_LOW: (
+        SERVICE_SCHEMA_SET_PRESET_FAN_SPEED,
+        _preset_fan_speed_values("low"),
+    ),
+    SERVICE_SET_PRESET_FAN_SPEED_MEDIUM: (
+        SERVICE_SCHEMA_SET_PRESET_FAN_SPEED,
+        _preset_fan_speed_values("medium"),
+    ),
+    SERVICE_SET_PRESET_FAN_SPEED_HIGH: (
+        SERVICE_SCHEMA_SET_PRESET_FAN_SPEED,
+        _preset_fan_speed_values("high"),
+    ),
+    SERVICE_SET_PRESET_FAN_SPEEDS: (
+        SERVICE_SCHEMA_SET_PRESET_FAN_SPEEDS,
+        _preset_fan_speeds_values,
+    ),
+    SERVICE_SET_PRESET_MODE_DURATION: (
+        SERVICE_SCHEMA_SET_PRESET_MODE_DURATION,
+        _preset_mode_duration_values,
+    ),
+    SERVICE_FILTER_RESET: (make_entity_service_schema({}), _filter_reset_values),
+}
 
 
 @callback
@@ -139,3 +404,11 @@ def async_setup_services(hass: HomeAssistant) -> None:
         ),
         service_func=handle_factory_reset_call,
     )
+    for service, (schema, values_fn) in FAN_SERVICES.items():
+        hass.services.async_register(
+            domain=DOMAIN,
+            service=service,
+            schema=schema,
+            service_func=_fan_service_handler(values_fn),
+            supports_response=SupportsResponse.OPTIONAL,
+        )
@@ -0,0 +1,257 @@
+"""Persisted data snapshot for the Airios integration."""
+
+from __future__ import annotations
+
+import dataclasses
+import enum
+import importlib
+import logging
+import typing
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.storage import Store
+from pyairios.data_model import AiriosData
+from pyairios.properties import AiriosBaseProperty
+from pyairios.registers import Result, ResultStatus
+
+from .const import DOMAIN, SNAPSHOT_SAVE_DELAY
+
+if typing.TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from pyairios.data_model import AiriosDeviceData
+
+_LOGGER = logging.getLogger(__name__)
+
+# Version 1 held a pickle of the pyairios data, it is dropped on migration
+STORAGE_VERSION = 2
+STORAGE_MINOR_VERSION = 1
+
+# Only pyairios types are restored from a snapshot
+_PYAIRIOS_MODULE = "pyairios."
+
+
+def _type_path(value_type: type) -> str:
+    """Return the import path of a pyairios type."""
+    return f"{value_type.__module__}.{value_type.__qualname__}"
+
+
+def _resolve_type(path: str) -> type:
+    """Return the pyairios type at an import path."""
+    module, _, name = path.rpartition(".")
+    if not module.startswith(_PYAIRIOS_MODULE):
+        msg = f"Not a pyairios type: {path}"
+        raise ValueError(msg)
+    value_type = getattr(importlib.import_module(module), name)
+    if not isinstance(value_type, type):
+        msg = f"Not a type: {path}"
+        raise TypeError(msg)
+    return value_type
+
+
+def encode_value(value: Any) -> Any:
+    """Return a value read from a node as JSON."""
+    if isinstance(value, list | tuple):
+        return [encode_value(item) for item in value]
+    # Most enums are ints too
+    if value is None or (
+        isinstance(value, bool | int | float | str) and not isinstance(value, enum.Enum)
+    ):
+        return value
+    return _encode_typed(value)
+
+
+def _encode_typed(value: Any) -> dict[str, Any]:
+    """Return a value of a type JSON does not have, tagged with its type."""
+    if isinstance(value, enum.Enum):
+        return {"enum": _type_path(type(value)), "value": value.value}
+    # Datetimes are dates too
+    if isinstance(value, datetime):
+        return {"datetime": value.isoformat()}
+    if isinstance(value, date):
+        return {"date": value.isoformat()}
+    if isinstance(value, timedelta):
+        return {"timedelta": value.total_seconds()}
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            "dataclass": _type_path(type(value)),
+            "fields": {
+                f.name: encode_value(getattr(value, f.name))
+                for f in dataclasses.fields(value)
+            },
+        }
+    msg = f"Unsupported value type {type(value).__name__}"
+    raise TypeError(msg)
+
+
+def decode_value(data: Any) -> Any:
+    """Return a value from its JSON, raise ValueError or TypeError if invalid."""
+    if isinstance(data, list):
+        return [decode_value(item) for item in data]
+    if not isinstance(data, dict):
+        return data
+    return _decode_typed(data)
+
+
+def _decode_typed(data: dict[str, Any]) -> Any:
+    """Return a value from its JSON tagged with its type."""
+    if "enum" in data:
+        enum_type = _resolve_type(data["enum"])
+        if not issubclass(enum_type, enum.Enum):
+            msg = f"Not an enum: {data['enum']}"
+            raise TypeError(msg)
+        return enum_type(data["value"])
+    if "datetime" in data:
+        return datetime.fromisoformat(data["datetime"])
+    if "date" in data:
+        return date.fromisoformat(data["date"])
+    if "timedelta" in data:
+        return timedelta(seconds=data["timedelta"])
+    if "dataclass" in data:
+        dataclass_type = _resolve_type(data["dataclass"])
+        if not dataclasses.is_dataclass(dataclass_type):
+            msg = f"Not a dataclass: {data['dataclass']}"
+            raise TypeError(msg)
+        return dataclass_type(
+            **{name: decode_value(field) for name, field in data["fields"].items()}
+        )
+    msg = f"Unexpected value {data}"
+    raise ValueError(msg)
+
+
+def _encode_node(node: AiriosDeviceData, unsaved: dict[str, str]) -> dict[str, Any]:
+    """Return the results of a node as JSON, by property path."""
+    encoded: dict[str, Any] = {}
+    for ap, result in node.items():
+        path = f"{_type_path(type(ap))}.{ap.name}"
+        try:
+            encoded[path] = {
+                "value": encode_value(result.value),
+                "status": None
+                if result.status is None
+                else encode_value(result.status),
+            }
+        except TypeError as err:
+            unsaved[path] = str(err)
+    return encoded
+
+
+def _decode_node(data: dict[str, Any]) -> AiriosDeviceData:
+    """Return the results of a node from their JSON."""
+    node: AiriosDeviceData = {}
+    for path, result in data.items():
+        property_path, _, name = path.rpartition(".")
+        property_type = _resolve_type(property_path)
+        if not issubclass(property_type, AiriosBaseProperty):
+            msg = f"Not a property: {property_path}"
+            raise TypeError(msg)
+        status = None
+        if result["status"] is not None:
+            status = decode_value(result["status"])
+            if not isinstance(status, ResultStatus):
+                msg = f"Invalid result status of {path}"
+                raise TypeError(msg)
+        node[property_type[name]] = Result(decode_value(result["value"]), status)
+    return node
+
+
+def encode_snapshot(snapshot: AiriosData) -> dict[str, Any]:
+    """
+    Return a snapshot as JSON.
+
+    The properties whose value cannot be encoded are listed as unsaved, with
+    the reason. A snapshot with unsaved properties is not restored, as their
+    entities would be missing until a reload.
+    """
+    unsaved: dict[str, str] = {}
+    nodes = {
+        str(modbus_address): _encode_node(node, unsaved)
+        for modbus_address, node in snapshot.nodes.items()
+    }
+    return {"bridge_key": snapshot.bridge_key, "nodes": nodes, "unsaved": unsaved}
+
+
+def decode_snapshot(data: dict[str, Any]) -> AiriosData:
+    """Return a snapshot from its JSON, raise if it is invalid."""
+    return AiriosData(
+        bridge_key=data["bridge_key"],
+        nodes={
+            int(modbus_address): _decode_node(node)
+            for modbus_address, node in data["nodes"].items()
+        },
+    )
+
+
+class _AiriosStore(Store[dict[str, Any]]):
+    """Store of a snapshot, migrating the older versions."""
+
+    async def _async_migrate_func(
+        self,
+        old_major_version: int,  # noqa: ARG002
+        old_minor_version: int,  # noqa: ARG002
+        old_data: dict[str, Any],  # noqa: ARG002
+    ) -> dict[str, Any]:
+        """Migrate a stored snapshot, the pickled ones are dropped."""
+        # An empty snapshot, the next full read saves a new one
+        return {}
+
+
+class AiriosSnapshotStore:
+    """
+    Persist the last good data of a RF bridge.
+
+    The snapshot is restored when the integration is set up, so the entities
+    are created without waiting for a full read of the bus. It is saved as
+    JSON, the values are rebuilt from the pyairios types they were read as.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the snapshot store of a config entry."""
+        self._store = _AiriosStore(
+            hass,
+            STORAGE_VERSION,
+            f"{DOMAIN}.{entry_id}",
+            minor_version=STORAGE_MINOR_VERSION,
+        )
+        self._snapshot: AiriosData | None = None
+        # The unsaved properties already logged
+        self._unsaved: set[str] = set()
+
+    async def async_load(self) -> AiriosData | None:
+        """Load the snapshot, None if missing or invalid."""
+        stored = await self._store.async_load()
+        if not stored:
+            return None
+        if unsaved := stored.get("unsaved"):
+            _LOGGER.info(
+                "Not restoring the snapshot, properties %s were not saved",
+                sorted(unsaved),
+            )
+            return None
+        try:
+            return decode_snapshot(stored)
+        except (KeyError, TypeError, ValueError, AttributeError, ImportError) as err:
+            _LOGGER.warning("Ignoring invalid snapshot: %s", err)
+            return None
+
+    @callback
+    def async_save(self, snapshot: AiriosData) -> None:
+        """Save the snapshot, delayed to limit the writes."""
+        self._snapshot = snapshot
+        self._store.async_delay_save(self._data_to_save, SNAPSHOT_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        if self._snapshot is None:
+            return {}
+        encoded = encode_snapshot(self._snapshot)
+        for path, reason in encoded["unsaved"].items():
+            if path not in self._unsaved:
+                _LOGGER.warning("Not saving %s in the snapshot: %s", path, reason)
+        self._unsaved = set(encoded["unsaved"])
+        return encoded
+
+    async def async_remove(self) -> None:
+        """Remove the snapshot."""
+        await self._store.async_remove()
@@ -11,9 +11,12 @@ from homeassistant.components.switch import (
     SwitchEntity,
     SwitchEntityDescription,
 )
+from homeassistant.const import STATE_ON, EntityCategory
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.restore_state import RestoreEntity
 from pyairios.properties import AiriosVMDProperty
 
+from .const import PollTier
 from .entity import (
     AiriosEntity,
     AiriosEntityDescription,
@@ -24,6 +27,7 @@ if typing.TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
 
     from homeassistant.config_entries import ConfigEntry, ConfigSubentry
+    from homeassistant.core import CALLBACK_TYPE
     from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
     from pyairios.device import AiriosDevice
 
@@ -50,10 +54,18 @@ SWITCH_ENTITIES: tuple[AiriosSwitchEntityDescription, ...] = (
         ap=AiriosVMDProperty.BASIC_VENTILATION_ENABLE,
         key=AiriosVMDProperty.BASIC_VENTILATION_ENABLE.name.casefold(),
         translation_key="basic_vent_enable_sw",
+        poll_tier=PollTier.SLOW,
         set_value_fn=_base_vent_switch,
     ),
 )
 
+RESULT_STATUS_ENTITY = SwitchEntityDescription(
+    key="result_status",
+    translation_key="result_status",
+    entity_category=EntityCategory.CONFIG,
+    entity_registry_enabled_default=False,
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,  # noqa: ARG001 # pylint: disable=unused-argument
@@ -65,11 +77,16 @@ async def async_setup_entry(
 
     for modbus_address, node in coordinator.data.nodes.items():
         subentry = find_matching_subentry(entry, modbus_address)
-        entities: list[AiriosSwitchEntity] = [
+        entities: list[SwitchEntity] = [
             AiriosSwitchEntity(description, coordinator, modbus_address, subentry)
             for description in SWITCH_ENTITIES
             if description.ap in node
         ]
+        entities.append(
+            AiriosResultStatusSwitchEntity(
+                RESULT_STATUS_ENTITY, coordinator, modbus_address, subentry
+            )
+        )
         subentry_id = subentry.subentry_id if subentry else None
         async_add_entities(entities, config_subentry_id=subentry_id)
 
@@ -96,8 +113,12 @@ class AiriosSwitchEntity(  # pyright: ignore[reportIncompatibleVariableOverride]
     async def _set_value_internal(self, value: int) -> bool:
         if self.entity_description.set_value_fn is None:
             raise NotImplementedError
-        dev = await self.api().node(self.modbus_address)
-        return await self.entity_description.set_value_fn(dev, value)
+        return await self.coordinator.async_write(
+            self.modbus_address,
+            self.entity_description.ap,
+            value,
+            self.entity_description.set_value_fn,
+        )
 
     async def async_turn_on(
         self,
@@ -105,9 +126,7 @@ class AiriosSwitchEntity(  # pyright: ignore[reportIncompatibleVariableOverride]
     ) -> None:
         """Handle switch on."""
         _LOGGER.debug("Switch %s turned On", self.entity_description.name)
-        update_needed = await self._set_value_internal(1)
-        if update_needed:
-            await self.coordinator.async_request_refresh()
+        await self._set_value_internal(1)
 
     async def async_turn_off(
         self,
@@ -115,9 +134,7 @@ class AiriosSwitchEntity(  # pyright: ignore[reportIncompatibleVariableOverride]
     ) -> None:
         """Handle switch off."""
         _LOGGER.debug("Switch %s turned Off", self.entity_description.name)
-        update_needed = await self._set_value_internal(0)
-        if update_needed:
-            await self.coordinator.async_request_refresh()
+        await self._set_value_internal(0)
 
     @callback
     def _handle_coordinator_update(self) -> None:
@@ -131,11 +148,77 @@ class AiriosSwitchEntity(  # pyright: ignore[reportIncompatibleVariableOverride]
         except (TypeError, ValueError) as ex:
             _LOGGER.info(
                 "Failed to update switch entity for node=%s, property=%s: %s",
-                f"0x{self.rf_address:08X}",
+                self.node_id,
                 self.entity_description.key,
                 ex,
             )
             self._attr_is_on = None
             self._attr_available = False
         finally:
-            self.async_write_ha_state()
+            self.async_write_ha_state_if_changed(self._attr_is_on)
+
+
+class AiriosResultStatusSwitchEntity(  # pyright: ignore[reportIncompatibleVariableOverride]
+    AiriosEntity,
+    SwitchEntity,
+    RestoreEntity,
+):
+    """Switch fetching the result status of the properties of a node."""
+
+    def __init__(
+        self,
+        description: SwitchEntityDescription,
+        coordinator: AiriosDataUpdateCoordinator,
+        modbus_address: int,
+        subentry: ConfigSubentry | None,
+    ) -> None:
+        """Initialize the Airios result status switch entity."""
+        super().__init__(description.key, coordinator, modbus_address, subentry)
+        self.entity_description = description
+        self._attr_is_on = False
+        self._remove_status: CALLBACK_TYPE | None = None
+
+    @property
+    def available(self) -> bool:
+        """Return True, the switch is a setting of the integration."""
+        return True
+
+    async def async_added_to_hass(self) -> None:
+        """Restore the last state."""
+        await super().async_added_to_hass()
+        if (last_state := await self.async_get_last_state()) is not None:
+            self._async_set_status(on=last_state.state == STATE_ON)
+        self.async_on_remove(lambda: self._async_set_status(on=False))
+
+    @callback
+    def _async_set_status(self, *, on: bool) -> None:
+        self._attr_is_on = on
+        if on and self._remove_status is None:
+            self._remove_status = self.coordinator.poll_plan.async_add_status(
+                self.modbus_address
+            )
+        elif not on and self._remove_status is not None:
+            self._remove_status()
+            self._remove_status = None
+
+    async def async_turn_on(
+        self,
+        **kwargs: Any,  # noqa: ARG002 # pylint: disable=unused-argument
+    ) -> None:
+        """Fetch the result status, from the next slow poll."""
+        self._async_set_status(on=True)
+        self.async_write_ha_state()
+        await self.coordinator.async_request_refresh()
+
+    async def async_turn_off(
+        self,
+        **kwargs: Any,  # noqa: ARG002 # pylint: disable=unused-argument
+    ) -> None:
+        """Stop fetching the result status."""
+        self._async_set_status(on=False)
+        self.async_write_ha_state()
+        self.coordinator.async_update_listeners()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Keep the state, it does not depend on the data."""
@@ -0,0 +1,117 @@
+"""Fixtures for the Airios integration tests."""
+
+from __future__ import annotations
+
+import typing
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from homeassistant.const import CONF_ADDRESS, CONF_DEVICE, CONF_TYPE
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.airios_ventilation.const import (
+    CONF_BRIDGE_RF_ADDRESS,
+    DOMAIN,
+    BridgeType,
+)
+
+from .replay import PROFILES, ReplayCapture, ReplayModbusClient, load_capture
+
+if typing.TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator
+
+    from homeassistant.core import HomeAssistant
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+# The bridge and its bound nodes in the capture fixture
+BRIDGE_MODBUS_ADDRESS = 207
+VMD_MODBUS_ADDRESS = 2
+VMN_MODBUS_ADDRESS = 3
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the benchmark options."""
+    group = parser.getgroup("airios", "Airios benchmark")
+    group.addoption(
+        "--airios-capture",
+        type=Path,
+        default=FIXTURES / "capture.json",
+        help="capture recorded with python -m tests.replay",
+    )
+    group.addoption("--airios-profile", choices=PROFILES, default="serial")
+    group.addoption(
+        "--airios-time-scale",
+        type=float,
+        default=0.0,
+        help="scale of the simulated bus latency, 0 to remove it",
+    )
+    group.addoption("--airios-failure-rate", type=float, default=0.0)
+    group.addoption("--airios-iterations", type=int, default=10)
+    group.addoption("--airios-json", type=Path, help="write the results as JSON")
+    group.addoption(
+        "--airios-report", action="store_true", help="print the results as a table"
+    )
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations: None) -> None:
+    """Load the integration from custom_components in all the tests."""
+
+
+@pytest.fixture
+def capture(pytestconfig: pytest.Config) -> ReplayCapture:
+    """Return the capture of a bridge with a ventilation unit and a remote."""
+    return load_capture(pytestconfig.getoption("airios_capture"))
+
+
+@pytest.fixture
+def replay_client(capture: ReplayCapture) -> ReplayModbusClient:
+    """Return a Modbus client replaying the capture without latency."""
+    return ReplayModbusClient(capture, time_scale=0, seed=0)
+
+
+@pytest.fixture
+def config_entry(hass: HomeAssistant, capture: ReplayCapture) -> MockConfigEntry:
+    """Return the config entry of the serial bridge of the capture."""
+    bridge_rf_address = capture.bridge_rf_address()
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Airios RF bridge",
+        data={
+            CONF_TYPE: BridgeType.SERIAL,
+            CONF_DEVICE: "/dev/ttyACM0",
+            CONF_ADDRESS: capture.bridge,
+            CONF_BRIDGE_RF_ADDRESS: bridge_rf_address,
+        },
+        unique_id=str(bridge_rf_address),
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+@pytest.fixture
+def mock_modbus_client(
+    replay_client: ReplayModbusClient,
+) -> Iterator[ReplayModbusClient]:
+    """Make pyairios talk to the replay client."""
+    with patch(
+        "pyairios.client.modbusClient.AsyncModbusSerialClient",
+        return_value=replay_client,
+    ):
+        yield replay_client
+
+
+@pytest.fixture
+async def setup_integration(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_modbus_client: ReplayModbusClient,  # noqa: ARG001
+) -> AsyncIterator[MockConfigEntry]:
+    """Set up the config entry, pyairios talking to the replay client."""
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    yield config_entry
+    # Stop the coordinator timers before the end of the test
+    await hass.config_entries.async_unload(config_entry.entry_id)
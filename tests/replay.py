@@ -0,0 +1,343 @@
+"""
+Replay of a recorded RF bridge, for the tests and the benchmark.
+
+A capture holds the holding registers of a RF bridge and of its bound nodes,
+as read from a live bridge with:
+
+    python -m tests.replay --device /dev/ttyUSB0 capture.json
+    python -m tests.replay --host 192.0.2.10 capture.json
+
+ReplayModbusClient stands in for the pymodbus client of pyairios and serves
+the Modbus requests from the capture, so pyairios and the integration run
+unchanged. Each request sleeps for the latency of the selected transport
+profile and may fail with the configured probability.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import typing
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from pyairios import Airios
+from pyairios.client import AiriosRtuTransport, AiriosTcpTransport
+from pyairios.exceptions import AiriosException
+from pyairios.models.brdg_02r13 import BRDG02R13
+from pyairios.properties import AiriosDeviceProperty
+from pyairios.registers import RegisterAccess
+from pymodbus.constants import ExcCodes
+from pymodbus.exceptions import ModbusIOException
+from pymodbus.pdu import ExceptionResponse
+from pymodbus.pdu.register_message import (
+    ReadHoldingRegistersResponse,
+    WriteMultipleRegistersResponse,
+    WriteSingleRegisterResponse,
+)
+
+if typing.TYPE_CHECKING:
+    from pyairios.client import AiriosBaseTransport
+    from pyairios.device import AiriosDevice
+    from pymodbus.client import ModbusBaseClient
+    from pymodbus.pdu import ModbusPDU
+
+DEFAULT_MODBUS_ADDRESS = 207
+DEFAULT_PORT = 502
+
+_READ_HOLDING_REGISTERS = 3
+_WRITE_SINGLE_REGISTER = 6
+_WRITE_MULTIPLE_REGISTERS = 16
+
+
+@dataclass(frozen=True, kw_only=True)
+class ReplayProfile:
+    """Timing and failure model of a transport."""
+
+    name: str
+    # Seconds per Modbus request, request and response included
+    latency: float
+    # Seconds per register read or written
+    register_time: float
+    # Uniform random jitter added to the latency, in seconds
+    jitter: float
+    # Probability of a request failing
+    failure_rate: float = 0.0
+
+
+# At 19200 baud 8E1 a character takes 11 bits, 0.57 ms. A single register
+# read is about 24 characters on the wire including the 3.5 character frame
+# gaps, plus the bridge turnaround. Each register adds two characters.
+SERIAL_PROFILE = ReplayProfile(
+    name="serial", latency=0.025, register_time=0.0012, jitter=0.005
+)
+# The TCP gateway adds a network round trip to the serial bus time.
+TCP_PROFILE = ReplayProfile(
+    name="tcp", latency=0.030, register_time=0.0012, jitter=0.010
+)
+PROFILES = {profile.name: profile for profile in (SERIAL_PROFILE, TCP_PROFILE)}
+
+
+@dataclass
+class ReplayStats:
+    """Requests served by the replay client."""
+
+    requests: int = 0
+    registers: int = 0
+    failures: int = 0
+    writes: int = 0
+    closes: int = 0
+
+
+@dataclass
+class ReplayCapture:
+    """The holding registers of a RF bridge and its bound nodes."""
+
+    bridge: int
+    # Register values by modbus address and register address
+    devices: dict[int, dict[int, int]] = field(default_factory=dict)
+
+    def to_json(self) -> dict[str, typing.Any]:
+        """Return the capture as JSON, the keys are strings."""
+        return {
+            "bridge": self.bridge,
+            "devices": {
+                str(modbus_address): {
+                    str(address): value for address, value in sorted(registers.items())
+                }
+                for modbus_address, registers in self.devices.items()
+            },
+        }
+
+    def bridge_rf_address(self) -> int:
+        """Return the RF address of the bridge, its config entry unique id."""
+        bridge = BRDG02R13(self.bridge, None)  # type: ignore[arg-type]
+        reg = bridge.regmap[AiriosDeviceProperty.RF_ADDRESS]
+        start = reg.description.address
+        end = start + reg.description.length
+        registers = self.devices[self.bridge]
+        return reg.decode([registers[address] for address in range(start, end)])
+
+    @classmethod
+    def from_json(cls, data: dict[str, typing.Any]) -> ReplayCapture:
+        """Return a capture from its JSON."""
+        return cls(
+            bridge=data["bridge"],
+            devices={
+                int(modbus_address): {
+                    int(address): value for address, value in registers.items()
+                }
+                for modbus_address, registers in data["devices"].items()
+            },
+        )
+
+
+def load_capture(path: Path) -> ReplayCapture:
+    """Load a capture recorded with this module."""
+    return ReplayCapture.from_json(json.loads(path.read_text()))
+
+
+class ReplayModbusClient:
+    """
+    Serve the Modbus requests of pyairios from a capture.
+
+    Reads of registers missing from the capture are acknowledged without
+    data, like the bridge does for values it has not received. Written
+    values are returned by later reads.
+    """
+
+    def __init__(
+        self,
+        capture: ReplayCapture,
+        profile: ReplayProfile = SERIAL_PROFILE,
+        *,
+        time_scale: float = 1.0,
+        seed: int | None = None,
+    ) -> None:
+        """Initialize the client, time_scale 0 removes the latency."""
+        self.devices = {
+            modbus_address: dict(registers)
+            for modbus_address, registers in capture.devices.items()
+        }
+        self.profile = profile
+        self.time_scale = time_scale
+        self.stats = ReplayStats()
+        # Nodes answering with a device failure
+        self.failing_devices: set[int] = set()
+        # Registers whose writes are rejected, by modbus address
+        self.failing_writes: set[tuple[int, int]] = set()
+        self.connected = False
+        self._random = random.Random(seed)  # noqa: S311
+
+    async def connect(self) -> bool:
+        """Connect, it never fails."""
+        self.connected = True
+        return True
+
+    def close(self) -> None:
+        """Close the connection, pyairios connects again on the next request."""
+        self.connected = False
+        self.stats.closes += 1
+
+    async def _async_request(self, registers: int) -> None:
+        """Wait for a request to complete, raise if it is made to fail."""
+        self.stats.requests += 1
+        self.stats.registers += registers
+        if self.time_scale > 0:
+            delay = (
+                self.profile.latency
+                + registers * self.profile.register_time
+                + self._random.uniform(0, self.profile.jitter)
+            )
+            await asyncio.sleep(delay * self.time_scale)
+        if self._random.random() < self.profile.failure_rate:
+            self.stats.failures += 1
+            msg = "Injected request failure"
+            raise ModbusIOException(msg)
+
+    def _exception(
+        self, function_code: int, modbus_address: int
+    ) -> ExceptionResponse | None:
+        """Return the exception a node answers with, None if it answers."""
+        if modbus_address not in self.devices:
+            return ExceptionResponse(
+                function_code, ExcCodes.GATEWAY_NO_RESPONSE, modbus_address
+            )
+        if modbus_address in self.failing_devices:
+            return ExceptionResponse(
+                function_code, ExcCodes.DEVICE_FAILURE, modbus_address
+            )
+        return None
+
+    async def read_holding_registers(
+        self, address: int, *, count: int, device_id: int
+    ) -> ModbusPDU:
+        """Read consecutive registers of a node."""
+        await self._async_request(count)
+        if exception := self._exception(_READ_HOLDING_REGISTERS, device_id):
+            return exception
+        registers = self.devices[device_id]
+        values = [registers.get(a) for a in range(address, address + count)]
+        if None in values:
+            return ExceptionResponse(
+                _READ_HOLDING_REGISTERS, ExcCodes.ACKNOWLEDGE, device_id
+            )
+        return ReadHoldingRegistersResponse(dev_id=device_id, registers=values)
+
+    async def write_register(
+        self, address: int, value: int, *, device_id: int
+    ) -> ModbusPDU:
+        """Write a single register of a node."""
+        await self._async_request(1)
+        if exception := self._write(
+            _WRITE_SINGLE_REGISTER, address, [value], device_id
+        ):
+            return exception
+        return WriteSingleRegisterResponse(
+            dev_id=device_id, address=address, registers=[value]
+        )
+
+    async def write_registers(
+        self, address: int, values: list[int], *, device_id: int
+    ) -> ModbusPDU:
+        """Write consecutive registers of a node."""
+        await self._async_request(len(values))
+        if exception := self._write(
+            _WRITE_MULTIPLE_REGISTERS, address, values, device_id
+        ):
+            return exception
+        return WriteMultipleRegistersResponse(
+            dev_id=device_id, address=address, count=len(values)
+        )
+
+    def _write(
+        self, function_code: int, address: int, values: list[int], device_id: int
+    ) -> ExceptionResponse | None:
+        """Store written values, return the exception if the write fails."""
+        if exception := self._exception(function_code, device_id):
+            return exception
+        if (device_id, address) in self.failing_writes:
+            return ExceptionResponse(function_code, ExcCodes.ILLEGAL_VALUE, device_id)
+        self.stats.writes += 1
+        for offset, value in enumerate(values):
+            self.devices[device_id][address + offset] = value
+        return None
+
+
+class _RecordingModbusClient:
+    """Wrap a pymodbus client and record the registers it reads."""
+
+    def __init__(self, client: ModbusBaseClient, capture: ReplayCapture) -> None:
+        self._client = client
+        self._capture = capture
+
+    def __getattr__(self, name: str) -> typing.Any:
+        return getattr(self._client, name)
+
+    async def read_holding_registers(
+        self, address: int, *, count: int, device_id: int
+    ) -> ModbusPDU:
+        response = await self._client.read_holding_registers(
+            address, count=count, device_id=device_id
+        )
+        if not response.isError():
+            registers = self._capture.devices.setdefault(device_id, {})
+            for offset, value in enumerate(response.registers):
+                registers[address + offset] = value
+        return response
+
+
+async def _async_record_device(dev: AiriosDevice) -> None:
+    """Read all the readable registers of a device with their status."""
+    for reg in dev.registers:
+        if RegisterAccess.READ not in reg.description.access:
+            continue
+        try:
+            await dev.client.get_register(reg, dev.device_id)
+        except (AiriosException, ValueError) as err:
+            print(f"Node {dev.device_id} {reg.aproperty} not recorded: {err}")  # noqa: T201
+
+
+async def async_record(api: Airios) -> ReplayCapture:
+    """Record the registers of a RF bridge and its bound nodes."""
+    capture = ReplayCapture(bridge=api.bridge.device_id)
+    client = api.bridge.client
+    client.client = _RecordingModbusClient(client.client, capture)  # type: ignore[assignment]
+    await _async_record_device(api.bridge)
+    for bound in await api.nodes():
+        await _async_record_device(await api.node(bound.modbus_address))
+    return capture
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    transport: AiriosBaseTransport
+    if args.device is not None:
+        transport = AiriosRtuTransport(args.device)
+    else:
+        transport = AiriosTcpTransport(args.host, args.port)
+    api = Airios(transport, args.address)
+    try:
+        capture = await async_record(api)
+    finally:
+        api.close()
+    args.output.write_text(json.dumps(capture.to_json(), indent=1) + "\n")
+    print(f"Recorded {len(capture.devices)} devices to {args.output}")  # noqa: T201
+
+
+def main() -> None:
+    """Record a capture from a live RF bridge."""
+    parser = argparse.ArgumentParser(description="Record an Airios RF bridge.")
+    bridge = parser.add_mutually_exclusive_group(required=True)
+    bridge.add_argument("--device", help="serial device of the RF bridge")
+    bridge.add_argument("--host", help="host of the Ethernet RF bridge")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--address", type=int, default=DEFAULT_MODBUS_ADDRESS)
+    parser.add_argument("output", type=Path)
+    args = parser.parse_args()
+    asyncio.run(_async_main(args))
+
+
+if __name__ == "__main__":
+    main()
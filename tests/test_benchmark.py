@@ -0,0 +1,273 @@
+"""
+Benchmark of the integration against a replayed RF bridge.
+
+Measures the setup time of the config entry, the latency of a poll cycle and
+the cost of dispatching its result, the update cost of the entities of each
+platform and the CPU time of updating all the entities once, as a poll cycle
+does. It runs with the test suite against the capture fixture without bus
+latency, and checks the Modbus requests of each poll cycle against the read
+plan. Measure a change against a recorded bridge with the latency of its bus
+through scripts/benchmark:
+
+    scripts/benchmark --airios-capture capture.json --airios-profile serial
+    scripts/benchmark --airios-time-scale 0 --airios-json results.json
+    scripts/benchmark --airios-failure-rate 0.01 --log-level DEBUG
+
+The results are printed with --airios-report, which scripts/benchmark passes,
+and written with --airios-json.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import statistics
+import time
+import typing
+
+import pytest
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.helpers.entity_platform import async_get_platforms
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from custom_components.airios_ventilation.const import DOMAIN, PollTier
+
+from .replay import PROFILES, ReplayCapture, ReplayModbusClient
+
+if typing.TYPE_CHECKING:
+    from pathlib import Path
+
+    from homeassistant.core import HomeAssistant
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+    from custom_components.airios_ventilation.coordinator import (
+        AiriosDataUpdateCoordinator,
+    )
+    from custom_components.airios_ventilation.entity import AiriosEntity
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class BenchmarkOptions:
+    """The benchmark command line options."""
+
+    profile: str
+    time_scale: float
+    failure_rate: float
+    iterations: int
+    json: Path | None
+    report: bool
+
+
+@pytest.fixture
+def benchmark_options(pytestconfig: pytest.Config) -> BenchmarkOptions:
+    """Return the benchmark options."""
+    return BenchmarkOptions(
+        profile=pytestconfig.getoption("airios_profile"),
+        time_scale=pytestconfig.getoption("airios_time_scale"),
+        failure_rate=pytestconfig.getoption("airios_failure_rate"),
+        iterations=pytestconfig.getoption("airios_iterations"),
+        json=pytestconfig.getoption("airios_json"),
+        report=pytestconfig.getoption("airios_report"),
+    )
+
+
+@pytest.fixture
+def replay_client(
+    capture: ReplayCapture, benchmark_options: BenchmarkOptions
+) -> ReplayModbusClient:
+    """Return a Modbus client replaying the capture with the benchmark profile."""
+    profile = dataclasses.replace(
+        PROFILES[benchmark_options.profile],
+        failure_rate=benchmark_options.failure_rate,
+    )
+    return ReplayModbusClient(capture, profile, time_scale=benchmark_options.time_scale)
+
+
+def _summary(samples: list[float]) -> dict[str, float]:
+    """Return the timing summary of the samples, in milliseconds."""
+    if not samples:
+        return {}
+    summary = {
+        "mean": statistics.fmean(samples) * 1000,
+        "median": statistics.median(samples) * 1000,
+        "max": max(samples) * 1000,
+    }
+    if len(samples) > 1:
+        summary["p95"] = statistics.quantiles(samples, n=20)[-1] * 1000
+    return summary
+
+
+def _platform_entities(hass: HomeAssistant) -> dict[str, list[AiriosEntity]]:
+    """Return the entities of the integration by platform."""
+    return {
+        platform.domain: list(platform.entities.values())  # type: ignore[misc]
+        for platform in async_get_platforms(hass, DOMAIN)
+    }
+
+
+def _fast_poll_frames(coordinator: AiriosDataUpdateCoordinator) -> int:
+    """Return the planned Modbus requests of a fast poll cycle."""
+    return sum(
+        coordinator.fast_poll_frames(modbus_address) or 0
+        for modbus_address in coordinator.data.nodes
+        if coordinator.poll_plan.properties(modbus_address, (PollTier.FAST,))
+    )
+
+
+def _results_table(results: dict[str, typing.Any]) -> list[tuple[str, str]]:
+    """Return the results as table rows."""
+    rows = [
+        ("nodes", f"{results['nodes']}"),
+        (
+            "setup",
+            f"{results['setup']['ms']:.1f} ms, {results['setup']['requests']} requests",
+        ),
+    ]
+    rows.extend(
+        (
+            name.replace("_", " "),
+            ", ".join(f"{k} {v:.2f} ms" for k, v in summary.items()),
+        )
+        for name in ("update_data", "dispatch")
+        if (summary := results[name])
+    )
+    rows.append(
+        (
+            "update data requests",
+            (
+                f"{results['update_data_requests']:.1f} per cycle, "
+                f"{results['update_data_failures']} failed cycles"
+            ),
+        )
+    )
+    rows.extend(
+        (
+            f"{domain} update",
+            (
+                f"{summary['entities']:.0f} entities, "
+                f"mean {summary['mean'] * 1000:.1f} us, "
+                f"max {summary['max'] * 1000:.1f} us"
+            ),
+        )
+        for domain, summary in results["entity_update"].items()
+    )
+    tick = results["entity_tick"]
+    rows.append(
+        (
+            "entity tick cpu",
+            (
+                f"{tick['entities']:.0f} entities, "
+                f"mean {tick['mean']:.3f} ms, max {tick['max']:.3f} ms"
+            ),
+        )
+    )
+    return rows
+
+
+async def _async_benchmark_cycles(
+    coordinator: AiriosDataUpdateCoordinator,
+    client: ReplayModbusClient,
+    options: BenchmarkOptions,
+) -> dict[str, typing.Any]:
+    """Measure the poll cycles and check their requests against the plan."""
+    update_samples: list[float] = []
+    dispatch_samples: list[float] = []
+    requests: list[int] = []
+    failed_cycles = 0
+    for _ in range(options.iterations):
+        before = client.stats.requests
+        start = time.perf_counter()
+        try:
+            data = await coordinator._async_update_data()
+        except UpdateFailed:
+            failed_cycles += 1
+            continue
+        update_samples.append(time.perf_counter() - start)
+        requests.append(client.stats.requests - before)
+        cycle = coordinator.poll_cycles[-1]
+        # The frames counted by the coordinator are the requests sent
+        assert requests[-1] == cycle.transactions
+        if options.failure_rate == 0 and cycle.poll_tiers == (PollTier.FAST,):
+            assert cycle.transactions == _fast_poll_frames(coordinator)
+        start = time.perf_counter()
+        coordinator.async_set_updated_data(data)
+        dispatch_samples.append(time.perf_counter() - start)
+
+    if options.failure_rate == 0:
+        assert failed_cycles == 0
+    return {
+        "update_data": _summary(update_samples),
+        "update_data_requests": statistics.fmean(requests) if requests else 0,
+        "update_data_failures": failed_cycles,
+        "dispatch": _summary(dispatch_samples),
+    }
+
+
+def _benchmark_entities(hass: HomeAssistant, iterations: int) -> dict[str, typing.Any]:
+    """Measure the update cost of the entities, state writes included."""
+    platform_entities = _platform_entities(hass)
+    entity_updates: dict[str, dict[str, float]] = {}
+    for domain, entities in platform_entities.items():
+        if not entities:
+            continue
+        samples: list[float] = []
+        for entity in entities:
+            start = time.perf_counter()
+            for _ in range(iterations):
+                entity._handle_coordinator_update()
+            samples.append((time.perf_counter() - start) / iterations)
+        entity_updates[domain] = {"entities": len(entities)} | _summary(samples)
+
+    all_entities = [
+        entity for entities in platform_entities.values() for entity in entities
+    ]
+    assert all_entities
+    tick_samples: list[float] = []
+    for _ in range(iterations):
+        start = time.process_time()
+        for entity in all_entities:
+            entity._handle_coordinator_update()
+        tick_samples.append(time.process_time() - start)
+    return {
+        "entity_update": entity_updates,
+        "entity_tick": {"entities": len(all_entities)} | _summary(tick_samples),
+    }
+
+
+async def test_benchmark(
+    hass: HomeAssistant,
+    benchmark_options: BenchmarkOptions,
+    config_entry: MockConfigEntry,
+    mock_modbus_client: ReplayModbusClient,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Benchmark the integration, check the requests of the poll cycles."""
+    options = benchmark_options
+    client = mock_modbus_client
+    entry = config_entry
+
+    start = time.perf_counter()
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    setup = time.perf_counter() - start
+    assert entry.state is ConfigEntryState.LOADED
+    results = {
+        "profile": dataclasses.asdict(client.profile),
+        "time_scale": options.time_scale,
+        "nodes": len(entry.runtime_data.data.nodes),
+        "setup": {"ms": setup * 1000, "requests": client.stats.requests},
+    }
+    results |= await _async_benchmark_cycles(entry.runtime_data, client, options)
+    results |= _benchmark_entities(hass, options.iterations)
+    results["transport"] = dataclasses.asdict(client.stats)
+    await hass.config_entries.async_unload(entry.entry_id)
+
+    if options.report:
+        rows = _results_table(results)
+        width = max(len(name) for name, _ in rows)
+        with capsys.disabled():
+            print()  # noqa: T201
+            for name, value in rows:
+                print(f"{name:<{width}}  {value}")  # noqa: T201
+    if options.json is not None:
+        options.json.write_text(json.dumps(results, indent=2) + "\n")
@@ -0,0 +1,50 @@
+"""Tests for the Airios config flows."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from pyairios.constants import BindingStatus
+from pyairios.registers import Result
+
+from custom_components.airios_ventilation.config_flow import _async_bind
+from custom_components.airios_ventilation.scheduler import AiriosBusScheduler
+
+
+def _coordinator(status: BindingStatus) -> Mock:
+    """Return a coordinator whose bridge reports a bind status."""
+    coordinator = Mock(scheduler=AiriosBusScheduler())
+    coordinator.api.bind_status = AsyncMock(return_value=Result(status))
+    coordinator.api.unbind = AsyncMock(return_value=True)
+    return coordinator
+
+
+async def test_bind_completed() -> None:
+    """Test a completed bind keeps the device."""
+    coordinator = _coordinator(BindingStatus.OUTGOING_BINDING_COMPLETED)
+    status = await _async_bind(
+        coordinator,
+        5,
+        AsyncMock(return_value=True),
+        BindingStatus.OUTGOING_BINDING_INITIALIZED,
+        BindingStatus.OUTGOING_BINDING_COMPLETED,
+    )
+    assert status is BindingStatus.OUTGOING_BINDING_COMPLETED
+    coordinator.api.unbind.assert_not_awaited()
+
+
+async def test_bind_timeout_unbinds() -> None:
+    """Test the pending device is unbound when the bind times out."""
+    coordinator = _coordinator(BindingStatus.OUTGOING_BINDING_INITIALIZED)
+    with pytest.raises(TimeoutError):
+        async with asyncio.timeout(0.5):
+            await _async_bind(
+                coordinator,
+                5,
+                AsyncMock(return_value=True),
+                BindingStatus.OUTGOING_BINDING_INITIALIZED,
+                BindingStatus.OUTGOING_BINDING_COMPLETED,
+            )
+    coordinator.api.unbind.assert_awaited_once_with(5)
@@ -0,0 +1,312 @@
+"""Tests for the Airios data update coordinator."""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import time
+import typing
+from datetime import timedelta
+from unittest.mock import Mock, patch
+
+import pytest
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import STATE_UNAVAILABLE
+from pyairios.data_model import AiriosData
+from pyairios.exceptions import AiriosException
+from pyairios.properties import AiriosVMDProperty
+from pyairios.registers import Result
+
+from custom_components.airios_ventilation import DATA_POLL_BUDGET
+from custom_components.airios_ventilation.const import PollTier
+
+from .conftest import BRIDGE_MODBUS_ADDRESS, VMD_MODBUS_ADDRESS, VMN_MODBUS_ADDRESS
+
+if typing.TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+    from .replay import ReplayModbusClient
+
+VMD_SENSOR = "sensor.vmd_02rps78_indoor_temperature"
+VMN_SENSOR = "binary_sensor.vmn_05lm02_battery_status"
+BRIDGE_SENSOR = "sensor.brdg_02r13_rf_load"
+
+
+async def _async_setup(
+    hass: HomeAssistant, entry: MockConfigEntry, client: ReplayModbusClient
+) -> None:
+    """Set up the config entry, pyairios talking to the replay client."""
+    with patch(
+        "pyairios.client.modbusClient.AsyncModbusSerialClient", return_value=client
+    ):
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+
+async def test_first_read(
+    hass: HomeAssistant,
+    setup_integration: MockConfigEntry,
+    replay_client: ReplayModbusClient,
+) -> None:
+    """Test the first read of the bridge and its nodes."""
+    assert setup_integration.state is ConfigEntryState.LOADED
+    coordinator = setup_integration.runtime_data
+    assert set(coordinator.data.nodes) == {
+        BRIDGE_MODBUS_ADDRESS,
+        VMD_MODBUS_ADDRESS,
+        VMN_MODBUS_ADDRESS,
+    }
+    cycle = coordinator.poll_cycles[-1]
+    # The frames counted by the coordinator are the requests sent
+    assert cycle.transactions == replay_client.stats.requests
+    assert set(cycle.node_durations) == set(coordinator.data.nodes)
+    assert hass.states.get(VMN_SENSOR) is not None
+
+
+async def test_bridge_failure_on_first_read(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    replay_client: ReplayModbusClient,
+) -> None:
+    """Test the setup is retried when the bridge does not answer."""
+    replay_client.failing_devices.add(BRIDGE_MODBUS_ADDRESS)
+    await _async_setup(hass, config_entry, replay_client)
+    assert config_entry.state is ConfigEntryState.SETUP_RETRY
+
+
+async def test_node_failure_on_first_read(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    replay_client: ReplayModbusClient,
+) -> None:
+    """Test a node missing from the first read is added once it answers."""
+    replay_client.failing_devices.add(VMN_MODBUS_ADDRESS)
+    await _async_setup(hass, config_entry, replay_client)
+    assert config_entry.state is ConfigEntryState.LOADED
+    coordinator = config_entry.runtime_data
+    assert VMN_MODBUS_ADDRESS not in coordinator.data.nodes
+    assert coordinator.poll_cycles[-1].failed_nodes == [VMN_MODBUS_ADDRESS]
+    assert hass.states.get(VMD_SENSOR).state != STATE_UNAVAILABLE
+    assert hass.states.get(VMN_SENSOR) is None
+
+    # The node answers after its backoff, the entry is reloaded to add it
+    replay_client.failing_devices.clear()
+    coordinator.node_slots[VMN_MODBUS_ADDRESS].retry_at = 0
+    with patch(
+        "pyairios.client.modbusClient.AsyncModbusSerialClient",
+        return_value=replay_client,
+    ):
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+        assert config_entry.state is ConfigEntryState.LOADED
+        assert VMN_MODBUS_ADDRESS in config_entry.runtime_data.data.nodes
+        assert hass.states.get(VMN_SENSOR) is not None
+        await hass.config_entries.async_unload(config_entry.entry_id)
+
+
+async def test_node_failure(
+    hass: HomeAssistant,
+    setup_integration: MockConfigEntry,
+    replay_client: ReplayModbusClient,
+) -> None:
+    """Test a failing node only makes its own entities unavailable."""
+    coordinator = setup_integration.runtime_data
+    replay_client.failing_devices.add(VMD_MODBUS_ADDRESS)
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert coordinator.last_update_success
+    assert not coordinator.node_available(VMD_MODBUS_ADDRESS)
+    assert hass.states.get(VMD_SENSOR).state == STATE_UNAVAILABLE
+    assert hass.states.get(BRIDGE_SENSOR).state != STATE_UNAVAILABLE
+
+    replay_client.failing_devices.clear()
+    coordinator.node_slots[VMD_MODBUS_ADDRESS].retry_at = 0
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert coordinator.node_available(VMD_MODBUS_ADDRESS)
+    assert hass.states.get(VMD_SENSOR).state != STATE_UNAVAILABLE
+
+
+async def test_write_coalescing(
+    hass: HomeAssistant,
+    setup_integration: MockConfigEntry,
+    replay_client: ReplayModbusClient,
+) -> None:
+    """Test writes to a property within the debounce window are coalesced."""
+    coordinator = setup_integration.runtime_data
+    ap = AiriosVMDProperty.FAN_SPEED_LOW_SUPPLY
+    results = await asyncio.gather(
+        *(coordinator.async_write(VMD_MODBUS_ADDRESS, ap, value) for value in (30, 35))
+    )
+    await hass.async_block_till_done()
+    # Only the last value is written, all the callers get its result
+    assert results == [True, True]
+    assert replay_client.stats.writes == 1
+    assert coordinator.data.nodes[VMD_MODBUS_ADDRESS][ap].value == 35
+
+
+async def test_requested_refresh_skips_the_poll_turn(
+    hass: HomeAssistant, setup_integration: MockConfigEntry
+) -> None:
+    """Test a refresh requested after a user action does not wait its turn."""
+    coordinator = setup_integration.runtime_data
+    budget = coordinator.poll_budget
+    budget.async_register(Mock(update_interval=timedelta(hours=1)))
+    budget._next_start = time.monotonic() + 3600
+    cycles = len(coordinator.poll_cycles)
+    async with asyncio.timeout(5):
+        await coordinator.async_request_refresh()
+    await hass.async_block_till_done()
+    assert len(coordinator.poll_cycles) == cycles + 1
+
+
+async def test_status_age_between_status_reads(
+    setup_integration: MockConfigEntry,
+) -> None:
+    """Test the result status of a value read without it is aged."""
+    coordinator = setup_integration.runtime_data
+    ap = AiriosVMDProperty.FAN_SPEED_EXHAUST
+    coordinator.poll_plan.async_add_status(VMD_MODBUS_ADDRESS)
+    coordinator._slow_poll_requested = True
+    await coordinator.async_refresh()
+    status = coordinator.data.nodes[VMD_MODBUS_ADDRESS][ap].status
+    assert status is not None
+
+    # The next fast poll reads the value without its status, a minute later
+    key = (VMD_MODBUS_ADDRESS, ap)
+    status_read = coordinator._status_reads[key]
+    coordinator._status_reads[key] = dataclasses.replace(
+        status_read, read_at=status_read.read_at - 60
+    )
+    await coordinator.async_refresh()
+    result = coordinator.data.nodes[VMD_MODBUS_ADDRESS][ap]
+    assert result.status is not None
+    assert result.status.age == status.age + timedelta(seconds=60)
+    assert result.status.source == status.source
+
+
+async def test_listeners_of_changed_properties(
+    setup_integration: MockConfigEntry,
+) -> None:
+    """Test only the listeners of the changed properties are called."""
+    coordinator = setup_integration.runtime_data
+    exhaust = (VMD_MODBUS_ADDRESS, AiriosVMDProperty.FAN_SPEED_EXHAUST)
+    supply = (VMD_MODBUS_ADDRESS, AiriosVMDProperty.FAN_SPEED_SUPPLY)
+    called: list[object] = []
+    for context in (exhaust, supply, None):
+        coordinator.async_add_listener(
+            lambda context=context: called.append(context), context
+        )
+
+    # The same data, only the listeners without a property are called
+    coordinator.async_set_updated_data(coordinator.data)
+    assert called == [None]
+
+    called.clear()
+    data = coordinator.data
+    node = dict(data.nodes[VMD_MODBUS_ADDRESS])
+    node[exhaust[1]] = Result(node[exhaust[1]].value + 1, node[exhaust[1]].status)
+    coordinator.async_set_updated_data(
+        AiriosData(
+            bridge_key=data.bridge_key,
+            nodes={**data.nodes, VMD_MODBUS_ADDRESS: node},
+        )
+    )
+    assert len(called) == 2
+    assert set(called) == {None, exhaust}
+
+    # All the listeners of a node are called when its availability changed
+    called.clear()
+    coordinator.node_slots[VMD_MODBUS_ADDRESS].failures = 1
+    coordinator.async_set_updated_data(coordinator.data)
+    assert len(called) == 3
+    assert set(called) == {None, exhaust, supply}
+
+
+async def test_write_group_rollback(
+    setup_integration: MockConfigEntry,
+    replay_client: ReplayModbusClient,
+) -> None:
+    """Test a failed group write restores the values read before it."""
+    coordinator = setup_integration.runtime_data
+    regmap = coordinator._devices[VMD_MODBUS_ADDRESS].regmap
+    supply = AiriosVMDProperty.FAN_SPEED_LOW_SUPPLY
+    exhaust = AiriosVMDProperty.FAN_SPEED_LOW_EXHAUST
+    registers = replay_client.devices[VMD_MODBUS_ADDRESS]
+    supply_address = regmap[supply].description.address
+    before = registers[supply_address]
+    replay_client.failing_writes.add(
+        (VMD_MODBUS_ADDRESS, regmap[exhaust].description.address)
+    )
+    with pytest.raises(AiriosException):
+        await coordinator.async_write_group(
+            VMD_MODBUS_ADDRESS, {supply: before + 5, exhaust: 30}
+        )
+    # The supply speed was written, then restored
+    assert replay_client.stats.writes == 2
+    assert registers[supply_address] == before
+
+
+async def test_write_group_failed_rollback(
+    setup_integration: MockConfigEntry,
+    replay_client: ReplayModbusClient,
+) -> None:
+    """Test a failed restore of a group write is raised."""
+    coordinator = setup_integration.runtime_data
+    regmap = coordinator._devices[VMD_MODBUS_ADDRESS].regmap
+    supply = AiriosVMDProperty.FAN_SPEED_LOW_SUPPLY
+    exhaust = AiriosVMDProperty.FAN_SPEED_LOW_EXHAUST
+    registers = replay_client.devices[VMD_MODBUS_ADDRESS]
+    # The current speeds cannot be read, there is nothing to restore
+    del registers[regmap[supply].description.address]
+    replay_client.failing_writes.add(
+        (VMD_MODBUS_ADDRESS, regmap[exhaust].description.address)
+    )
+    with pytest.raises(AiriosException, match="Failed to restore"):
+        await coordinator.async_write_group(
+            VMD_MODBUS_ADDRESS, {supply: 30, exhaust: 30}
+        )
+
+
+async def test_age_aware_polling_skips_reads(
+    setup_integration: MockConfigEntry,
+    replay_client: ReplayModbusClient,
+) -> None:
+    """Test the age aware polling sends fewer frames between RF updates."""
+    coordinator = setup_integration.runtime_data
+    await coordinator.async_refresh()
+    plain = coordinator.poll_cycles[-1]
+    assert plain.poll_tiers == (PollTier.FAST,)
+
+    coordinator.async_apply_options(
+        dataclasses.replace(coordinator.options, age_aware_polling=True)
+    )
+    # The slow poll reads the result status, learning when each value came in
+    coordinator._slow_poll_requested = True
+    await coordinator.async_refresh()
+    assert coordinator.rf_epochs
+    # The capture has the same age on every read, say the bridge receives a
+    # value every 5 minutes
+    for rf_epoch in coordinator.rf_epochs.values():
+        rf_epoch.period = 300
+
+    requests = replay_client.stats.requests
+    await coordinator.async_refresh()
+    cycle = coordinator.poll_cycles[-1]
+    assert cycle.poll_tiers == (PollTier.FAST,)
+    assert cycle.skipped_reads > 0
+    assert cycle.transactions == replay_client.stats.requests - requests
+    assert cycle.transactions < plain.transactions
+
+
+async def test_poll_budget_dropped_on_unload(
+    hass: HomeAssistant, setup_integration: MockConfigEntry
+) -> None:
+    """Test the poll budget is dropped when the last bridge is unloaded."""
+    coordinator = setup_integration.runtime_data
+    assert hass.data[DATA_POLL_BUDGET] is coordinator.poll_budget
+    assert coordinator.poll_budget.bridges == 1
+
+    await hass.config_entries.async_unload(setup_integration.entry_id)
+    assert DATA_POLL_BUDGET not in hass.data
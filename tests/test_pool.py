@@ -0,0 +1,92 @@
+"""Tests for the transport pool."""
+
+from __future__ import annotations
+
+import typing
+from unittest.mock import Mock, patch
+
+import pytest
+from pyairios.client import AsyncAiriosModbusClient
+
+from custom_components.airios_ventilation.pool import AiriosTransportPool
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@pytest.fixture
+def closed() -> Iterator[list[AsyncAiriosModbusClient]]:
+    """Record the Modbus clients closed by the pool."""
+    closed: list[AsyncAiriosModbusClient] = []
+    with patch.object(
+        AsyncAiriosModbusClient, "close", autospec=True, side_effect=closed.append
+    ):
+        yield closed
+
+
+async def test_shared_until_last_release(
+    closed: list[AsyncAiriosModbusClient],
+) -> None:
+    """The holders of a gateway share its transport, closed by the last one."""
+    pool = AiriosTransportPool()
+    entry = pool.async_acquire_network("192.0.2.1", 502)
+    api = entry.api(1)
+    flow = pool.async_acquire_network("192.0.2.1", 502)
+
+    assert flow is entry
+    assert flow.api(1) is api
+    assert entry.holders == 2
+    assert pool.async_acquire_network("192.0.2.2", 502) is not entry
+
+    pool.async_release(flow)
+    assert closed == []
+    pool.async_release(entry)
+    assert closed == [entry.client]
+    assert pool.async_acquire_network("192.0.2.1", 502) is not entry
+
+
+async def test_bridges_share_client() -> None:
+    """The bridges behind one gateway talk through a single connection."""
+    pool = AiriosTransportPool()
+    with patch(
+        "pyairios.client.modbusClient.AsyncModbusTcpClient", return_value=Mock()
+    ) as connections:
+        pooled = pool.async_acquire_network("192.0.2.1", 502)
+        first = pooled.api(207)
+        second = pooled.api(208)
+
+    assert connections.call_count == 1
+    assert first.bridge.client is pooled.client
+    assert second.bridge.client is pooled.client
+    assert (first.bridge.device_id, second.bridge.device_id) == (207, 208)
+
+
+async def test_borrow_releases(closed: list[AsyncAiriosModbusClient]) -> None:
+    """A borrowed transport is released when leaving the context."""
+    pool = AiriosTransportPool()
+    pooled = pool.async_acquire_serial("/dev/ttyUSB0")
+    with pytest.raises(RuntimeError), pool.borrow(pooled):
+        raise RuntimeError
+
+    assert pooled.holders == 0
+    assert closed == [pooled.client]
+
+
+async def test_reacquire(closed: list[AsyncAiriosModbusClient]) -> None:
+    """A transport is only reopened when no one else holds it."""
+    pool = AiriosTransportPool()
+    entry = pool.async_acquire_network("192.0.2.1", 502)
+    api = entry.api(1)
+    flow = pool.async_acquire_network("192.0.2.1", 502)
+
+    assert pool.async_reacquire(entry) is entry
+    assert entry.holders == 2
+    assert closed == []
+
+    pool.async_release(flow)
+    reopened = pool.async_reacquire(entry)
+    assert reopened is not entry
+    assert reopened.client is not entry.client
+    assert reopened.holders == 1
+    assert reopened.api(1) is not api
+    assert closed == [entry.client]
@@ -0,0 +1,146 @@
+"""Tests for the bus scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import timedelta
+from unittest.mock import Mock
+
+import pytest
+
+from custom_components.airios_ventilation.scheduler import (
+    AiriosBusScheduler,
+    AiriosPollBudget,
+    BusPriority,
+)
+
+
+async def _hold(
+    scheduler: AiriosBusScheduler,
+    priority: BusPriority,
+    name: str,
+    served: list[str],
+    release: asyncio.Event,
+) -> None:
+    async with scheduler.slot(priority):
+        served.append(name)
+        await release.wait()
+
+
+async def test_priority_order() -> None:
+    """Waiters are served by priority, then in arrival order."""
+    scheduler = AiriosBusScheduler()
+    served: list[str] = []
+    release = asyncio.Event()
+    release.set()
+
+    async with scheduler.slot(BusPriority.POLL):
+        tasks = [
+            asyncio.create_task(_hold(scheduler, priority, name, served, release))
+            for priority, name in (
+                (BusPriority.POLL, "poll 1"),
+                (BusPriority.SERVICE, "service"),
+                (BusPriority.POLL, "poll 2"),
+                (BusPriority.WRITE, "write"),
+                (BusPriority.BIND, "bind"),
+            )
+        ]
+        await asyncio.sleep(0)
+        assert scheduler.queue_depth == 5
+        assert served == []
+
+    await asyncio.gather(*tasks)
+    assert served == ["write", "service", "bind", "poll 1", "poll 2"]
+    assert scheduler.queue_depth == 0
+    assert scheduler.max_queue_depth == 5
+    assert scheduler.stats[BusPriority.POLL].requests == 3
+
+
+async def test_one_holder_at_a_time() -> None:
+    """A waiter only gets the slot when the holder leaves it."""
+    scheduler = AiriosBusScheduler()
+    served: list[str] = []
+    release = asyncio.Event()
+
+    holder = asyncio.create_task(
+        _hold(scheduler, BusPriority.POLL, "poll", served, release)
+    )
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(
+        _hold(scheduler, BusPriority.WRITE, "write", served, release)
+    )
+    await asyncio.sleep(0)
+    assert served == ["poll"]
+
+    release.set()
+    await asyncio.gather(holder, waiter)
+    assert served == ["poll", "write"]
+
+
+async def test_cancelled_waiter_leaves_the_queue() -> None:
+    """A cancelled waiter is removed and the next one is served."""
+    scheduler = AiriosBusScheduler()
+    served: list[str] = []
+    release = asyncio.Event()
+    release.set()
+
+    async with scheduler.slot(BusPriority.POLL):
+        cancelled = asyncio.create_task(
+            _hold(scheduler, BusPriority.WRITE, "cancelled", served, release)
+        )
+        waiter = asyncio.create_task(
+            _hold(scheduler, BusPriority.POLL, "poll", served, release)
+        )
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        assert scheduler.queue_depth == 1
+
+    await waiter
+    assert served == ["poll"]
+
+    # The bus is free again
+    async with asyncio.timeout(1), scheduler.slot(BusPriority.POLL):
+        pass
+
+
+async def test_cancelled_after_handover_passes_the_slot_on() -> None:
+    """A waiter cancelled after being handed the slot releases it."""
+    scheduler = AiriosBusScheduler()
+    served: list[str] = []
+    release = asyncio.Event()
+    release.set()
+
+    async with scheduler.slot(BusPriority.POLL):
+        cancelled = asyncio.create_task(
+            _hold(scheduler, BusPriority.WRITE, "cancelled", served, release)
+        )
+        waiter = asyncio.create_task(
+            _hold(scheduler, BusPriority.POLL, "poll", served, release)
+        )
+        await asyncio.sleep(0)
+    # The slot is handed over to the write, which is cancelled before it runs
+    cancelled.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+
+    async with asyncio.timeout(1):
+        await waiter
+    assert served == ["poll"]
+
+
+async def test_poll_budget_spacing() -> None:
+    """Poll cycles are spaced by the shortest update interval of the bridges."""
+    budget = AiriosPollBudget()
+    unregister = budget.async_register(Mock(update_interval=timedelta(seconds=10)))
+    budget.async_register(Mock(update_interval=timedelta(seconds=4)))
+    await budget.async_wait_turn()
+    assert budget._next_start - time.monotonic() == pytest.approx(2, abs=0.1)
+
+    # A single bridge polls on its own timer
+    unregister()
+    start = time.monotonic()
+    await budget.async_wait_turn()
+    assert time.monotonic() - start < 1
@@ -0,0 +1,154 @@
+"""Tests for the snapshot store."""
+
+from __future__ import annotations
+
+import json
+import typing
+
+from homeassistant.config_entries import ConfigEntryState
+from pyairios.data_model import AiriosData
+from pyairios.properties import AiriosVMDProperty
+from pyairios.registers import Result
+
+from custom_components.airios_ventilation.const import DOMAIN
+from custom_components.airios_ventilation.store import (
+    STORAGE_VERSION,
+    AiriosSnapshotStore,
+    decode_snapshot,
+    encode_snapshot,
+)
+
+from .conftest import VMD_MODBUS_ADDRESS
+
+if typing.TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+    from .replay import ReplayModbusClient
+
+
+async def test_snapshot_round_trip(setup_integration: MockConfigEntry) -> None:
+    """Test a snapshot is restored with the values and status read."""
+    data = setup_integration.runtime_data.data
+    # Saved as JSON, without pyairios objects
+    encoded = json.loads(json.dumps(encode_snapshot(data)))
+    assert decode_snapshot(encoded) == data
+
+
+async def test_pickled_snapshot_dropped(
+    hass: HomeAssistant, hass_storage: dict[str, typing.Any]
+) -> None:
+    """Test a snapshot of the first storage version is not restored."""
+    hass_storage[f"{DOMAIN}.entry"] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": f"{DOMAIN}.entry",
+        "data": {"pyairios": "1.1.0", "snapshot": "gASVAAAAAAAAAAA="},
+    }
+    assert await AiriosSnapshotStore(hass, "entry").async_load() is None
+
+
+async def test_invalid_snapshot_dropped(
+    hass: HomeAssistant,
+    hass_storage: dict[str, typing.Any],
+    setup_integration: MockConfigEntry,
+) -> None:
+    """Test a snapshot of unknown properties is not restored."""
+    encoded = encode_snapshot(setup_integration.runtime_data.data)
+    node = encoded["nodes"][str(VMD_MODBUS_ADDRESS)]
+    node["pyairios.properties.AiriosVMDProperty.UNKNOWN"] = {
+        "value": 1,
+        "status": None,
+    }
+    hass_storage[f"{DOMAIN}.entry"] = {
+        "version": STORAGE_VERSION,
+        "minor_version": 1,
+        "key": f"{DOMAIN}.entry",
+        "data": encoded,
+    }
+    assert await AiriosSnapshotStore(hass, "entry").async_load() is None
+
+
+async def test_incomplete_snapshot_dropped(
+    hass: HomeAssistant,
+    hass_storage: dict[str, typing.Any],
+    setup_integration: MockConfigEntry,
+) -> None:
+    """Test a snapshot missing a value it could not encode is not restored."""
+    data = setup_integration.runtime_data.data
+    node = dict(data.nodes[VMD_MODBUS_ADDRESS])
+    node[AiriosVMDProperty.FAN_SPEED_EXHAUST] = Result(object(), None)
+    encoded = encode_snapshot(
+        AiriosData(
+            bridge_key=data.bridge_key,
+            nodes={**data.nodes, VMD_MODBUS_ADDRESS: node},
+        )
+    )
+    assert list(encoded["unsaved"]) == [
+        "pyairios.properties.AiriosVMDProperty.FAN_SPEED_EXHAUST"
+    ]
+    hass_storage[f"{DOMAIN}.entry"] = {
+        "version": STORAGE_VERSION,
+        "minor_version": 1,
+        "key": f"{DOMAIN}.entry",
+        "data": json.loads(json.dumps(encoded)),
+    }
+    assert await AiriosSnapshotStore(hass, "entry").async_load() is None
+
+
+async def test_setup_from_snapshot(
+    hass: HomeAssistant,
+    hass_storage: dict[str, typing.Any],
+    config_entry: MockConfigEntry,
+    replay_client: ReplayModbusClient,
+    setup_integration: MockConfigEntry,
+) -> None:
+    """Test the entry is set up from the saved snapshot, then reconciled."""
+    data = setup_integration.runtime_data.data
+    await hass.config_entries.async_unload(config_entry.entry_id)
+    hass_storage[f"{DOMAIN}.{config_entry.entry_id}"] = {
+        "version": STORAGE_VERSION,
+        "minor_version": 1,
+        "key": f"{DOMAIN}.{config_entry.entry_id}",
+        "data": json.loads(json.dumps(encode_snapshot(data))),
+    }
+    requests = replay_client.stats.requests
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    assert config_entry.state is ConfigEntryState.LOADED
+    coordinator = config_entry.runtime_data
+    assert coordinator.stale
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert not coordinator.stale
+    assert coordinator.data == data
+    # The snapshot is reconciled with a full read in the background
+    assert replay_client.stats.requests > requests
+
+
+async def test_setup_from_snapshot_of_replaced_bridge(
+    hass: HomeAssistant,
+    hass_storage: dict[str, typing.Any],
+    config_entry: MockConfigEntry,
+    setup_integration: MockConfigEntry,
+) -> None:
+    """Test the entry is reloaded when the reconcile finds another bridge."""
+    data = setup_integration.runtime_data.data
+    await hass.config_entries.async_unload(config_entry.entry_id)
+    # The snapshot and the entry are of a bridge replaced since
+    encoded = json.loads(json.dumps(encode_snapshot(data)))
+    bridge = encoded["nodes"][str(data.bridge_key)]
+    bridge["pyairios.properties.AiriosDeviceProperty.RF_ADDRESS"]["value"] = 0x123456
+    hass.config_entries.async_update_entry(config_entry, unique_id=str(0x123456))
+    key = f"{DOMAIN}.{config_entry.entry_id}"
+    hass_storage[key] = {
+        "version": STORAGE_VERSION,
+        "minor_version": 1,
+        "key": key,
+        "data": encoded,
+    }
+
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    assert config_entry.state is ConfigEntryState.LOADED
+    await hass.async_block_till_done(wait_background_tasks=True)
+    # Set up again from a read of the bus, which finds the other bridge
+    assert key not in hass_storage
+    assert config_entry.state is ConfigEntryState.SETUP_RETRY